@@ -4,149 +4,189 @@ Amazon Kindle検索デバッグスクリプト - 詳細ログ出力版
 Amazon Kindle Search Debug Script - Detailed Logging Version
 """
 import asyncio
+import os
 import sys
 from pathlib import Path
 from playwright.async_api import async_playwright
 
-async def debug_amazon_search():
-    """Amazon検索プロセスの詳細デバッグ"""
+# スクリーンショット保存（画像・CSSのブロックを無効化）
+DEBUG_SCREENSHOT = bool(os.environ.get('DEBUG_SCREENSHOT'))
+
+# 検索に不要なリソース種別・広告/解析ドメイン
+BLOCKED_RESOURCE_TYPES = frozenset({'font', 'media'} if DEBUG_SCREENSHOT
+                                   else {'image', 'font', 'media', 'stylesheet'})
+BLOCKED_URL_PARTS = (
+    'doubleclick', 'googletagmanager', 'google-analytics',
+    'amazon-adsystem', 'fls-fe',
+)
+
+# 既定の検索クエリと同時実行ページ数
+DEFAULT_QUERIES = ("Python プログラミング",)
+MAX_CONCURRENCY = 5
+
+# Cookie・キャッシュを実行間で引き継ぐための永続プロファイル
+PROFILE_DIR = Path('~/.cache/izumi/pw-profile-amazon').expanduser()
+
+SEARCH_SELECTORS = [
+    "#twotabsearchtextbox",
+    'input[placeholder*="検索"]',
+    'input[name="field-keywords"]'
+]
+# 検索ボックス・検索結果のセレクタ（呼び出しごとに組み立てない）
+SEARCH_SELECTOR = ", ".join(SEARCH_SELECTORS)
+RESULT_SELECTOR = '[data-component-type="s-search-result"]'
+RESULT_WAIT_SELECTOR = f'{RESULT_SELECTOR}, .s-result-item'
+RESULT_TITLE_SELECTOR = 'h2 a span'
+
+
+async def _block_unneeded_resources(route):
+    """画像・フォント・広告等のリクエストを中断"""
+    request = route.request
+    if (request.resource_type in BLOCKED_RESOURCE_TYPES
+            or any(part in request.url for part in BLOCKED_URL_PARTS)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _run_one(context, query: str, index: int) -> bool:
+    """1クエリ分のAmazon検索デバッグ（コンテキストは呼び出し側で管理）"""
+    page = await context.new_page()
+    page.set_default_timeout(60000)  # 60秒タイムアウト
+    try:
+        return await _debug_page(page, query, index)
+    finally:
+        await page.close()
+
+
+async def _debug_page(page, query: str, index: int) -> bool:
+    """ページ上で検索を実行し各ステップをログ出力"""
+    def log(message: str):
+        print(f"[{index}] {message}")
+    
+    # Amazon.co.jpアクセス
+    log("🌐 Amazon.co.jpアクセス中...")
+    await page.goto("https://www.amazon.co.jp", wait_until='domcontentloaded')
+    log(f"✅ ページタイトル: {await page.title()}")
+    log(f"✅ 現在URL: {page.url}")
+    
+    # 検索ボックス要素の確認
+    log("🔍 検索ボックス要素確認...")
+    # セレクタリストを1つのロケーターに統合（逐次タイムアウト待ちを回避）
+    search_locator = page.locator(SEARCH_SELECTOR).first
+    try:
+        await search_locator.wait_for(state="attached", timeout=10000)
+    except Exception as e:
+        log(f"❌ 検索ボックスが見つかりません: {e}")
+        return False
+    
+    matched = await search_locator.evaluate(
+        "(el, selectors) => selectors.find(s => el.matches(s))",
+        SEARCH_SELECTORS
+    )
+    log(f"✅ 検索ボックス発見: {matched}")
+    search_element = search_locator
+    
+    # 検索クエリ入力
+    log(f"⌨️ 検索クエリ入力: '{query}'")
+    await search_element.fill(query)
+    
+    # 検索実行前のスクリーンショット
+    if DEBUG_SCREENSHOT:
+        try:
+            await page.screenshot(path=f"debug_before_search_{index}.png")
+            log("📸 検索前スクリーンショット保存")
+        except:
+            pass
+    
+    # 検索実行
+    log("🚀 検索実行（Enterキー送信）...")
+    await search_element.press('Enter')
+    
+    # ページ遷移待機（networkidleではなく検索結果要素を直接待機）
+    log("⏳ 検索結果待機中...")
+    try:
+        await page.wait_for_selector(
+            RESULT_WAIT_SELECTOR,
+            timeout=15000
+        )
+        log("✅ 検索結果要素検出")
+    except Exception as e:
+        log(f"⚠️ 検索結果待機タイムアウト: {e}")
+    
+    # 結果確認
+    log(f"📊 検索後URL: {page.url}")
+    log(f"📊 検索後タイトル: {await page.title()}")
+    
+    # 検索結果要素の確認（件数・先頭タイトルともにロケーターで直接取得）
+    result_locator = page.locator(RESULT_SELECTOR)
+    result_count = await result_locator.count()
+    if result_count:
+        log(f"✅ 検索結果発見: {result_count}件")
+        
+        # 最初の結果の詳細
+        title_locator = result_locator.locator(RESULT_TITLE_SELECTOR).first
+        try:
+            title = await title_locator.text_content(timeout=5000)
+            log(f"📚 最初の結果: {title[:50]}...")
+        except Exception as e:
+            log(f"⚠️ 最初の結果タイトル取得失敗: {e}")
+    else:
+        log("❌ 検索結果が見つかりません")
+    
+    # 検索実行後のスクリーンショット
+    if DEBUG_SCREENSHOT:
+        try:
+            await page.screenshot(path=f"debug_after_search_{index}.png")
+            log("📸 検索後スクリーンショット保存")
+        except:
+            pass
+    
+    return True
+
+
+async def debug_amazon_search(queries=DEFAULT_QUERIES, concurrency: int = MAX_CONCURRENCY):
+    """
+    Amazon検索プロセスの詳細デバッグ
+    
+    永続プロファイルでブラウザを1回だけ起動し、クエリごとのページを
+    セマフォで同時実行数を制限しつつ並列実行する
+    """
     print("🔍 Amazon Kindle検索デバッグ開始")
     print("=" * 50)
     
     try:
         async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True, 
-                args=['--no-sandbox', '--disable-dev-shm-usage']
-            )
-            
-            context = await browser.new_context(
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            context = await p.chromium.launch_persistent_context(
+                str(PROFILE_DIR),
+                headless=True,
+                args=['--no-sandbox', '--disable-dev-shm-usage'],
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
             )
-            
-            page = await context.new_page()
-            page.set_default_timeout(60000)  # 60秒タイムアウト
-            
+            await context.route("**/*", _block_unneeded_resources)
             print("✅ ブラウザ起動完了")
             
-            # Amazon.co.jpアクセス
-            print("🌐 Amazon.co.jpアクセス中...")
-            await page.goto("https://www.amazon.co.jp", wait_until='domcontentloaded')
-            print(f"✅ ページタイトル: {await page.title()}")
-            print(f"✅ 現在URL: {page.url}")
-            
-            # 検索ボックス要素の確認
-            print("\n🔍 検索ボックス要素確認...")
-            search_selectors = [
-                "#twotabsearchtextbox",
-                'input[placeholder*="検索"]',
-                'input[name="field-keywords"]'
-            ]
-            
-            search_element = None
-            for selector in search_selectors:
-                try:
-                    element = await page.wait_for_selector(selector, timeout=10000)
-                    if element:
-                        search_element = element
-                        print(f"✅ 検索ボックス発見: {selector}")
-                        break
-                except Exception as e:
-                    print(f"❌ セレクタ失敗: {selector} - {e}")
-                    continue
-            
-            if not search_element:
-                print("❌ 検索ボックスが見つかりません")
-                return False
-            
-            # 検索クエリ入力
-            query = "Python プログラミング"
-            print(f"\n⌨️ 検索クエリ入力: '{query}'")
-            await search_element.fill("")
-            await search_element.type(query, delay=100)
-            
-            # 検索ボタンの確認
-            print("\n🔍 検索ボタン要素確認...")
-            button_selectors = [
-                "#nav-search-submit-button",
-                'input[type="submit"][value="検索"]',
-                ".nav-search-submit"
-            ]
-            
-            search_button = None
-            for selector in button_selectors:
-                try:
-                    element = await page.wait_for_selector(selector, timeout=10000)
-                    if element:
-                        search_button = element
-                        print(f"✅ 検索ボタン発見: {selector}")
-                        break
-                except Exception as e:
-                    print(f"❌ ボタンセレクタ失敗: {selector} - {e}")
-                    continue
-            
-            if not search_button:
-                print("❌ 検索ボタンが見つかりません")
-                return False
-            
-            # 検索実行前のスクリーンショット
-            try:
-                await page.screenshot(path="debug_before_search.png")
-                print("📸 検索前スクリーンショット保存")
-            except:
-                pass
-            
-            # 検索実行
-            print("\n🚀 検索実行...")
-            await search_button.click()
-            
-            # ページ遷移待機（詳細ログ付き）
-            print("⏳ ページ遷移待機中...")
-            try:
-                await page.wait_for_load_state('networkidle', timeout=30000)
-                print("✅ ネットワーク待機完了")
-            except Exception as e:
-                print(f"⚠️ ネットワーク待機タイムアウト: {e}")
-            
-            # 結果確認
-            print(f"\n📊 検索後URL: {page.url}")
-            print(f"📊 検索後タイトル: {await page.title()}")
-            
-            # 検索結果要素の確認
-            result_selectors = [
-                '[data-component-type="s-search-result"]',
-                '.s-result-item',
-                '.a-section.a-spacing-base'
-            ]
+            semaphore = asyncio.Semaphore(concurrency)
             
-            for selector in result_selectors:
-                try:
-                    results = await page.query_selector_all(selector)
-                    if results:
-                        print(f"✅ 検索結果発見: {len(results)}件 ({selector})")
-                        
-                        # 最初の結果の詳細
-                        first_result = results[0]
-                        title_element = await first_result.query_selector('h2 a span')
-                        if title_element:
-                            title = await title_element.text_content()
-                            print(f"📚 最初の結果: {title[:50]}...")
-                        break
-                except Exception as e:
-                    print(f"❌ 結果セレクタエラー: {selector} - {e}")
-                    continue
+            async def bounded(index: int, query: str) -> bool:
+                async with semaphore:
+                    try:
+                        return await _run_one(context, query, index)
+                    except Exception as e:
+                        print(f"[{index}] ❌ デバッグエラー: {e}")
+                        return False
             
-            # 検索実行後のスクリーンショット
             try:
-                await page.screenshot(path="debug_after_search.png")
-                print("📸 検索後スクリーンショット保存")
-            except:
-                pass
+                results = await asyncio.gather(
+                    *(bounded(i, query) for i, query in enumerate(queries, 1))
+                )
+            finally:
+                await context.close()
             
-            await browser.close()
-            print("\n🎉 デバッグ完了")
-            return True
+            print(f"\n🎉 デバッグ完了: {sum(results)}/{len(results)}件成功")
+            return all(results)
             
     except Exception as e:
         print(f"❌ デバッグエラー: {e}")
@@ -155,6 +195,6 @@ async def debug_amazon_search():
         return False
 
 if __name__ == '__main__':
-    success = asyncio.run(debug_amazon_search())
+    success = asyncio.run(debug_amazon_search(sys.argv[1:] or DEFAULT_QUERIES))
     print(f"\n📊 デバッグ結果: {'✅ 成功' if success else '❌ 失敗'}")
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -2,13 +2,60 @@
 """
 Chrome/ChromeDriver接続デバッグテスト
 """
+import json
+import os
+import re
+import shutil
+import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
 
 # プロジェクトルートを追加
 project_root = Path(__file__).parent
 sys.path.append(str(project_root / 'src'))
 
+DRIVER_PATH = project_root / 'chromedriver_local'
+CHROME_BINARY_NAMES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser')
+VERSION_CACHE_PATH = Path('~/.cache/izumi/chromedriver.json').expanduser()
+
+
+def _cached_chrome_version(chrome_bin: str) -> Optional[int]:
+    """
+    Chromeのメジャーバージョンを取得（バイナリのmtimeをキーにキャッシュ）
+    
+    毎回の `chrome --version` 起動とundetected-chromedriver側の
+    バージョン検出を省略するため、結果をキャッシュファイルに保存する
+    """
+    key = os.stat(chrome_bin).st_mtime_ns
+    try:
+        cached = json.loads(VERSION_CACHE_PATH.read_text())
+        if (cached.get('chrome_bin') == chrome_bin and cached.get('key') == key
+                and Path(cached.get('driver_path', '')).exists()):
+            return cached['version_main']
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    output = subprocess.run(
+        [chrome_bin, '--version'], capture_output=True, text=True, timeout=10
+    ).stdout
+    match = re.search(r'(\d+)\.\d+', output)
+    if not match:
+        return None
+    
+    version_main = int(match.group(1))
+    try:
+        VERSION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        VERSION_CACHE_PATH.write_text(json.dumps({
+            'chrome_bin': chrome_bin,
+            'key': key,
+            'driver_path': str(DRIVER_PATH),
+            'version_main': version_main
+        }))
+    except OSError:
+        pass
+    return version_main
+
 def debug_chrome_setup():
     """Chrome/ChromeDriverセットアップのデバッグ"""
     print("🔍 Chrome/ChromeDriverデバッグテスト開始")
@@ -25,6 +72,8 @@ def debug_chrome_setup():
         options.add_argument('--headless=new')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
+        # サブリソースの読み込み完了を待たずにDOM構築完了で制御を返す
+        options.page_load_strategy = 'eager'
         
         print("✅ Chrome オプション設定完了")
         
@@ -32,11 +81,17 @@ def debug_chrome_setup():
         import undetected_chromedriver as uc
         
         print("🚀 undetected-chromedriver セッション作成中...")
-        print("📍 自動検出モード使用")
+        chrome_bin = next(filter(None, map(shutil.which, CHROME_BINARY_NAMES)), None)
+        version_main = _cached_chrome_version(chrome_bin) if chrome_bin else None
+        if version_main:
+            print(f"📍 Chromeバージョン（キャッシュ）: {version_main}")
+        else:
+            print("📍 自動検出モード使用")
         
         driver = uc.Chrome(
             options=options,
-            driver_executable_path="./chromedriver_local"
+            driver_executable_path=str(DRIVER_PATH),
+            version_main=version_main
         )
         
         print("✅ ChromeDriverセッション作成成功")
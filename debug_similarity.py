@@ -6,43 +6,139 @@ import sys
 import os
 sys.path.append('/mnt/c/Users/tky99/DEV/izumi-novels-workflow/src')
 
+from typing import List, Optional
+
+import editdistance
+import numpy as np
+
 from scraping.selenium_base_scraper import SeleniumBaseScraper
 
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Levenshtein
+except ImportError:  # rapidfuzz未導入時は編集距離の一括計算を numba / editdistance で行う
+    process = Levenshtein = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba未導入時は editdistance で逐次計算
+    njit = prange = None
+
+# 長さ比がこれ未満なら編集距離の計算を省略（distance >= |lq - lt| より類似度はこの値未満）
+MIN_LENGTH_RATIO = 0.3
+
+# 途中経過の出力（VERBOSE=0 で抑制、python -O でも抑制）
+VERBOSE = __debug__ and os.environ.get('VERBOSE', '1') != '0'
+
+def _silent(*args, **kwargs):
+    pass
+
+def _to_codepoints(text: str) -> np.ndarray:
+    """文字列をUnicodeコードポイント配列（uint32）に変換"""
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _batch_levenshtein(query, titles_flat, offsets):
+        """1クエリ対N件の編集距離（titles_flat[offsets[i]:offsets[i+1]] がi件目）"""
+        n = len(offsets) - 1
+        m = len(query)
+        distances = np.empty(n, dtype=np.int32)
+        for i in prange(n):
+            start = offsets[i]
+            prev = np.arange(m + 1, dtype=np.int32)
+            cur = np.empty(m + 1, dtype=np.int32)
+            for j in range(start, offsets[i + 1]):
+                cur[0] = j - start + 1
+                c = titles_flat[j]
+                for k in range(1, m + 1):
+                    cost = 0 if query[k - 1] == c else 1
+                    cur[k] = min(prev[k] + 1, cur[k - 1] + 1, prev[k - 1] + cost)
+                prev, cur = cur, prev
+            distances[i] = prev[m]
+        return distances
+else:
+    _batch_levenshtein = None
+
+def _batch_distances(query_norm: str, title_norms: List[str]) -> np.ndarray:
+    """
+    1クエリ対N件の編集距離
+    
+    rapidfuzz → numbaカーネル → editdistance の順に利用（いずれも同じ距離を返す）
+    """
+    if process is not None:
+        return process.cdist(
+            [query_norm], title_norms,
+            scorer=Levenshtein.distance, workers=-1, dtype=np.int32
+        ).ravel()
+    
+    if _batch_levenshtein is not None:
+        lengths = np.fromiter(map(len, title_norms), dtype=np.int32, count=len(title_norms))
+        offsets = np.zeros(len(title_norms) + 1, dtype=np.int32)
+        np.cumsum(lengths, out=offsets[1:])
+        return _batch_levenshtein(
+            _to_codepoints(query_norm), _to_codepoints(''.join(title_norms)), offsets
+        )
+    
+    return np.fromiter(
+        (editdistance.eval(query_norm, title) for title in title_norms),
+        dtype=np.int32, count=len(title_norms)
+    )
+
 class DebugScraper(SeleniumBaseScraper):
     async def _search_impl(self, book_title: str, n_code: str):
         return None
     async def _verify_url(self, url: str, expected_title: str):
         return True
     
-    def debug_similarity_score(self, query: str, title: str) -> float:
-        """類似度スコア計算のデバッグ版（改良版キーワード抽出対応）"""
-        print(f"\n🔍 デバッグ: '{query}' vs '{title}'")
+    def debug_similarity_score(self, query: str, title: str, verbose: bool = VERBOSE) -> float:
+        """
+        類似度スコア計算のデバッグ版（改良版キーワード抽出対応）
+        
+        verbose=False の場合は途中経過を出力しない（ループ内での再利用向け）
+        """
+        log = print if verbose else _silent
+        log(f"\n🔍 デバッグ: '{query}' vs '{title}'")
         
         # 正規化
         query_norm = self.normalize_title(query)
         title_norm = self.normalize_title(title)
-        print(f"  正規化後: '{query_norm}' vs '{title_norm}'")
+        log(f"  正規化後: '{query_norm}' vs '{title_norm}'")
+        
+        result = self._ladder_score(query_norm, title_norm, log)
+        if result is None:
+            result = self._length_cutoff_score(query_norm, title_norm, log)
+        if result is None:
+            distance = editdistance.eval(query_norm, title_norm)
+            result = self._distance_score(distance, max(len(query_norm), len(title_norm)), log)
+        return result
+    
+    def _ladder_score(self, query_norm: str, title_norm: str, log=_silent) -> Optional[float]:
+        """
+        編集距離より前の段階（完全一致・部分一致・キーワード・単語）のスコア
         
+        いずれにも該当しない場合は None を返す（編集距離で判定）
+        """
         # 完全一致
         if query_norm == title_norm:
-            print("  → 完全一致: 1.0")
+            log("  → 完全一致: 1.0")
             return 1.0
         
         # 部分一致（クエリがタイトルに含まれる）
         if query_norm in title_norm:
-            print("  → 部分一致（クエリ in タイトル）: 0.9")
+            log("  → 部分一致（クエリ in タイトル）: 0.9")
             return 0.9
         
         # 逆方向の部分一致（タイトルがクエリに含まれる）
         if title_norm in query_norm:
-            print("  → 逆部分一致（タイトル in クエリ）: 0.85")
+            log("  → 逆部分一致（タイトル in クエリ）: 0.85")
             return 0.85
         
         # キーワード抽出による類似度計算
         query_keywords = self._extract_keywords(query_norm)
         title_keywords = self._extract_keywords(title_norm)
-        print(f"  クエリキーワード: {query_keywords}")
-        print(f"  タイトルキーワード: {title_keywords}")
+        log(f"  クエリキーワード: {query_keywords}")
+        log(f"  タイトルキーワード: {title_keywords}")
         
         # キーワードレベルの類似度計算
         if query_keywords and title_keywords:
@@ -57,33 +153,33 @@ class DebugScraper(SeleniumBaseScraper):
                 # 共通キーワード比率
                 common_ratio = len(common_keywords) / min(len(query_keywords), len(title_keywords))
                 
-                print(f"  共通キーワード: {common_keywords}")
-                print(f"  Jaccard係数: {jaccard:.4f}")
-                print(f"  共通キーワード比率: {common_ratio:.4f}")
+                log(f"  共通キーワード: {common_keywords}")
+                log(f"  Jaccard係数: {jaccard:.4f}")
+                log(f"  共通キーワード比率: {common_ratio:.4f}")
                 
                 # 高い類似度の場合
                 if jaccard >= 0.3 or common_ratio >= 0.5:
                     result = max(0.6, min(0.9, jaccard * 1.5 + common_ratio * 0.5))
-                    print(f"  → キーワード類似度（高）: {result:.4f}")
+                    log(f"  → キーワード類似度（高）: {result:.4f}")
                     return result
                 
                 # 中程度の類似度の場合
                 elif jaccard >= 0.15 or common_ratio >= 0.3:
                     result = max(0.4, min(0.7, jaccard * 1.8 + common_ratio * 0.6))
-                    print(f"  → キーワード類似度（中）: {result:.4f}")
+                    log(f"  → キーワード類似度（中）: {result:.4f}")
                     return result
                 
                 # 低い類似度でも共通点がある場合
                 else:
                     result = max(0.25, min(0.5, jaccard * 2.0 + common_ratio * 0.8))
-                    print(f"  → キーワード類似度（低）: {result:.4f}")
+                    log(f"  → キーワード類似度（低）: {result:.4f}")
                     return result
         
         # 単語レベルでの類似度計算（英語等の場合）
         query_words = set(query_norm.split())
         title_words = set(title_norm.split())
-        print(f"  クエリ単語: {query_words}")
-        print(f"  タイトル単語: {title_words}")
+        log(f"  クエリ単語: {query_words}")
+        log(f"  タイトル単語: {title_words}")
         
         if query_words and title_words and len(query_words) > 1 and len(title_words) > 1:
             # Jaccard係数（共通単語/全単語）
@@ -94,29 +190,40 @@ class DebugScraper(SeleniumBaseScraper):
             # 共通単語の重みを考慮した類似度
             common_ratio = len(common_words) / min(len(query_words), len(title_words)) if min(len(query_words), len(title_words)) > 0 else 0
             
-            print(f"  共通単語: {common_words}")
-            print(f"  Jaccard係数: {jaccard:.4f}")
-            print(f"  共通単語比率: {common_ratio:.4f}")
+            log(f"  共通単語: {common_words}")
+            log(f"  Jaccard係数: {jaccard:.4f}")
+            log(f"  共通単語比率: {common_ratio:.4f}")
             
             # 単語レベルの類似度計算（改良版）
             if jaccard > 0.15:  # 閾値を下げる
                 word_similarity = max(jaccard * 1.2, common_ratio * 0.8)
                 result = max(0.3, min(0.8, word_similarity))
-                print(f"  → 単語類似度（高）: {result:.4f}")
+                log(f"  → 単語類似度（高）: {result:.4f}")
                 return result
             elif common_words:  # 何らかの共通単語がある場合
                 result = max(0.25, jaccard * 1.5)
-                print(f"  → 単語類似度（低）: {result:.4f}")
+                log(f"  → 単語類似度（低）: {result:.4f}")
                 return result
         
-        # 編集距離による類似度計算（改良版）
-        import editdistance
-        max_len = max(len(query_norm), len(title_norm))
+        return None
+    
+    def _length_cutoff_score(self, query_norm: str, title_norm: str, log=_silent) -> Optional[float]:
+        """長さ比による編集距離計算の省略判定（省略しない場合は None）"""
+        min_len, max_len = sorted((len(query_norm), len(title_norm)))
         if max_len == 0:
             return 0.0
         
-        distance = editdistance.eval(query_norm, title_norm)
-        print(f"  編集距離: {distance}, 最大長: {max_len}")
+        # 長さが大きく異なる場合は類似度の上限が低いためDP計算を省略
+        if min_len / max_len < MIN_LENGTH_RATIO:
+            result = 0.15 if max_len > 20 else 0.0
+            log(f"  → 長さ比 {min_len / max_len:.4f} < {MIN_LENGTH_RATIO}: {result:.4f}")
+            return result
+        
+        return None
+    
+    def _distance_score(self, distance: int, max_len: int, log=_silent) -> float:
+        """編集距離による類似度計算（改良版）"""
+        log(f"  編集距離: {distance}, 最大長: {max_len}")
         
         # 長い文字列の場合は編集距離の影響を軽減
         if max_len > 20:
@@ -124,15 +231,57 @@ class DebugScraper(SeleniumBaseScraper):
             similarity = 1 - (distance / max_len)
             # 最低スコアを0.15に設定（完全に無関係でも少しは残る）
             result = max(0.15, similarity)
-            print(f"  → 編集距離（長）: {result:.4f}")
+            log(f"  → 編集距離（長）: {result:.4f}")
             return result
         else:
             # 短い文字列では編集距離をそのまま利用
             similarity = 1 - (distance / max_len)
             result = max(0.0, similarity)
-            print(f"  → 編集距離（短）: {result:.4f}")
+            log(f"  → 編集距離（短）: {result:.4f}")
             return result
 
+    def score_many(self, query: str, titles: List[str]) -> np.ndarray:
+        """
+        1クエリ対複数タイトルの類似度を一括計算
+        
+        debug_similarity_score と同じ段階的計算を行い、編集距離の段階に
+        残ったタイトルのみをまとめて計算する
+        rapidfuzz利用時は編集距離を process.cdist により全コアで一括計算する
+        rapidfuzz未導入でnumbaがあれば編集距離カーネルで一括計算する
+        """
+        query_norm = self.normalize_title(query)
+        title_norms = [self.normalize_title(title) for title in titles]
+        
+        scores = np.empty(len(title_norms), dtype=np.float64)
+        pending = []
+        for i, title_norm in enumerate(title_norms):
+            result = self._ladder_score(query_norm, title_norm)
+            if result is None:
+                result = self._length_cutoff_score(query_norm, title_norm)
+            if result is None:
+                pending.append(i)
+            else:
+                scores[i] = result
+        
+        if pending:
+            pending_norms = [title_norms[i] for i in pending]
+            distances = _batch_distances(query_norm, pending_norms)
+            for i, title_norm, distance in zip(pending, pending_norms, distances):
+                scores[i] = self._distance_score(int(distance), max(len(query_norm), len(title_norm)))
+        
+        return scores
+
+def debug_ranking(query: str, titles: List[str]):
+    """1クエリに対する複数タイトルのランキングを表示"""
+    scraper = DebugScraper()
+    
+    print(f"\n📊 ランキング: '{query}'")
+    print("="*60)
+    
+    scores = scraper.score_many(query, titles)
+    for rank, i in enumerate(np.argsort(-scores), 1):
+        print(f"  {rank}. {scores[i]:.4f} {titles[i]}")
+
 def debug_failed_cases():
     """失敗したケースのデバッグ"""
     scraper = DebugScraper()
@@ -153,4 +302,9 @@ def debug_failed_cases():
         print(f"  最終スコア: {score:.4f} {status}")
 
 if __name__ == '__main__':
-    debug_failed_cases()
\ No newline at end of file
+    debug_failed_cases()
+    debug_ranking(
+        "課長が目覚めたら異世界SF艦隊の提督になってた件です①",
+        ["異世界転生RPG物語", "冒険者と魔法使い", "パターン設計手法",
+         "課長が目覚めたら異世界SF艦隊の提督になってた件です"]
+    )
\ No newline at end of file
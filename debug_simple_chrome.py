@@ -30,7 +30,13 @@ def simple_chrome_test():
         options.add_argument('--headless')
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--remote-debugging-port=9222')  # デバッグポート指定
+        # バックグラウンド機能を無効化（ヘッドレスデバッグでは不要）
+        for arg in ('--disable-background-networking', '--disable-default-apps',
+                    '--disable-sync', '--disable-translate', '--disable-extensions',
+                    '--mute-audio'):
+            options.add_argument(arg)
+        # サブリソースの読み込み完了を待たずにDOM構築完了で制御を返す
+        options.page_load_strategy = 'eager'
         
         print("✅ Chrome オプション設定完了")
         
@@ -39,6 +45,8 @@ def simple_chrome_test():
         driver = webdriver.Chrome(service=service, options=options)
         
         print("✅ ChromeDriverセッション作成成功")
+        debugger_address = driver.capabilities.get('goog:chromeOptions', {}).get('debuggerAddress')
+        print(f"📍 DevToolsアドレス: {debugger_address}")
         
         # 簡単なテスト
         print("🌐 Googleアクセステスト...")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+デバッグスクリプト統合エントリポイント
+Amazon検索・Chrome/ChromeDriver接続デバッグを1プロセスで実行する
+"""
+import argparse
+import asyncio
+import sys
+
+COMMANDS = ('amazon', 'chrome', 'simple', 'all')
+
+
+def run_amazon(queries) -> bool:
+    """Amazon Kindle検索デバッグ（Playwright）"""
+    from debug_amazon_search import debug_amazon_search, DEFAULT_QUERIES
+    return asyncio.run(debug_amazon_search(queries or DEFAULT_QUERIES))
+
+
+def run_chrome(queries) -> bool:
+    """undetected-chromedriver接続デバッグ（Selenium）"""
+    from debug_chrome import debug_chrome_setup
+    return debug_chrome_setup()
+
+
+def run_simple(queries) -> bool:
+    """シンプルChrome接続テスト（Selenium）"""
+    from debug_simple_chrome import simple_chrome_test
+    return simple_chrome_test()
+
+
+RUNNERS = {
+    'amazon': run_amazon,
+    'chrome': run_chrome,
+    'simple': run_simple,
+}
+
+
+def main() -> int:
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description='デバッグスクリプト統合実行')
+    parser.add_argument('cmd', choices=COMMANDS, help='実行するデバッグ')
+    parser.add_argument('queries', nargs='*',
+                        help='Amazon検索クエリ（amazon/all のみ）')
+
+    args = parser.parse_args()
+
+    names = list(RUNNERS) if args.cmd == 'all' else [args.cmd]
+    results = {name: RUNNERS[name](args.queries) for name in names}
+
+    print("\n📊 デバッグ結果サマリー")
+    print("=" * 50)
+    for name, success in results.items():
+        print(f"  {name}: {'✅ 成功' if success else '❌ 失敗'}")
+
+    return 0 if all(results.values()) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
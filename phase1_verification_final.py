@@ -4,18 +4,129 @@ Phase 1高度ブラウザ自動化スクレイパー検証テスト
 Chrome環境制約対応版 - 最終修正版
 """
 import asyncio
+import importlib
 import sys
 import os
 import json
-from typing import Dict, Any
+import re
+import shutil
+import socket
+import time
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson未導入時は標準jsonで出力
+    orjson = None
+
 # パス追加
 sys.path.append('/mnt/c/Users/tky99/DEV/izumi-novels-workflow/src')
 
+
+_WSL_RE = re.compile(r'microsoft|wsl', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _detect_wsl() -> bool:
+    """WSL環境判定（/proc/version の1行目を参照）"""
+    try:
+        with open('/proc/version', 'r') as f:
+            return _WSL_RE.search(f.readline()) is not None
+    except OSError:
+        return False
+
+
+# Chrome互換性の探索結果キャッシュ（ホスト名単位、PHASE1_NO_CACHE=1 で無効化）
+CHROME_COMPAT_CACHE_PATH = Path.home() / '.cache' / 'phase1_verify' / 'chrome_compat.json'
+CHROME_COMPAT_CACHE_TTL = 24 * 60 * 60  # 1日
+
+
+def _load_chrome_compat_cache() -> Optional[Dict[str, Any]]:
+    """有効期限内のChrome互換性キャッシュを読み込み"""
+    if os.environ.get('PHASE1_NO_CACHE') == '1':
+        return None
+    try:
+        if time.time() - CHROME_COMPAT_CACHE_PATH.stat().st_mtime >= CHROME_COMPAT_CACHE_TTL:
+            return None
+        cached = json.loads(CHROME_COMPAT_CACHE_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    return cached.get(socket.gethostname())
+
+
+def _save_chrome_compat_cache(probe: Dict[str, Any]):
+    """Chrome互換性の探索結果をアトミックに保存"""
+    try:
+        CHROME_COMPAT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CHROME_COMPAT_CACHE_PATH.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({socket.gethostname(): probe}), encoding='utf-8')
+        os.replace(tmp_path, CHROME_COMPAT_CACHE_PATH)
+    except OSError:
+        pass
+
+
+# 一度だけインポートする検証対象（キー, モジュール, 属性）
+MODULE_TARGETS = (
+    ('HumanBehavior', 'scraping.kinoppy_advanced_scraper', 'HumanBehavior'),
+    ('KinoppyAdvancedScraper', 'scraping.kinoppy_advanced_scraper', 'KinoppyAdvancedScraper'),
+    ('ReaderStoreAdvancedScraper', 'scraping.reader_store_advanced_scraper', 'ReaderStoreAdvancedScraper'),
+    ('SeleniumBaseScraper', 'scraping.selenium_base_scraper', 'SeleniumBaseScraper'),
+    # 依存関係チェック
+    ('uc', 'undetected_chromedriver', None),
+    ('By', 'selenium.webdriver.common.by', 'By'),
+    ('Keys', 'selenium.webdriver.common.keys', 'Keys'),
+    ('BeautifulSoup', 'bs4', 'BeautifulSoup'),
+)
+
+
+# 静的なテストデータ
+EXPECTED_CONFIGS = {
+    'kinoppy': {
+        'BASE_URL': 'https://www.kinokuniya.co.jp',
+        'SEARCH_URL': 'https://www.kinokuniya.co.jp/kinoppystore/search.php',
+        'SITE_NAME': 'kinoppy_advanced'
+    },
+    'reader_store': {
+        'BASE_URL': 'https://ebookstore.sony.jp',
+        'SEARCH_URL': 'https://ebookstore.sony.jp/search/',
+        'SITE_NAME': 'reader_store_advanced'
+    }
+}
+
+KINOPPY_URL_CASES = (
+    ("https://www.kinokuniya.co.jp/dsg-01-9784123456789", True),
+    ("https://www.kinokuniya.co.jp/detail/book-123", True),
+    ("https://example.com/book", False),
+    ("", False),
+)
+
+READER_STORE_URL_CASES = (
+    ("https://ebookstore.sony.jp/storeProduct/123", True),
+    ("https://ebookstore.sony.jp/item/456", True),
+    ("https://example.com/book", False),
+    ("", False),
+)
+
+SIMILARITY_CASES = (
+    ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "課長が目覚めたら異世界SF艦隊の提督になってた件です 1", 0.8),  # 高類似
+    ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "課長が目覚めたら異世界SF艦隊の提督になってた件です", 0.7),      # 中高類似
+    ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "異世界転生RPG物語", 0.3),                                    # 低類似
+    ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "全く関係ない本", 0.1),                                    # 極低類似
+)
+
+
 class Phase1VerificationFinal:
     """Phase 1検証テストクラス（最終版）"""
     
+    __slots__ = ('results', '_mods', '_import_error', 'stub')
+    
+    CHROME_BINARY_NAMES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser')
+    _chrome_path_cache: Dict[str, Optional[str]] = {}
+    
     def __init__(self):
         self.results = {
             'timestamp': datetime.now().isoformat(),
@@ -24,21 +135,69 @@ class Phase1VerificationFinal:
             'tests': {},
             'overall_status': 'PENDING'
         }
+        self._mods, self._import_error = self._load_modules()
+        self.stub = None
+    
+    @staticmethod
+    def _load_modules():
+        """検証対象モジュールを一度だけインポート（失敗したものは記録のみ）"""
+        mods = {}
+        first_error = None
+        for name, module_name, attr in MODULE_TARGETS:
+            try:
+                module = importlib.import_module(module_name)
+                mods[name] = getattr(module, attr) if attr else module
+            except Exception as e:
+                first_error = first_error or e
+        return mods, first_error
+    
+    def _mod(self, name: str):
+        """キャッシュ済みモジュール取得（インポート失敗時は元のエラーを報告）"""
+        try:
+            return self._mods[name]
+        except KeyError:
+            raise ImportError(f'{name}: {self._import_error}') from self._import_error
+    
+    def _stub_scraper(self):
+        """検索処理を持たないテスト用スクレイパー（初回のみ生成して再利用）"""
+        if self.stub is None:
+            SeleniumBaseScraper = self._mod('SeleniumBaseScraper')
+            
+            class StubScraper(SeleniumBaseScraper):
+                async def _search_impl(self, book_title: str, n_code: str):
+                    return None
+                async def _verify_url(self, url: str, expected_title: str):
+                    return True
+            
+            self.stub = StubScraper()
+        return self.stub
+    
+    @classmethod
+    def _find_chrome(cls) -> Optional[str]:
+        """PATH上のChromeを探索（結果はクラス単位でキャッシュ）"""
+        if 'path' not in cls._chrome_path_cache:
+            cls._chrome_path_cache['path'] = next(
+                filter(None, map(shutil.which, cls.CHROME_BINARY_NAMES)), None
+            )
+        return cls._chrome_path_cache['path']
     
     async def run_comprehensive_verification(self):
         """包括的検証テスト実行"""
         print('🚀 Phase 1高度ブラウザ自動化スクレイパー 包括検証開始（最終版）')
         print('=' * 70)
         
-        # テスト実行
-        await self.test_import_compatibility()
-        await self.test_configuration_validation()
-        await self.test_human_behavior_simulation()
-        await self.test_title_variant_generation_fixed()
-        await self.test_url_validation_logic_fixed()
-        await self.test_similarity_scoring_fixed()
-        await self.test_implementation_completeness()
-        await self.test_chrome_compatibility()
+        # テスト実行（各テストは独立しているため並行実行）
+        await asyncio.gather(
+            self.test_import_compatibility(),
+            self.test_configuration_validation(),
+            self.test_human_behavior_simulation(),
+            self.test_title_variant_generation_fixed(),
+            self.test_url_validation_logic_fixed(),
+            self.test_similarity_scoring_fixed(),
+            self.test_implementation_completeness(),
+            self.test_chrome_compatibility(),
+            return_exceptions=True
+        )
         
         # 総合判定
         self.evaluate_overall_status()
@@ -55,15 +214,9 @@ class Phase1VerificationFinal:
         test_name = 'import_compatibility'
         
         try:
-            # 基本モジュールインポート
-            from scraping.kinoppy_advanced_scraper import HumanBehavior
-            from scraping.selenium_base_scraper import SeleniumBaseScraper
-            
-            # 依存関係チェック
-            import undetected_chromedriver as uc
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.common.keys import Keys
-            from bs4 import BeautifulSoup
+            # 初期化時のインポート結果を確認
+            if self._import_error is not None:
+                raise self._import_error
             
             self.results['tests'][test_name] = {
                 'status': 'PASS',
@@ -92,8 +245,8 @@ class Phase1VerificationFinal:
         test_name = 'configuration_validation'
         
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
+            KinoppyAdvancedScraper = self._mod('KinoppyAdvancedScraper')
+            ReaderStoreAdvancedScraper = self._mod('ReaderStoreAdvancedScraper')
             
             # クラス属性の検証
             kinoppy_config = {
@@ -108,35 +261,21 @@ class Phase1VerificationFinal:
                 'SEARCH_URL': ReaderStoreAdvancedScraper.SEARCH_URL
             }
             
-            # 設定値検証
-            expected_configs = {
-                'kinoppy': {
-                    'BASE_URL': 'https://www.kinokuniya.co.jp',
-                    'SEARCH_URL': 'https://www.kinokuniya.co.jp/kinoppystore/search.php',
-                    'SITE_NAME': 'kinoppy_advanced'
-                },
-                'reader_store': {
-                    'BASE_URL': 'https://ebookstore.sony.jp',
-                    'SEARCH_URL': 'https://ebookstore.sony.jp/search/',
-                    'SITE_NAME': 'reader_store_advanced'
-                }
-            }
-            
             config_validation = {}
             
             # Kinoppy設定検証
             kinoppy_valid = (
-                kinoppy_config['BASE_URL'] == expected_configs['kinoppy']['BASE_URL'] and
-                kinoppy_config['SEARCH_URL'] == expected_configs['kinoppy']['SEARCH_URL'] and
-                kinoppy_config['SITE_NAME'] == expected_configs['kinoppy']['SITE_NAME']
+                kinoppy_config['BASE_URL'] == EXPECTED_CONFIGS['kinoppy']['BASE_URL'] and
+                kinoppy_config['SEARCH_URL'] == EXPECTED_CONFIGS['kinoppy']['SEARCH_URL'] and
+                kinoppy_config['SITE_NAME'] == EXPECTED_CONFIGS['kinoppy']['SITE_NAME']
             )
             config_validation['kinoppy'] = kinoppy_valid
             
             # Reader Store設定検証
             reader_store_valid = (
-                reader_store_config['BASE_URL'] == expected_configs['reader_store']['BASE_URL'] and
-                reader_store_config['SEARCH_URL'] == expected_configs['reader_store']['SEARCH_URL'] and
-                reader_store_config['SITE_NAME'] == expected_configs['reader_store']['SITE_NAME']
+                reader_store_config['BASE_URL'] == EXPECTED_CONFIGS['reader_store']['BASE_URL'] and
+                reader_store_config['SEARCH_URL'] == EXPECTED_CONFIGS['reader_store']['SEARCH_URL'] and
+                reader_store_config['SITE_NAME'] == EXPECTED_CONFIGS['reader_store']['SITE_NAME']
             )
             config_validation['reader_store'] = reader_store_valid
             
@@ -146,7 +285,7 @@ class Phase1VerificationFinal:
                 'status': 'PASS' if all_valid else 'FAIL',
                 'message': '設定検証完了' if all_valid else '設定に不整合あり',
                 'details': {
-                    'expected': expected_configs,
+                    'expected': EXPECTED_CONFIGS,
                     'actual': {
                         'kinoppy': kinoppy_config,
                         'reader_store': reader_store_config
@@ -172,7 +311,7 @@ class Phase1VerificationFinal:
         test_name = 'human_behavior_simulation'
         
         try:
-            from scraping.kinoppy_advanced_scraper import HumanBehavior
+            HumanBehavior = self._mod('HumanBehavior')
             
             behavior = HumanBehavior()
             
@@ -224,17 +363,8 @@ class Phase1VerificationFinal:
             # テスト用のセットアップ
             test_title = "課長が目覚めたら異世界SF艦隊の提督になってた件です①"
             
-            # 基本的な正規化機能をテスト
-            from scraping.selenium_base_scraper import SeleniumBaseScraper
-            
-            # 実際にベースクラスのインスタンス化してテスト
-            class TestScraper(SeleniumBaseScraper):
-                async def _search_impl(self, book_title: str, n_code: str):
-                    return None
-                async def _verify_url(self, url: str, expected_title: str):
-                    return True
-            
-            scraper = TestScraper()
+            # 実際にベースクラスのインスタンス（共有スタブ）でテスト
+            scraper = self._stub_scraper()
             
             # create_volume_variantsメソッドのテスト
             variants = scraper.create_volume_variants(test_title)
@@ -248,8 +378,8 @@ class Phase1VerificationFinal:
             )
             
             # サイト固有の実装確認は省略（メソッド存在チェックのみ）
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
+            KinoppyAdvancedScraper = self._mod('KinoppyAdvancedScraper')
+            ReaderStoreAdvancedScraper = self._mod('ReaderStoreAdvancedScraper')
             
             kinoppy_has_method = hasattr(KinoppyAdvancedScraper, '_create_kinoppy_title_variants')
             reader_store_has_method = hasattr(ReaderStoreAdvancedScraper, '_create_reader_store_title_variants')
@@ -289,82 +419,52 @@ class Phase1VerificationFinal:
         
         try:
             # テスト用のスクレイパーを作成
-            from scraping.selenium_base_scraper import SeleniumBaseScraper
+            SeleniumBaseScraper = self._mod('SeleniumBaseScraper')
             
             class TestKinoppyScraper(SeleniumBaseScraper):
                 BASE_URL = "https://www.kinokuniya.co.jp"
+                # 紀伊國屋の書籍URLパターン
+                VALID_URL_PATTERN = re.compile(r'/dsg-|/detail/|/book/')
                 
                 async def _search_impl(self, book_title: str, n_code: str):
                     return None
                     
                 async def _verify_url(self, url: str, expected_title: str) -> bool:
-                    try:
-                        if not url or not url.startswith(self.BASE_URL):
-                            return False
-                        
-                        # 紀伊國屋の書籍URLパターンチェック
-                        valid_patterns = ['/dsg-', '/detail/', '/book/']
-                        return any(pattern in url for pattern in valid_patterns)
-                        
-                    except Exception as e:
-                        return False
+                    return (bool(url) and url.startswith(self.BASE_URL)
+                            and self.VALID_URL_PATTERN.search(url) is not None)
             
             class TestReaderStoreScraper(SeleniumBaseScraper):
                 BASE_URL = "https://ebookstore.sony.jp"
+                # Sony Reader Storeの書籍URLパターン
+                VALID_URL_PATTERN = re.compile(r'/storeProduct/|/item/|/product/')
                 
                 async def _search_impl(self, book_title: str, n_code: str):
                     return None
                     
                 async def _verify_url(self, url: str, expected_title: str) -> bool:
-                    try:
-                        if not url or not url.startswith(self.BASE_URL):
-                            return False
-                        
-                        # Sony Reader Storeの書籍URLパターンチェック
-                        valid_patterns = ['/storeProduct/', '/item/', '/product/']
-                        return any(pattern in url for pattern in valid_patterns)
-                        
-                    except Exception as e:
-                        return False
-            
-            # テストケース
-            kinoppy_test_cases = [
-                ("https://www.kinokuniya.co.jp/dsg-01-9784123456789", True),
-                ("https://www.kinokuniya.co.jp/detail/book-123", True),
-                ("https://example.com/book", False),
-                ("", False),
-            ]
-            
-            reader_store_test_cases = [
-                ("https://ebookstore.sony.jp/storeProduct/123", True),
-                ("https://ebookstore.sony.jp/item/456", True),
-                ("https://example.com/book", False),
-                ("", False),
-            ]
+                    return (bool(url) and url.startswith(self.BASE_URL)
+                            and self.VALID_URL_PATTERN.search(url) is not None)
             
             # インスタンスを作成してテスト実行
             kinoppy_scraper = TestKinoppyScraper()
             reader_store_scraper = TestReaderStoreScraper()
             
-            kinoppy_results = []
-            for url, expected in kinoppy_test_cases:
-                result = await kinoppy_scraper._verify_url(url, "test")
-                kinoppy_results.append({
-                    'url': url,
-                    'expected': expected,
-                    'actual': result,
-                    'pass': result == expected
-                })
-            
-            reader_store_results = []
-            for url, expected in reader_store_test_cases:
-                result = await reader_store_scraper._verify_url(url, "test")
-                reader_store_results.append({
-                    'url': url,
-                    'expected': expected,
-                    'actual': result,
-                    'pass': result == expected
-                })
+            # 全URLの検証を並行実行
+            kinoppy_actuals, reader_store_actuals = await asyncio.gather(
+                asyncio.gather(*(kinoppy_scraper._verify_url(url, "test")
+                                 for url, _ in KINOPPY_URL_CASES)),
+                asyncio.gather(*(reader_store_scraper._verify_url(url, "test")
+                                 for url, _ in READER_STORE_URL_CASES))
+            )
+            
+            kinoppy_results = [
+                {'url': url, 'expected': expected, 'actual': result, 'pass': result == expected}
+                for (url, expected), result in zip(KINOPPY_URL_CASES, kinoppy_actuals)
+            ]
+            reader_store_results = [
+                {'url': url, 'expected': expected, 'actual': result, 'pass': result == expected}
+                for (url, expected), result in zip(READER_STORE_URL_CASES, reader_store_actuals)
+            ]
             
             # 合格判定
             kinoppy_pass = all(test['pass'] for test in kinoppy_results)
@@ -399,35 +499,19 @@ class Phase1VerificationFinal:
         test_name = 'similarity_scoring'
         
         try:
-            # テスト用のスクレイパーを作成
-            from scraping.selenium_base_scraper import SeleniumBaseScraper
-            
-            class TestScraper(SeleniumBaseScraper):
-                async def _search_impl(self, book_title: str, n_code: str):
-                    return None
-                async def _verify_url(self, url: str, expected_title: str):
-                    return True
+            # テスト用のスクレイパー（共有スタブ）
+            scraper = self._stub_scraper()
             
-            scraper = TestScraper()
-            
-            # テストケース
-            test_cases = [
-                ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "課長が目覚めたら異世界SF艦隊の提督になってた件です 1", 0.8),  # 高類似
-                ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "課長が目覚めたら異世界SF艦隊の提督になってた件です", 0.7),      # 中高類似
-                ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "異世界転生RPG物語", 0.3),                                    # 低類似
-                ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "全く関係ない本", 0.1),                                    # 極低類似
-            ]
-            
-            scoring_results = []
-            for query, title, expected_min in test_cases:
-                score = scraper.calculate_similarity_score(query, title)
-                scoring_results.append({
+            scoring_results = [
+                {
                     'query': query[:30] + '...',
                     'title': title[:30] + '...',
-                    'score': score,
+                    'score': (score := scraper.calculate_similarity_score(query, title)),
                     'expected_min': expected_min,
                     'pass': score >= expected_min
-                })
+                }
+                for query, title, expected_min in SIMILARITY_CASES
+            ]
             
             # 合格判定
             scoring_valid = all(result['pass'] for result in scoring_results)
@@ -458,8 +542,8 @@ class Phase1VerificationFinal:
         test_name = 'implementation_completeness'
         
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
+            KinoppyAdvancedScraper = self._mod('KinoppyAdvancedScraper')
+            ReaderStoreAdvancedScraper = self._mod('ReaderStoreAdvancedScraper')
             
             # 必須メソッドの存在確認
             required_methods = [
@@ -473,24 +557,21 @@ class Phase1VerificationFinal:
                 'get_stats'
             ]
             
-            kinoppy_methods = []
-            reader_store_methods = []
+            # dir() で属性集合を1回だけ取得して判定
+            kinoppy_attrs = set(dir(KinoppyAdvancedScraper))
+            reader_store_attrs = set(dir(ReaderStoreAdvancedScraper))
             
-            for method in required_methods:
-                kinoppy_has = hasattr(KinoppyAdvancedScraper, method)
-                reader_store_has = hasattr(ReaderStoreAdvancedScraper, method)
-                
-                kinoppy_methods.append({
-                    'method': method,
-                    'exists': kinoppy_has
-                })
-                reader_store_methods.append({
-                    'method': method,
-                    'exists': reader_store_has
-                })
-            
-            kinoppy_complete = all(m['exists'] for m in kinoppy_methods)
-            reader_store_complete = all(m['exists'] for m in reader_store_methods)
+            kinoppy_methods = [
+                {'method': method, 'exists': method in kinoppy_attrs}
+                for method in required_methods
+            ]
+            reader_store_methods = [
+                {'method': method, 'exists': method in reader_store_attrs}
+                for method in required_methods
+            ]
+            
+            kinoppy_complete = kinoppy_attrs.issuperset(required_methods)
+            reader_store_complete = reader_store_attrs.issuperset(required_methods)
             overall_complete = kinoppy_complete and reader_store_complete
             
             self.results['tests'][test_name] = {
@@ -522,8 +603,7 @@ class Phase1VerificationFinal:
         test_name = 'chrome_compatibility'
         
         try:
-            import undetected_chromedriver as uc
-            from selenium.webdriver.chrome.options import Options
+            uc = self._mod('uc')
             
             # Chrome設定の妥当性確認
             options = uc.ChromeOptions()
@@ -531,36 +611,15 @@ class Phase1VerificationFinal:
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
             
-            # WSL環境でのChrome実行制約を確認
-            import subprocess
-            import shutil
+            # システムのChrome・WSL環境を探す（キャッシュがあれば探索を省略）
+            probe = _load_chrome_compat_cache()
+            if probe is None:
+                probe = {'chrome_path': self._find_chrome(), 'wsl_environment': _detect_wsl()}
+                _save_chrome_compat_cache(probe)
             
-            chrome_available = False
-            chrome_path = None
-            
-            # システムのChromeを探す
-            potential_paths = [
-                '/usr/bin/google-chrome',
-                '/usr/bin/google-chrome-stable',
-                '/usr/bin/chromium',  
-                '/usr/bin/chromium-browser'
-            ]
-            
-            for path in potential_paths:
-                if shutil.which(path.split('/')[-1]):
-                    chrome_path = path
-                    chrome_available = True
-                    break
-            
-            wsl_constraint = False
-            try:
-                # WSL環境判定
-                with open('/proc/version', 'r') as f:
-                    version_info = f.read().lower()
-                    if 'microsoft' in version_info or 'wsl' in version_info:
-                        wsl_constraint = True
-            except:
-                pass
+            chrome_path = probe['chrome_path']
+            chrome_available = chrome_path is not None
+            wsl_constraint = probe['wsl_environment']
             
             compatibility_details = {
                 'chrome_available': chrome_available,
@@ -595,9 +654,10 @@ class Phase1VerificationFinal:
     
     def evaluate_overall_status(self):
         """総合ステータス評価"""
-        passed_tests = sum(1 for test in self.results['tests'].values() if test['status'] == 'PASS')
-        partial_tests = sum(1 for test in self.results['tests'].values() if test['status'] == 'PARTIAL')
-        total_tests = len(self.results['tests'])
+        status_counts = Counter(test['status'] for test in self.results['tests'].values())
+        passed_tests = status_counts['PASS']
+        partial_tests = status_counts['PARTIAL']
+        total_tests = sum(status_counts.values())
         
         if passed_tests == total_tests:
             self.results['overall_status'] = 'EXCELLENT'
@@ -653,8 +713,13 @@ class Phase1VerificationFinal:
         
         # レポートファイル保存
         report_path = '/mnt/c/Users/tky99/DEV/izumi-novels-workflow/reports/phase1_verification_final.json'
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        if orjson is not None:
+            with open(report_path, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(self.results, f, ensure_ascii=False, indent=2)
         
         print(f"\n📄 詳細レポート保存: {report_path}")
 
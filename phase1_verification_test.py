@@ -7,12 +7,103 @@ import asyncio
 import sys
 import os
 import json
+import logging
+from collections import Counter
 from typing import Dict, Any
 from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson未導入時は標準jsonで出力
+    orjson = None
+
+# レポートを整形出力するか（既定はコンパクト出力）
+VERIFY_PRETTY = bool(os.environ.get('VERIFY_PRETTY'))
+
+# 進捗出力（VERIFY_LOG=WARNING で詳細出力を抑制）
+logger = logging.getLogger('phase1_verify')
+
+# レポート出力先（スクリプト配置ディレクトリ基準）
+REPORT_PATH = Path(__file__).resolve().parent / 'reports' / 'phase1_verification_report.json'
 
 # パス追加
 sys.path.append('/mnt/c/Users/tky99/DEV/izumi-novels-workflow/src')
 
+# 検証対象・依存モジュールはモジュール読み込み時に1回だけインポート
+try:
+    from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper, HumanBehavior
+    from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
+    import undetected_chromedriver as uc
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from bs4 import BeautifulSoup
+    _IMPORT_OK = True
+    _IMPORT_ERR = None
+except Exception as e:
+    _IMPORT_OK = False
+    _IMPORT_ERR = e
+
+
+# 静的なテストデータ
+EXPECTED_CONFIGS = {
+    'kinoppy': {
+        'BASE_URL': 'https://www.kinokuniya.co.jp',
+        'SEARCH_URL': 'https://www.kinokuniya.co.jp/kinoppystore/search.php',
+        'SITE_NAME': 'kinoppy_advanced'
+    },
+    'reader_store': {
+        'BASE_URL': 'https://ebookstore.sony.jp',
+        'SEARCH_URL': 'https://ebookstore.sony.jp/search/',
+        'SITE_NAME': 'reader_store_advanced'
+    }
+}
+
+KINOPPY_URL_CASES = (
+    ("https://www.kinokuniya.co.jp/dsg-01-9784123456789", True),
+    ("https://www.kinokuniya.co.jp/detail/book-123", True),
+    ("https://example.com/book", False),
+    ("", False),
+)
+
+READER_STORE_URL_CASES = (
+    ("https://ebookstore.sony.jp/storeProduct/123", True),
+    ("https://ebookstore.sony.jp/item/456", True),
+    ("https://example.com/book", False),
+    ("", False),
+)
+
+SIMILARITY_CASES = (
+    ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "課長が目覚めたら異世界SF艦隊の提督になってた件です 1", 0.8),  # 高類似
+    ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "課長が目覚めたら異世界SF艦隊の提督になってた件です", 0.7),      # 中高類似
+    ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "異世界転生RPG物語", 0.3),                                    # 低類似
+    ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "全く関係ない本", 0.1),                                    # 極低類似
+)
+
+
+def _url_results(cases, actuals):
+    """URL検証結果を列指向（SoA）の辞書と合格マスクにまとめる"""
+    pass_mask = np.fromiter(
+        (actual == expected for (_, expected), actual in zip(cases, actuals)),
+        dtype=bool, count=len(cases)
+    )
+    results = {
+        'urls': [url for url, _ in cases],
+        'expected': [expected for _, expected in cases],
+        'actual': list(actuals),
+        'pass': pass_mask.tolist()
+    }
+    return results, pass_mask
+
+
+def _require_imports():
+    """モジュールインポート失敗時は元の例外を送出"""
+    if not _IMPORT_OK:
+        raise _IMPORT_ERR
+
+
 class Phase1VerificationTest:
     """Phase 1検証テストクラス"""
     
@@ -24,21 +115,58 @@ class Phase1VerificationTest:
             'tests': {},
             'overall_status': 'PENDING'
         }
+        # スクレイパーは生成コストが高いため全テストで1インスタンスを共有
+        self._kinoppy = None
+        self._reader_store = None
+        # インポートテスト失敗時は後続テストをSKIP
+        self._imports_ok = True
+    
+    def _skip_if_imports_unavailable(self, test_name: str) -> bool:
+        """インポート不可ならSKIPを記録してTrueを返す"""
+        if self._imports_ok:
+            return False
+        self.results['tests'][test_name] = {
+            'status': 'SKIP',
+            'message': 'インポート失敗のためスキップ',
+            'details': {}
+        }
+        logger.info('⏭️  %s: SKIP', test_name)
+        return True
+    
+    def _get_kinoppy(self):
+        """共有Kinoppyスクレイパー取得（初回のみ生成）"""
+        _require_imports()
+        if self._kinoppy is None:
+            self._kinoppy = KinoppyAdvancedScraper(headless=True, timeout=30)
+        return self._kinoppy
+    
+    def _get_reader_store(self):
+        """共有Reader Storeスクレイパー取得（初回のみ生成）"""
+        _require_imports()
+        if self._reader_store is None:
+            self._reader_store = ReaderStoreAdvancedScraper(headless=True, timeout=30)
+        return self._reader_store
     
     async def run_comprehensive_verification(self):
         """包括的検証テスト実行"""
-        print('🚀 Phase 1高度ブラウザ自動化スクレイパー 包括検証開始')
-        print('=' * 60)
+        logger.info('🚀 Phase 1高度ブラウザ自動化スクレイパー 包括検証開始')
+        logger.info('=' * 60)
         
-        # テスト実行
+        # インポートテストを先行実行（失敗時は後続テストをSKIP）
         await self.test_import_compatibility()
-        await self.test_class_initialization()
-        await self.test_configuration_validation()
-        await self.test_human_behavior_simulation()
-        await self.test_title_variant_generation()
-        await self.test_url_validation_logic()
-        await self.test_search_strategy()
-        await self.test_similarity_scoring()
+        self._imports_ok = self.results['tests']['import_compatibility']['status'] != 'FAIL'
+        
+        # 残りのテスト実行（各テストは独立しているため並行実行）
+        await asyncio.gather(
+            self.test_class_initialization(),
+            self.test_configuration_validation(),
+            self.test_human_behavior_simulation(),
+            self.test_title_variant_generation(),
+            self.test_url_validation_logic(),
+            self.test_search_strategy(),
+            self.test_similarity_scoring(),
+            return_exceptions=True
+        )
         
         # 総合判定
         self.evaluate_overall_status()
@@ -46,24 +174,17 @@ class Phase1VerificationTest:
         # レポート生成
         await self.generate_verification_report()
         
-        print('\n🏁 Phase 1包括検証完了')
+        logger.info('\n🏁 Phase 1包括検証完了')
         return self.results
     
     async def test_import_compatibility(self):
         """インポート互換性テスト"""
-        print('\n--- インポート互換性テスト ---')
+        logger.info('\n--- インポート互換性テスト ---')
         test_name = 'import_compatibility'
         
         try:
-            # 基本モジュールインポート
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper, HumanBehavior
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
-            
-            # 依存関係チェック
-            import undetected_chromedriver as uc
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.common.keys import Keys
-            from bs4 import BeautifulSoup
+            # 基本モジュール・依存関係チェック（インポートはモジュール先頭で実施済み）
+            _require_imports()
             
             self.results['tests'][test_name] = {
                 'status': 'PASS',
@@ -76,7 +197,7 @@ class Phase1VerificationTest:
                     'BeautifulSoup: OK'
                 ]
             }
-            print('✅ インポート互換性テスト: PASS')
+            logger.info('✅ インポート互換性テスト: PASS')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -84,20 +205,20 @@ class Phase1VerificationTest:
                 'message': f'インポートエラー: {str(e)}',
                 'details': []
             }
-            print(f'❌ インポート互換性テスト: FAIL - {str(e)}')
+            logger.error('❌ インポート互換性テスト: FAIL - %s', e)
     
     async def test_class_initialization(self):
         """クラス初期化テスト"""
-        print('\n--- クラス初期化テスト ---')
+        logger.info('\n--- クラス初期化テスト ---')
         test_name = 'class_initialization'
         
+        if self._skip_if_imports_unavailable(test_name):
+            return
+        
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
-            
-            # インスタンス生成
-            kinoppy = KinoppyAdvancedScraper(headless=True, timeout=30)
-            reader_store = ReaderStoreAdvancedScraper(headless=True, timeout=30)
+            # インスタンス生成（共有インスタンス）
+            kinoppy = self._get_kinoppy()
+            reader_store = self._get_reader_store()
             
             # 設定値確認
             kinoppy_config = {
@@ -124,7 +245,7 @@ class Phase1VerificationTest:
                     'reader_store_config': reader_store_config
                 }
             }
-            print('✅ クラス初期化テスト: PASS')
+            logger.info('✅ クラス初期化テスト: PASS')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -132,49 +253,35 @@ class Phase1VerificationTest:
                 'message': f'初期化エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ クラス初期化テスト: FAIL - {str(e)}')
+            logger.error('❌ クラス初期化テスト: FAIL - %s', e)
     
     async def test_configuration_validation(self):
         """設定検証テスト"""
-        print('\n--- 設定検証テスト ---')
+        logger.info('\n--- 設定検証テスト ---')
         test_name = 'configuration_validation'
         
+        if self._skip_if_imports_unavailable(test_name):
+            return
+        
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
-            
-            kinoppy = KinoppyAdvancedScraper()
-            reader_store = ReaderStoreAdvancedScraper()
-            
-            # URL検証
-            expected_configs = {
-                'kinoppy': {
-                    'BASE_URL': 'https://www.kinokuniya.co.jp',
-                    'SEARCH_URL': 'https://www.kinokuniya.co.jp/kinoppystore/search.php',
-                    'SITE_NAME': 'kinoppy_advanced'
-                },
-                'reader_store': {
-                    'BASE_URL': 'https://ebookstore.sony.jp',
-                    'SEARCH_URL': 'https://ebookstore.sony.jp/search/',
-                    'SITE_NAME': 'reader_store_advanced'
-                }
-            }
+            kinoppy = self._get_kinoppy()
+            reader_store = self._get_reader_store()
             
             config_validation = {}
             
             # Kinoppy設定検証
             kinoppy_valid = (
-                kinoppy.BASE_URL == expected_configs['kinoppy']['BASE_URL'] and
-                kinoppy.SEARCH_URL == expected_configs['kinoppy']['SEARCH_URL'] and
-                kinoppy.SITE_NAME == expected_configs['kinoppy']['SITE_NAME']
+                kinoppy.BASE_URL == EXPECTED_CONFIGS['kinoppy']['BASE_URL'] and
+                kinoppy.SEARCH_URL == EXPECTED_CONFIGS['kinoppy']['SEARCH_URL'] and
+                kinoppy.SITE_NAME == EXPECTED_CONFIGS['kinoppy']['SITE_NAME']
             )
             config_validation['kinoppy'] = kinoppy_valid
             
             # Reader Store設定検証
             reader_store_valid = (
-                reader_store.BASE_URL == expected_configs['reader_store']['BASE_URL'] and
-                reader_store.SEARCH_URL == expected_configs['reader_store']['SEARCH_URL'] and
-                reader_store.SITE_NAME == expected_configs['reader_store']['SITE_NAME']
+                reader_store.BASE_URL == EXPECTED_CONFIGS['reader_store']['BASE_URL'] and
+                reader_store.SEARCH_URL == EXPECTED_CONFIGS['reader_store']['SEARCH_URL'] and
+                reader_store.SITE_NAME == EXPECTED_CONFIGS['reader_store']['SITE_NAME']
             )
             config_validation['reader_store'] = reader_store_valid
             
@@ -184,13 +291,13 @@ class Phase1VerificationTest:
                 'status': 'PASS' if all_valid else 'FAIL',
                 'message': '設定検証完了' if all_valid else '設定に不整合あり',
                 'details': {
-                    'expected': expected_configs,
+                    'expected': EXPECTED_CONFIGS,
                     'validation': config_validation
                 }
             }
             
             status = '✅' if all_valid else '❌'
-            print(f'{status} 設定検証テスト: {"PASS" if all_valid else "FAIL"}')
+            logger.info('%s 設定検証テスト: %s', status, 'PASS' if all_valid else 'FAIL')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -198,16 +305,18 @@ class Phase1VerificationTest:
                 'message': f'設定検証エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ 設定検証テスト: FAIL - {str(e)}')
+            logger.error('❌ 設定検証テスト: FAIL - %s', e)
     
     async def test_human_behavior_simulation(self):
         """人間動作シミュレーションテスト"""
-        print('\n--- 人間動作シミュレーションテスト ---')
+        logger.info('\n--- 人間動作シミュレーションテスト ---')
         test_name = 'human_behavior_simulation'
         
+        if self._skip_if_imports_unavailable(test_name):
+            return
+        
         try:
-            from scraping.kinoppy_advanced_scraper import HumanBehavior
-            
+            _require_imports()
             behavior = HumanBehavior()
             
             # パラメータ検証
@@ -239,7 +348,7 @@ class Phase1VerificationTest:
             }
             
             status = '✅' if valid_ranges else '❌'
-            print(f'{status} 人間動作シミュレーションテスト: {"PASS" if valid_ranges else "FAIL"}')
+            logger.info('%s 人間動作シミュレーションテスト: %s', status, 'PASS' if valid_ranges else 'FAIL')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -247,39 +356,42 @@ class Phase1VerificationTest:
                 'message': f'人間動作シミュレーションエラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ 人間動作シミュレーションテスト: FAIL - {str(e)}')
+            logger.error('❌ 人間動作シミュレーションテスト: FAIL - %s', e)
     
     async def test_title_variant_generation(self):
         """タイトルバリエーション生成テスト"""
-        print('\n--- タイトルバリエーション生成テスト ---')
+        logger.info('\n--- タイトルバリエーション生成テスト ---')
         test_name = 'title_variant_generation'
         
+        if self._skip_if_imports_unavailable(test_name):
+            return
+        
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
-            
-            kinoppy = KinoppyAdvancedScraper()
-            reader_store = ReaderStoreAdvancedScraper()
+            kinoppy = self._get_kinoppy()
+            reader_store = self._get_reader_store()
             
             test_title = "課長が目覚めたら異世界SF艦隊の提督になってた件です①"
             
-            # バリエーション生成
-            kinoppy_variants = kinoppy._create_kinoppy_title_variants(test_title)
-            reader_store_variants = reader_store._create_reader_store_title_variants(test_title)
+            # バリエーション生成（CPU処理はスレッドに逃がしイベントループを塞がない）
+            kinoppy_variants, reader_store_variants = await asyncio.gather(
+                asyncio.to_thread(kinoppy._create_kinoppy_title_variants, test_title),
+                asyncio.to_thread(reader_store._create_reader_store_title_variants, test_title)
+            )
+            
+            # 品質検証（重複を除いた集合で所属判定）
+            kinoppy_set = frozenset(kinoppy_variants)
+            reader_store_set = frozenset(reader_store_variants)
             
-            # 品質検証
             kinoppy_quality = (
-                len(kinoppy_variants) >= 3 and
-                len(kinoppy_variants) <= 10 and
-                test_title in kinoppy_variants and
-                any('1' in variant for variant in kinoppy_variants)  # 巻数変換
+                3 <= len(kinoppy_variants) <= 10 and
+                test_title in kinoppy_set and
+                any('1' in variant for variant in kinoppy_set)  # 巻数変換
             )
             
             reader_store_quality = (
-                len(reader_store_variants) >= 3 and
-                len(reader_store_variants) <= 10 and
-                test_title in reader_store_variants and
-                any('1' in variant for variant in reader_store_variants)  # 巻数変換
+                3 <= len(reader_store_variants) <= 10 and
+                test_title in reader_store_set and
+                any('1' in variant for variant in reader_store_set)  # 巻数変換
             )
             
             overall_quality = kinoppy_quality and reader_store_quality
@@ -297,9 +409,9 @@ class Phase1VerificationTest:
             }
             
             status = '✅' if overall_quality else '❌'
-            print(f'{status} タイトルバリエーション生成テスト: {"PASS" if overall_quality else "FAIL"}')
-            print(f'  Kinoppy: {len(kinoppy_variants)}バリエーション')
-            print(f'  Reader Store: {len(reader_store_variants)}バリエーション')
+            logger.info('%s タイトルバリエーション生成テスト: %s', status, 'PASS' if overall_quality else 'FAIL')
+            logger.info('  Kinoppy: %dバリエーション', len(kinoppy_variants))
+            logger.info('  Reader Store: %dバリエーション', len(reader_store_variants))
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -307,59 +419,33 @@ class Phase1VerificationTest:
                 'message': f'バリエーション生成エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ タイトルバリエーション生成テスト: FAIL - {str(e)}')
+            logger.error('❌ タイトルバリエーション生成テスト: FAIL - %s', e)
     
     async def test_url_validation_logic(self):
         """URL検証ロジックテスト"""
-        print('\n--- URL検証ロジックテスト ---')
+        logger.info('\n--- URL検証ロジックテスト ---')
         test_name = 'url_validation_logic'
         
+        if self._skip_if_imports_unavailable(test_name):
+            return
+        
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
-            
-            kinoppy = KinoppyAdvancedScraper()
-            reader_store = ReaderStoreAdvancedScraper()
-            
-            # テストケース
-            kinoppy_test_cases = [
-                ("https://www.kinokuniya.co.jp/dsg-01-9784123456789", True),
-                ("https://www.kinokuniya.co.jp/detail/book-123", True),
-                ("https://example.com/book", False),
-                ("", False),
-            ]
-            
-            reader_store_test_cases = [
-                ("https://ebookstore.sony.jp/storeProduct/123", True),
-                ("https://ebookstore.sony.jp/item/456", True),
-                ("https://example.com/book", False),
-                ("", False),
-            ]
+            kinoppy = self._get_kinoppy()
+            reader_store = self._get_reader_store()
+            
+            # 検証実行（全URLを並行検証）
+            kinoppy_count = len(KINOPPY_URL_CASES)
+            actuals = await asyncio.gather(
+                *(kinoppy._verify_url(url, "test") for url, _ in KINOPPY_URL_CASES),
+                *(reader_store._verify_url(url, "test") for url, _ in READER_STORE_URL_CASES)
+            )
             
-            # 検証実行
-            kinoppy_results = []
-            for url, expected in kinoppy_test_cases:
-                result = await kinoppy._verify_url(url, "test")
-                kinoppy_results.append({
-                    'url': url,
-                    'expected': expected,
-                    'actual': result,
-                    'pass': result == expected
-                })
-            
-            reader_store_results = []
-            for url, expected in reader_store_test_cases:
-                result = await reader_store._verify_url(url, "test")
-                reader_store_results.append({
-                    'url': url,
-                    'expected': expected,
-                    'actual': result,
-                    'pass': result == expected
-                })
+            kinoppy_results, kinoppy_mask = _url_results(KINOPPY_URL_CASES, actuals[:kinoppy_count])
+            reader_store_results, reader_store_mask = _url_results(READER_STORE_URL_CASES, actuals[kinoppy_count:])
             
             # 合格判定
-            kinoppy_pass = all(test['pass'] for test in kinoppy_results)
-            reader_store_pass = all(test['pass'] for test in reader_store_results)
+            kinoppy_pass = bool(kinoppy_mask.all())
+            reader_store_pass = bool(reader_store_mask.all())
             overall_pass = kinoppy_pass and reader_store_pass
             
             self.results['tests'][test_name] = {
@@ -374,7 +460,7 @@ class Phase1VerificationTest:
             }
             
             status = '✅' if overall_pass else '❌'
-            print(f'{status} URL検証ロジックテスト: {"PASS" if overall_pass else "FAIL"}')
+            logger.info('%s URL検証ロジックテスト: %s', status, 'PASS' if overall_pass else 'FAIL')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -382,19 +468,19 @@ class Phase1VerificationTest:
                 'message': f'URL検証エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ URL検証ロジックテスト: FAIL - {str(e)}')
+            logger.error('❌ URL検証ロジックテスト: FAIL - %s', e)
     
     async def test_search_strategy(self):
         """検索戦略テスト"""
-        print('\n--- 検索戦略テスト ---')
+        logger.info('\n--- 検索戦略テスト ---')
         test_name = 'search_strategy'
         
+        if self._skip_if_imports_unavailable(test_name):
+            return
+        
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
-            
-            kinoppy = KinoppyAdvancedScraper()
-            reader_store = ReaderStoreAdvancedScraper()
+            kinoppy = self._get_kinoppy()
+            reader_store = self._get_reader_store()
             
             # 統計情報確認
             kinoppy_stats = kinoppy.get_stats()
@@ -433,7 +519,7 @@ class Phase1VerificationTest:
             }
             
             status = '✅' if overall_strategy_valid else '❌'
-            print(f'{status} 検索戦略テスト: {"PASS" if overall_strategy_valid else "FAIL"}')
+            logger.info('%s 検索戦略テスト: %s', status, 'PASS' if overall_strategy_valid else 'FAIL')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -441,39 +527,45 @@ class Phase1VerificationTest:
                 'message': f'検索戦略エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ 検索戦略テスト: FAIL - {str(e)}')
+            logger.error('❌ 検索戦略テスト: FAIL - %s', e)
     
     async def test_similarity_scoring(self):
         """類似度スコア計算テスト"""
-        print('\n--- 類似度スコア計算テスト ---')
+        logger.info('\n--- 類似度スコア計算テスト ---')
         test_name = 'similarity_scoring'
         
+        if self._skip_if_imports_unavailable(test_name):
+            return
+        
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            
-            scraper = KinoppyAdvancedScraper()
-            
-            # テストケース
-            test_cases = [
-                ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "課長が目覚めたら異世界SF艦隊の提督になってた件です 1", 0.8),  # 高類似
-                ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "課長が目覚めたら異世界SF艦隊の提督になってた件です", 0.7),      # 中高類似
-                ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "異世界転生RPG物語", 0.3),                                    # 低類似
-                ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "全く関係ない本", 0.1),                                    # 極低類似
-            ]
-            
-            scoring_results = []
-            for query, title, expected_min in test_cases:
-                score = scraper.calculate_similarity_score(query, title)
-                scoring_results.append({
-                    'query': query[:30] + '...',
-                    'title': title[:30] + '...',
-                    'score': score,
-                    'expected_min': expected_min,
-                    'pass': score >= expected_min
-                })
+            scraper = self._get_kinoppy()
+            
+            # スコア計算（CPU処理はスレッドに逃がしイベントループを塞がない）
+            # クエリは種類ごとに1回だけ正規化し、正規化済みの組でスコア計算
+            query_norms = {query: scraper.normalize_title(query) for query, _, _ in SIMILARITY_CASES}
+            scores = await asyncio.gather(*(
+                asyncio.to_thread(scraper.score_normalized, query_norms[query], scraper.normalize_title(title))
+                for query, title, _ in SIMILARITY_CASES
+            ))
+            
+            # 結果は列指向（SoA）で保持し、合格判定はベクトル演算で行う
+            score_array = np.asarray(scores, dtype=np.float64)
+            expected_mins = np.fromiter(
+                (expected_min for _, _, expected_min in SIMILARITY_CASES),
+                dtype=np.float64, count=len(SIMILARITY_CASES)
+            )
+            pass_mask = score_array >= expected_mins
+            
+            scoring_results = {
+                'queries': [query[:30] + '...' for query, _, _ in SIMILARITY_CASES],
+                'titles': [title[:30] + '...' for _, title, _ in SIMILARITY_CASES],
+                'score': score_array.tolist(),
+                'expected_min': expected_mins.tolist(),
+                'pass': pass_mask.tolist()
+            }
             
             # 合格判定
-            scoring_valid = all(result['pass'] for result in scoring_results)
+            scoring_valid = bool(pass_mask.all())
             
             self.results['tests'][test_name] = {
                 'status': 'PASS' if scoring_valid else 'FAIL',
@@ -485,7 +577,7 @@ class Phase1VerificationTest:
             }
             
             status = '✅' if scoring_valid else '❌'
-            print(f'{status} 類似度スコア計算テスト: {"PASS" if scoring_valid else "FAIL"}')
+            logger.info('%s 類似度スコア計算テスト: %s', status, 'PASS' if scoring_valid else 'FAIL')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -493,12 +585,13 @@ class Phase1VerificationTest:
                 'message': f'類似度スコア計算エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ 類似度スコア計算テスト: FAIL - {str(e)}')
+            logger.error('❌ 類似度スコア計算テスト: FAIL - %s', e)
     
     def evaluate_overall_status(self):
         """総合ステータス評価"""
-        passed_tests = sum(1 for test in self.results['tests'].values() if test['status'] == 'PASS')
-        total_tests = len(self.results['tests'])
+        status_counts = Counter(test['status'] for test in self.results['tests'].values())
+        passed_tests = status_counts['PASS']
+        total_tests = sum(status_counts.values())
         
         if passed_tests == total_tests:
             self.results['overall_status'] = 'FULL_PASS'
@@ -512,42 +605,55 @@ class Phase1VerificationTest:
         self.results['test_summary'] = {
             'passed': passed_tests,
             'total': total_tests,
-            'pass_rate': passed_tests / total_tests if total_tests > 0 else 0
+            'pass_rate': passed_tests / total_tests if total_tests > 0 else 0,
+            'counts': dict(status_counts)
         }
     
     async def generate_verification_report(self):
         """検証レポート生成"""
-        print('\n' + '=' * 60)
-        print('📊 Phase 1検証結果サマリー')
-        print('=' * 60)
+        logger.info('\n' + '=' * 60)
+        logger.info('📊 Phase 1検証結果サマリー')
+        logger.info('=' * 60)
         
         summary = self.results['test_summary']
-        print(f"総合ステータス: {self.results['overall_status']}")
-        print(f"テスト合格率: {summary['passed']}/{summary['total']} ({summary['pass_rate']:.1%})")
+        logger.info('総合ステータス: %s', self.results['overall_status'])
+        logger.info('テスト合格率: %d/%d (%.1f%%)', summary['passed'], summary['total'], summary['pass_rate'] * 100)
+        logger.info('ステータス内訳: %s', summary['counts'])
         
-        print(f"\n📋 テスト詳細:")
+        logger.info('\n📋 テスト詳細:')
         for test_name, test_result in self.results['tests'].items():
-            status_icon = '✅' if test_result['status'] == 'PASS' else '❌'
-            print(f"  {status_icon} {test_name}: {test_result['status']}")
+            status_icon = {'PASS': '✅', 'SKIP': '⏭️'}.get(test_result['status'], '❌')
+            logger.info('  %s %s: %s', status_icon, test_name, test_result['status'])
         
         # 結果判定
         if self.results['overall_status'] in ['FULL_PASS', 'MOSTLY_PASS']:
-            print(f"\n🎉 Phase 1実装品質: 高品質")
-            print(f"💡 推奨: 実行環境での実機テスト進行")
+            logger.info('\n🎉 Phase 1実装品質: 高品質')
+            logger.info('💡 推奨: 実行環境での実機テスト進行')
         else:
-            print(f"\n⚠️  Phase 1実装品質: 改善必要")
-            print(f"💡 推奨: 実装修正後再検証")
+            logger.warning('\n⚠️  Phase 1実装品質: 改善必要')
+            logger.warning('💡 推奨: 実装修正後再検証')
         
         # レポートファイル保存
-        report_path = '/mnt/c/Users/tky99/DEV/izumi-novels-workflow/reports/phase1_verification_report.json'
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
+        # 一時ファイルに書き出してから置換（書き込み途中で既存レポートを壊さない）
+        report_path = REPORT_PATH
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = report_path.with_suffix('.json.tmp')
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2 if VERIFY_PRETTY else 0))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                if VERIFY_PRETTY:
+                    json.dump(self.results, f, ensure_ascii=False, indent=2)
+                else:
+                    json.dump(self.results, f, ensure_ascii=False, separators=(',', ':'))
+        tmp_path.replace(report_path)
         
-        print(f"\n📄 詳細レポート保存: {report_path}")
+        logger.info('\n📄 詳細レポート保存: %s', report_path)
 
 async def main():
     """メイン検証実行"""
-    print('🔍 Phase 1高度ブラウザ自動化スクレイパー 検証開始')
+    logger.info('🔍 Phase 1高度ブラウザ自動化スクレイパー 検証開始')
     
     verifier = Phase1VerificationTest()
     results = await verifier.run_comprehensive_verification()
@@ -555,4 +661,12 @@ async def main():
     return results
 
 if __name__ == '__main__':
+    logging.basicConfig(level=os.environ.get('VERIFY_LOG', 'INFO'), format='%(message)s')
+    
+    # uvloopが利用可能なら高速イベントループを使用（Windows等では標準ループ）
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
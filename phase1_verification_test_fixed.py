@@ -4,15 +4,87 @@ Phase 1高度ブラウザ自動化スクレイパー検証テスト
 Chrome環境制約対応版 - 基底クラス互換性修正版
 """
 import asyncio
+import importlib
 import sys
 import os
 import json
-from typing import Dict, Any
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson未導入時は標準jsonで出力
+    orjson = None
+
 # パス追加
 sys.path.append('/mnt/c/Users/tky99/DEV/izumi-novels-workflow/src')
 
+# 探索するChromeの実行ファイル名（優先順）
+CHROME_BINARY_NAMES = ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser')
+
+_WSL_RE = re.compile(r'microsoft|wsl', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1)
+def _find_chrome() -> Optional[str]:
+    """
+    PATH上のChromeを CHROME_BINARY_NAMES の優先順に探索
+    
+    名前ごとにPATHの各ディレクトリを確認する（確認回数は shutil.which と同じ名前×ディレクトリ数）
+    探索はプロセス内で1回だけ行い、結果を lru_cache で再利用する
+    """
+    path_dirs = os.environ.get('PATH', '').split(os.pathsep)
+    for name in CHROME_BINARY_NAMES:
+        for directory in path_dirs:
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                return candidate
+    return None
+
+
+@lru_cache(maxsize=1)
+def _detect_wsl() -> bool:
+    """WSL環境判定（/proc/version の1行目を参照）"""
+    try:
+        with open('/proc/version', 'r') as f:
+            return _WSL_RE.search(f.readline()) is not None
+    except OSError:
+        return False
+
+
+# 検証用Chromeオプション引数
+DEFAULT_CHROME_ARGUMENTS = ('--headless=new', '--no-sandbox', '--disable-dev-shm-usage')
+
+
+@lru_cache(maxsize=1)
+def _default_uc_options(uc):
+    """検証用ChromeOptions（プロセス内で1回だけ生成、呼び出し側で変更しないこと）"""
+    options = uc.ChromeOptions()
+    for argument in DEFAULT_CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    return options
+
+
+# サマリー出力用のステータスアイコン（未定義ステータスは ❌）
+STATUS_ICONS = {'PASS': '✅', 'PARTIAL': '⚠️'}
+
+# 一度だけインポートする検証対象（キー, モジュール, 属性）
+MODULE_TARGETS = (
+    ('HumanBehavior', 'scraping.kinoppy_advanced_scraper', 'HumanBehavior'),
+    ('KinoppyAdvancedScraper', 'scraping.kinoppy_advanced_scraper', 'KinoppyAdvancedScraper'),
+    ('ReaderStoreAdvancedScraper', 'scraping.reader_store_advanced_scraper', 'ReaderStoreAdvancedScraper'),
+    ('SeleniumBaseScraper', 'scraping.selenium_base_scraper', 'SeleniumBaseScraper'),
+    # 依存関係チェック
+    ('uc', 'undetected_chromedriver', None),
+    ('By', 'selenium.webdriver.common.by', 'By'),
+    ('Keys', 'selenium.webdriver.common.keys', 'Keys'),
+    ('BeautifulSoup', 'bs4', 'BeautifulSoup'),
+)
+
+
 class Phase1VerificationTestFixed:
     """Phase 1検証テストクラス（修正版）"""
     
@@ -24,21 +96,58 @@ class Phase1VerificationTestFixed:
             'tests': {},
             'overall_status': 'PENDING'
         }
+        self._tests_snapshot = []
+        # 出力はバッファに溜めてセクションごとに一括書き込み（printごとのsyscallを削減）
+        self._log: List[str] = []
+        # 検証対象モジュールは初期化時に一度だけインポートしてキャッシュ
+        self._mods, self._import_error = self._load_modules()
+    
+    def _flush_log(self):
+        """バッファ済みの出力を1回の書き込みでまとめて出力"""
+        if self._log:
+            sys.stdout.write('\n'.join(self._log) + '\n')
+            sys.stdout.flush()
+            self._log.clear()
+    
+    @staticmethod
+    def _load_modules():
+        """検証対象モジュールを一度だけインポート（失敗したものは記録のみ）"""
+        mods = {}
+        first_error = None
+        for name, module_name, attr in MODULE_TARGETS:
+            try:
+                module = importlib.import_module(module_name)
+                mods[name] = getattr(module, attr) if attr else module
+            except Exception as e:
+                first_error = first_error or e
+        return mods, first_error
+    
+    def _mod(self, name: str):
+        """キャッシュ済みモジュール取得（インポート失敗時は元のエラーを報告）"""
+        try:
+            return self._mods[name]
+        except KeyError:
+            raise ImportError(f'{name}: {self._import_error}') from self._import_error
     
     async def run_comprehensive_verification(self):
         """包括的検証テスト実行"""
-        print('🚀 Phase 1高度ブラウザ自動化スクレイパー 包括検証開始（修正版）')
-        print('=' * 70)
+        self._log.append('🚀 Phase 1高度ブラウザ自動化スクレイパー 包括検証開始（修正版）')
+        self._log.append('=' * 70)
+        self._flush_log()
         
-        # テスト実行
-        await self.test_import_compatibility()
-        await self.test_configuration_validation()
-        await self.test_human_behavior_simulation()
-        await self.test_title_variant_generation()
-        await self.test_url_validation_logic()
-        await self.test_similarity_scoring()
-        await self.test_implementation_completeness()
-        await self.test_chrome_compatibility()
+        # テスト実行（各テストは独立しているため並行実行）
+        await asyncio.gather(
+            self.test_import_compatibility(),
+            self.test_configuration_validation(),
+            self.test_human_behavior_simulation(),
+            self.test_title_variant_generation(),
+            self.test_url_validation_logic(),
+            self.test_similarity_scoring(),
+            self.test_implementation_completeness(),
+            self.test_chrome_compatibility(),
+            return_exceptions=True
+        )
+        self._flush_log()
         
         # 総合判定
         self.evaluate_overall_status()
@@ -46,24 +155,19 @@ class Phase1VerificationTestFixed:
         # レポート生成
         await self.generate_verification_report()
         
-        print('\n🏁 Phase 1包括検証完了')
+        self._log.append('\n🏁 Phase 1包括検証完了')
+        self._flush_log()
         return self.results
     
     async def test_import_compatibility(self):
         """インポート互換性テスト"""
-        print('\n--- インポート互換性テスト ---')
+        self._log.append('\n--- インポート互換性テスト ---')
         test_name = 'import_compatibility'
         
         try:
-            # 基本モジュールインポート
-            from scraping.kinoppy_advanced_scraper import HumanBehavior
-            from scraping.selenium_base_scraper import SeleniumBaseScraper
-            
-            # 依存関係チェック
-            import undetected_chromedriver as uc
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.common.keys import Keys
-            from bs4 import BeautifulSoup
+            # 基本モジュール・依存関係チェック（初期化時のインポート結果を確認）
+            if self._import_error is not None:
+                raise self._import_error
             
             self.results['tests'][test_name] = {
                 'status': 'PASS',
@@ -76,7 +180,7 @@ class Phase1VerificationTestFixed:
                     'BeautifulSoup: OK'
                 ]
             }
-            print('✅ インポート互換性テスト: PASS')
+            self._log.append('✅ インポート互換性テスト: PASS')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -84,16 +188,16 @@ class Phase1VerificationTestFixed:
                 'message': f'インポートエラー: {str(e)}',
                 'details': []
             }
-            print(f'❌ インポート互換性テスト: FAIL - {str(e)}')
+            self._log.append(f'❌ インポート互換性テスト: FAIL - {str(e)}')
     
     async def test_configuration_validation(self):
         """設定検証テスト（直接インスタンス化回避）"""
-        print('\n--- 設定検証テスト ---')
+        self._log.append('\n--- 設定検証テスト ---')
         test_name = 'configuration_validation'
         
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
+            KinoppyAdvancedScraper = self._mod('KinoppyAdvancedScraper')
+            ReaderStoreAdvancedScraper = self._mod('ReaderStoreAdvancedScraper')
             
             # クラス属性の検証（インスタンス化しない）
             kinoppy_config = {
@@ -122,23 +226,16 @@ class Phase1VerificationTestFixed:
                 }
             }
             
-            config_validation = {}
-            
-            # Kinoppy設定検証
-            kinoppy_valid = (
-                kinoppy_config['BASE_URL'] == expected_configs['kinoppy']['BASE_URL'] and
-                kinoppy_config['SEARCH_URL'] == expected_configs['kinoppy']['SEARCH_URL'] and
-                kinoppy_config['SITE_NAME'] == expected_configs['kinoppy']['SITE_NAME']
-            )
-            config_validation['kinoppy'] = kinoppy_valid
+            actual_configs = {
+                'kinoppy': kinoppy_config,
+                'reader_store': reader_store_config
+            }
             
-            # Reader Store設定検証
-            reader_store_valid = (
-                reader_store_config['BASE_URL'] == expected_configs['reader_store']['BASE_URL'] and
-                reader_store_config['SEARCH_URL'] == expected_configs['reader_store']['SEARCH_URL'] and
-                reader_store_config['SITE_NAME'] == expected_configs['reader_store']['SITE_NAME']
-            )
-            config_validation['reader_store'] = reader_store_valid
+            # サイトごとに辞書同士を比較（キー追加時も判定式の修正不要）
+            config_validation = {
+                site: actual_configs[site] == expected
+                for site, expected in expected_configs.items()
+            }
             
             all_valid = all(config_validation.values())
             
@@ -146,17 +243,15 @@ class Phase1VerificationTestFixed:
                 'status': 'PASS' if all_valid else 'FAIL',
                 'message': '設定検証完了' if all_valid else '設定に不整合あり',
                 'details': {
-                    'expected': expected_configs,
-                    'actual': {
-                        'kinoppy': kinoppy_config,
-                        'reader_store': reader_store_config
-                    },
+                    # 期待値は固定値のため不整合時のみ出力
+                    **({} if all_valid else {'expected': expected_configs}),
+                    'actual': actual_configs,
                     'validation': config_validation
                 }
             }
             
             status = '✅' if all_valid else '❌'
-            print(f'{status} 設定検証テスト: {"PASS" if all_valid else "FAIL"}')
+            self._log.append(f'{status} 設定検証テスト: {"PASS" if all_valid else "FAIL"}')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -164,15 +259,15 @@ class Phase1VerificationTestFixed:
                 'message': f'設定検証エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ 設定検証テスト: FAIL - {str(e)}')
+            self._log.append(f'❌ 設定検証テスト: FAIL - {str(e)}')
     
     async def test_human_behavior_simulation(self):
         """人間動作シミュレーションテスト"""
-        print('\n--- 人間動作シミュレーションテスト ---')
+        self._log.append('\n--- 人間動作シミュレーションテスト ---')
         test_name = 'human_behavior_simulation'
         
         try:
-            from scraping.kinoppy_advanced_scraper import HumanBehavior
+            HumanBehavior = self._mod('HumanBehavior')
             
             behavior = HumanBehavior()
             
@@ -205,7 +300,7 @@ class Phase1VerificationTestFixed:
             }
             
             status = '✅' if valid_ranges else '❌'
-            print(f'{status} 人間動作シミュレーションテスト: {"PASS" if valid_ranges else "FAIL"}')
+            self._log.append(f'{status} 人間動作シミュレーションテスト: {"PASS" if valid_ranges else "FAIL"}')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -213,38 +308,35 @@ class Phase1VerificationTestFixed:
                 'message': f'人間動作シミュレーションエラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ 人間動作シミュレーションテスト: FAIL - {str(e)}')
+            self._log.append(f'❌ 人間動作シミュレーションテスト: FAIL - {str(e)}')
     
     async def test_title_variant_generation(self):
         """タイトルバリエーション生成テスト（独立メソッドを直接テスト）"""
-        print('\n--- タイトルバリエーション生成テスト ---')
+        self._log.append('\n--- タイトルバリエーション生成テスト ---')
         test_name = 'title_variant_generation'
         
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
+            KinoppyAdvancedScraper = self._mod('KinoppyAdvancedScraper')
+            ReaderStoreAdvancedScraper = self._mod('ReaderStoreAdvancedScraper')
             
             test_title = "課長が目覚めたら異世界SF艦隊の提督になってた件です①"
             
-            # 直接メソッド呼び出し（インスタンス化不要）
-            kinoppy_scraper = type('TestScraper', (KinoppyAdvancedScraper,), {})
-            reader_store_scraper = type('TestScraper', (ReaderStoreAdvancedScraper,), {})
+            # バリエーション生成メソッドを直接呼び出し（インスタンス化・動的サブクラス生成不要）
+            kinoppy_variants = KinoppyAdvancedScraper._create_kinoppy_title_variants(None, test_title)
+            reader_store_variants = ReaderStoreAdvancedScraper._create_reader_store_title_variants(None, test_title)
             
-            # バリエーション生成メソッドを直接呼び出し
-            kinoppy_variants = kinoppy_scraper._create_kinoppy_title_variants(None, test_title)
-            reader_store_variants = reader_store_scraper._create_reader_store_title_variants(None, test_title)
+            # 品質検証（生成結果を一度だけタプル化して各判定で再利用）
+            kinoppy_variants = tuple(kinoppy_variants)
+            reader_store_variants = tuple(reader_store_variants)
             
-            # 品質検証
             kinoppy_quality = (
-                len(kinoppy_variants) >= 3 and
-                len(kinoppy_variants) <= 10 and
+                3 <= len(kinoppy_variants) <= 10 and
                 test_title in kinoppy_variants and
                 any('1' in variant for variant in kinoppy_variants)  # 巻数変換
             )
             
             reader_store_quality = (
-                len(reader_store_variants) >= 3 and
-                len(reader_store_variants) <= 10 and
+                3 <= len(reader_store_variants) <= 10 and
                 test_title in reader_store_variants and
                 any('1' in variant for variant in reader_store_variants)  # 巻数変換
             )
@@ -264,9 +356,9 @@ class Phase1VerificationTestFixed:
             }
             
             status = '✅' if overall_quality else '❌'
-            print(f'{status} タイトルバリエーション生成テスト: {"PASS" if overall_quality else "FAIL"}')
-            print(f'  Kinoppy: {len(kinoppy_variants)}バリエーション')
-            print(f'  Reader Store: {len(reader_store_variants)}バリエーション')
+            self._log.append(f'{status} タイトルバリエーション生成テスト: {"PASS" if overall_quality else "FAIL"}')
+            self._log.append(f'  Kinoppy: {len(kinoppy_variants)}バリエーション')
+            self._log.append(f'  Reader Store: {len(reader_store_variants)}バリエーション')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -274,16 +366,16 @@ class Phase1VerificationTestFixed:
                 'message': f'バリエーション生成エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ タイトルバリエーション生成テスト: FAIL - {str(e)}')
+            self._log.append(f'❌ タイトルバリエーション生成テスト: FAIL - {str(e)}')
     
     async def test_url_validation_logic(self):
         """URL検証ロジックテスト（静的メソッドとして）"""
-        print('\n--- URL検証ロジックテスト ---')
+        self._log.append('\n--- URL検証ロジックテスト ---')
         test_name = 'url_validation_logic'
         
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
+            KinoppyAdvancedScraper = self._mod('KinoppyAdvancedScraper')
+            ReaderStoreAdvancedScraper = self._mod('ReaderStoreAdvancedScraper')
             
             # テストケース
             kinoppy_test_cases = [
@@ -300,26 +392,22 @@ class Phase1VerificationTestFixed:
                 ("", False),
             ]
             
-            # 検証実行（クラスメソッドとして実行）
-            kinoppy_results = []
-            for url, expected in kinoppy_test_cases:
-                result = await KinoppyAdvancedScraper._verify_url(None, url, "test")
-                kinoppy_results.append({
-                    'url': url,
-                    'expected': expected,
-                    'actual': result,
-                    'pass': result == expected
-                })
-            
-            reader_store_results = []
-            for url, expected in reader_store_test_cases:
-                result = await ReaderStoreAdvancedScraper._verify_url(None, url, "test")
-                reader_store_results.append({
-                    'url': url,
-                    'expected': expected,
-                    'actual': result,
-                    'pass': result == expected
-                })
+            # 検証実行（クラスメソッドとして実行、サイトごとに並行検証）
+            kinoppy_actuals, reader_store_actuals = await asyncio.gather(
+                asyncio.gather(*(KinoppyAdvancedScraper._verify_url(None, url, "test")
+                                 for url, _ in kinoppy_test_cases)),
+                asyncio.gather(*(ReaderStoreAdvancedScraper._verify_url(None, url, "test")
+                                 for url, _ in reader_store_test_cases))
+            )
+            
+            kinoppy_results = [
+                {'url': url, 'expected': expected, 'actual': result, 'pass': result == expected}
+                for (url, expected), result in zip(kinoppy_test_cases, kinoppy_actuals)
+            ]
+            reader_store_results = [
+                {'url': url, 'expected': expected, 'actual': result, 'pass': result == expected}
+                for (url, expected), result in zip(reader_store_test_cases, reader_store_actuals)
+            ]
             
             # 合格判定
             kinoppy_pass = all(test['pass'] for test in kinoppy_results)
@@ -338,7 +426,7 @@ class Phase1VerificationTestFixed:
             }
             
             status = '✅' if overall_pass else '❌'
-            print(f'{status} URL検証ロジックテスト: {"PASS" if overall_pass else "FAIL"}')
+            self._log.append(f'{status} URL検証ロジックテスト: {"PASS" if overall_pass else "FAIL"}')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -346,15 +434,15 @@ class Phase1VerificationTestFixed:
                 'message': f'URL検証エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ URL検証ロジックテスト: FAIL - {str(e)}')
+            self._log.append(f'❌ URL検証ロジックテスト: FAIL - {str(e)}')
     
     async def test_similarity_scoring(self):
         """類似度スコア計算テスト（基底クラスのメソッドを使用）"""
-        print('\n--- 類似度スコア計算テスト ---')
+        self._log.append('\n--- 類似度スコア計算テスト ---')
         test_name = 'similarity_scoring'
         
         try:
-            from scraping.selenium_base_scraper import SeleniumBaseScraper
+            SeleniumBaseScraper = self._mod('SeleniumBaseScraper')
             
             # テストケース
             test_cases = [
@@ -364,16 +452,22 @@ class Phase1VerificationTestFixed:
                 ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "全く関係ない本", 0.1),                                    # 極低類似
             ]
             
-            scoring_results = []
-            for query, title, expected_min in test_cases:
-                score = SeleniumBaseScraper.calculate_similarity_score(None, query, title)
-                scoring_results.append({
+            # スコア計算（CPU処理はスレッドに逃がし他テストと並行実行）
+            scores = await asyncio.gather(*(
+                asyncio.to_thread(SeleniumBaseScraper.calculate_similarity_score, None, query, title)
+                for query, title, _ in test_cases
+            ))
+            
+            scoring_results = [
+                {
                     'query': query[:30] + '...',
                     'title': title[:30] + '...',
                     'score': score,
                     'expected_min': expected_min,
                     'pass': score >= expected_min
-                })
+                }
+                for (query, title, expected_min), score in zip(test_cases, scores)
+            ]
             
             # 合格判定
             scoring_valid = all(result['pass'] for result in scoring_results)
@@ -388,7 +482,7 @@ class Phase1VerificationTestFixed:
             }
             
             status = '✅' if scoring_valid else '❌'
-            print(f'{status} 類似度スコア計算テスト: {"PASS" if scoring_valid else "FAIL"}')
+            self._log.append(f'{status} 類似度スコア計算テスト: {"PASS" if scoring_valid else "FAIL"}')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -396,16 +490,16 @@ class Phase1VerificationTestFixed:
                 'message': f'類似度スコア計算エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ 類似度スコア計算テスト: FAIL - {str(e)}')
+            self._log.append(f'❌ 類似度スコア計算テスト: FAIL - {str(e)}')
     
     async def test_implementation_completeness(self):
         """実装完全性テスト"""
-        print('\n--- 実装完全性テスト ---')
+        self._log.append('\n--- 実装完全性テスト ---')
         test_name = 'implementation_completeness'
         
         try:
-            from scraping.kinoppy_advanced_scraper import KinoppyAdvancedScraper
-            from scraping.reader_store_advanced_scraper import ReaderStoreAdvancedScraper
+            KinoppyAdvancedScraper = self._mod('KinoppyAdvancedScraper')
+            ReaderStoreAdvancedScraper = self._mod('ReaderStoreAdvancedScraper')
             
             # 必須メソッドの存在確認
             required_methods = [
@@ -419,24 +513,12 @@ class Phase1VerificationTestFixed:
                 'get_stats'
             ]
             
-            kinoppy_methods = []
-            reader_store_methods = []
-            
-            for method in required_methods:
-                kinoppy_has = hasattr(KinoppyAdvancedScraper, method)
-                reader_store_has = hasattr(ReaderStoreAdvancedScraper, method)
-                
-                kinoppy_methods.append({
-                    'method': method,
-                    'exists': kinoppy_has
-                })
-                reader_store_methods.append({
-                    'method': method,
-                    'exists': reader_store_has
-                })
-            
-            kinoppy_complete = all(m['exists'] for m in kinoppy_methods)
-            reader_store_complete = all(m['exists'] for m in reader_store_methods)
+            # 不足メソッドのみを1回の走査で抽出
+            kinoppy_missing = [m for m in required_methods if not hasattr(KinoppyAdvancedScraper, m)]
+            reader_store_missing = [m for m in required_methods if not hasattr(ReaderStoreAdvancedScraper, m)]
+            
+            kinoppy_complete = not kinoppy_missing
+            reader_store_complete = not reader_store_missing
             overall_complete = kinoppy_complete and reader_store_complete
             
             self.results['tests'][test_name] = {
@@ -444,15 +526,15 @@ class Phase1VerificationTestFixed:
                 'message': '実装完全性検証完了',
                 'details': {
                     'required_methods': required_methods,
-                    'kinoppy_methods': kinoppy_methods,
-                    'reader_store_methods': reader_store_methods,
+                    'kinoppy_missing': kinoppy_missing,
+                    'reader_store_missing': reader_store_missing,
                     'kinoppy_complete': kinoppy_complete,
                     'reader_store_complete': reader_store_complete
                 }
             }
             
             status = '✅' if overall_complete else '❌'
-            print(f'{status} 実装完全性テスト: {"PASS" if overall_complete else "FAIL"}')
+            self._log.append(f'{status} 実装完全性テスト: {"PASS" if overall_complete else "FAIL"}')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -460,60 +542,32 @@ class Phase1VerificationTestFixed:
                 'message': f'実装完全性エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ 実装完全性テスト: FAIL - {str(e)}')
+            self._log.append(f'❌ 実装完全性テスト: FAIL - {str(e)}')
     
     async def test_chrome_compatibility(self):
         """Chrome互換性テスト（WSL制約確認）"""
-        print('\n--- Chrome互換性テスト ---')
+        self._log.append('\n--- Chrome互換性テスト ---')
         test_name = 'chrome_compatibility'
         
         try:
-            import undetected_chromedriver as uc
-            from selenium.webdriver.chrome.options import Options
+            uc = self._mod('uc')
             
             # Chrome設定の妥当性確認
-            options = uc.ChromeOptions()
-            options.add_argument('--headless=new')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
+            options = _default_uc_options(uc)
             
             # WSL環境でのChrome実行制約を確認
-            import subprocess
-            import shutil
-            
-            chrome_available = False
-            chrome_path = None
-            
-            # システムのChromeを探す
-            potential_paths = [
-                '/usr/bin/google-chrome',
-                '/usr/bin/google-chrome-stable',
-                '/usr/bin/chromium',
-                '/usr/bin/chromium-browser'
-            ]
-            
-            for path in potential_paths:
-                if shutil.which(path.split('/')[-1]):
-                    chrome_path = path
-                    chrome_available = True
-                    break
-            
-            wsl_constraint = False
-            try:
-                # WSL環境判定
-                with open('/proc/version', 'r') as f:
-                    version_info = f.read().lower()
-                    if 'microsoft' in version_info or 'wsl' in version_info:
-                        wsl_constraint = True
-            except:
-                pass
+            # システムのChromeを探す（探索結果・WSL判定はプロセス内でキャッシュ）
+            chrome_path = _find_chrome()
+            chrome_available = chrome_path is not None
+            wsl_constraint = _detect_wsl()
             
             compatibility_details = {
                 'chrome_available': chrome_available,
                 'chrome_path': chrome_path,
                 'wsl_environment': wsl_constraint,
                 'headless_mode_required': wsl_constraint,
-                'gui_support_limited': wsl_constraint
+                'gui_support_limited': wsl_constraint,
+                'chrome_arguments': list(options.arguments)
             }
             
             # 総合判定（Chrome利用可能または適切な代替策有り）
@@ -526,9 +580,9 @@ class Phase1VerificationTestFixed:
             }
             
             status = '✅' if compatibility_ok else '⚠️'
-            print(f'{status} Chrome互換性テスト: {"PASS" if compatibility_ok else "PARTIAL"}')
+            self._log.append(f'{status} Chrome互換性テスト: {"PASS" if compatibility_ok else "PARTIAL"}')
             if wsl_constraint:
-                print('  ⚠️ WSL環境制約: headlessモード推奨')
+                self._log.append('  ⚠️ WSL環境制約: headlessモード推奨')
             
         except Exception as e:
             self.results['tests'][test_name] = {
@@ -536,13 +590,16 @@ class Phase1VerificationTestFixed:
                 'message': f'Chrome互換性エラー: {str(e)}',
                 'details': {}
             }
-            print(f'❌ Chrome互換性テスト: FAIL - {str(e)}')
+            self._log.append(f'❌ Chrome互換性テスト: FAIL - {str(e)}')
     
     def evaluate_overall_status(self):
         """総合ステータス評価"""
-        passed_tests = sum(1 for test in self.results['tests'].values() if test['status'] == 'PASS')
-        partial_tests = sum(1 for test in self.results['tests'].values() if test['status'] == 'PARTIAL')
-        total_tests = len(self.results['tests'])
+        # テスト結果のスナップショットを1回だけ取得（レポート出力でも再利用）
+        self._tests_snapshot = list(self.results['tests'].items())
+        status_counts = Counter(test['status'] for _, test in self._tests_snapshot)
+        passed_tests = status_counts['PASS']
+        partial_tests = status_counts['PARTIAL']
+        total_tests = sum(status_counts.values())
         
         if passed_tests == total_tests:
             self.results['overall_status'] = 'FULL_PASS'
@@ -556,46 +613,52 @@ class Phase1VerificationTestFixed:
         self.results['test_summary'] = {
             'passed': passed_tests,
             'partial': partial_tests,
+            'failed': status_counts['FAIL'],
             'total': total_tests,
             'pass_rate': (passed_tests + partial_tests * 0.5) / total_tests if total_tests > 0 else 0
         }
     
     async def generate_verification_report(self):
         """検証レポート生成"""
-        print('\n' + '=' * 70)
-        print('📊 Phase 1検証結果サマリー（修正版）')
-        print('=' * 70)
+        # レポートファイル保存はサマリー出力と並行してスレッドで実行（WSL上の/mnt/c書き込み待ちを隠蔽）
+        report_path = '/mnt/c/Users/tky99/DEV/izumi-novels-workflow/reports/phase1_verification_report_fixed.json'
+        write_task = asyncio.create_task(asyncio.to_thread(self._write_report, report_path))
+        
+        self._log.append('\n' + '=' * 70)
+        self._log.append('📊 Phase 1検証結果サマリー（修正版）')
+        self._log.append('=' * 70)
         
         summary = self.results['test_summary']
-        print(f"総合ステータス: {self.results['overall_status']}")
-        print(f"テスト合格率: {summary['passed']}/{summary['total']} ({summary['pass_rate']:.1%})")
+        self._log.append(f"総合ステータス: {self.results['overall_status']}")
+        self._log.append(f"テスト合格率: {summary['passed']}/{summary['total']} ({summary['pass_rate']:.1%})")
         if summary.get('partial', 0) > 0:
-            print(f"部分的合格: {summary['partial']}個")
+            self._log.append(f"部分的合格: {summary['partial']}個")
         
-        print(f"\n📋 テスト詳細:")
-        for test_name, test_result in self.results['tests'].items():
-            if test_result['status'] == 'PASS':
-                status_icon = '✅'
-            elif test_result['status'] == 'PARTIAL':
-                status_icon = '⚠️'
-            else:
-                status_icon = '❌'
-            print(f"  {status_icon} {test_name}: {test_result['status']}")
+        self._log.append(f"\n📋 テスト詳細:")
+        for test_name, test_result in self._tests_snapshot:
+            status_icon = STATUS_ICONS.get(test_result['status'], '❌')
+            self._log.append(f"  {status_icon} {test_name}: {test_result['status']}")
         
         # 結果判定
         if self.results['overall_status'] in ['FULL_PASS', 'MOSTLY_PASS']:
-            print(f"\n🎉 Phase 1実装品質: 高品質")
-            print(f"💡 推奨: Windows環境での実機テスト進行")
+            self._log.append(f"\n🎉 Phase 1実装品質: 高品質")
+            self._log.append(f"💡 推奨: Windows環境での実機テスト進行")
         else:
-            print(f"\n⚠️  Phase 1実装品質: 改善必要")
-            print(f"💡 推奨: 実装修正後再検証")
-        
-        # レポートファイル保存
-        report_path = '/mnt/c/Users/tky99/DEV/izumi-novels-workflow/reports/phase1_verification_report_fixed.json'
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, ensure_ascii=False, indent=2)
+            self._log.append(f"\n⚠️  Phase 1実装品質: 改善必要")
+            self._log.append(f"💡 推奨: 実装修正後再検証")
         
-        print(f"\n📄 詳細レポート保存: {report_path}")
+        self._flush_log()
+        await write_task
+        self._log.append(f"\n📄 詳細レポート保存: {report_path}")
+    
+    def _write_report(self, report_path: str):
+        """レポートファイル保存（同期処理、スレッドから呼び出し）"""
+        if orjson is not None:
+            with open(report_path, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_path, 'w', encoding='utf-8') as f:
+                json.dump(self.results, f, ensure_ascii=False, indent=2)
 
 async def main():
     """メイン検証実行"""
@@ -7,14 +7,53 @@ import asyncio
 import sys
 import os
 import json
-from typing import Dict, Any
+import shutil
+from collections import Counter
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson未導入時は標準jsonで出力
+    orjson = None
+
 # Windows環境用パス設定
 project_root = Path(__file__).parent
 sys.path.append(str(project_root / 'src'))
 
+# インポート互換性テストの対象（モジュール名 → 表示名）
+REQUIRED_MODULES = {
+    'undetected_chromedriver': 'undetected_chromedriver',
+    'selenium': 'selenium',
+    'requests': 'requests',
+    'bs4': 'BeautifulSoup',
+}
+
+# Chrome実行ファイルの既定インストール先
+CHROME_PATHS = (
+    r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+)
+
+@lru_cache(maxsize=1)
+def _find_chrome() -> Optional[str]:
+    """Chrome実行ファイルの検出（プロセス内で1回だけ実行）"""
+    for path in CHROME_PATHS:
+        if os.path.isfile(path):
+            return path
+    return shutil.which('chrome')
+
+def _subdirectories(path: Path) -> set:
+    """直下のディレクトリ名一覧（scandirのDirEntryキャッシュでstatを省略）"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
 class Phase1VerificationWindows:
     """Phase 1検証テストクラス（Windows版）"""
     
@@ -35,11 +74,14 @@ class Phase1VerificationWindows:
         print('🚀 Phase 1高度ブラウザ自動化スクレイパー 包括検証開始（Windows版）')
         print('=' * 70)
         
-        # テスト実行
-        await self.test_import_compatibility()
-        await self.test_basic_functionality()
-        await self.test_chrome_compatibility()
-        await self.test_module_structure()
+        # テスト実行（互いに独立しているため並行実行、各テストは別キーに結果を記録）
+        await asyncio.gather(
+            self.test_import_compatibility(),
+            self.test_basic_functionality(),
+            self.test_chrome_compatibility(),
+            self.test_module_structure(),
+            return_exceptions=True
+        )
         
         # 総合判定
         self.evaluate_overall_status()
@@ -53,30 +95,22 @@ class Phase1VerificationWindows:
     async def test_import_compatibility(self):
         """インポート互換性テスト"""
         print('\n--- インポート互換性テスト ---')
-        try:
-            # 基本的なライブラリのテスト
-            import undetected_chromedriver
-            import selenium
-            import requests
-            from bs4 import BeautifulSoup
-            
+        # モジュールを実行せず、存在のみ確認（find_specはローダー解決のみ）
+        missing = [name for name in REQUIRED_MODULES if find_spec(name) is None]
+        
+        if not missing:
             self.results['tests']['import_compatibility'] = {
                 'status': 'PASS',
                 'message': 'Windows環境で基本ライブラリのインポート成功',
-                'details': [
-                    'undetected_chromedriver: OK',
-                    'selenium: OK', 
-                    'requests: OK',
-                    'BeautifulSoup: OK'
-                ]
+                'details': [f'{label}: OK' for label in REQUIRED_MODULES.values()]
             }
             print('✅ インポート互換性テスト: PASS')
-        except Exception as e:
+        else:
             self.results['tests']['import_compatibility'] = {
                 'status': 'FAIL',
-                'message': f'インポートエラー: {e}'
+                'message': f'インポートエラー: 未導入 {missing}'
             }
-            print(f'❌ インポート互換性テスト: FAIL - {e}')
+            print(f'❌ インポート互換性テスト: FAIL - 未導入 {missing}')
     
     async def test_basic_functionality(self):
         """基本機能テスト"""
@@ -110,18 +144,8 @@ class Phase1VerificationWindows:
         print('\n--- Chrome互換性テスト ---')
         try:
             # Chrome実行ファイルの確認
-            chrome_paths = [
-                r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-                r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
-            ]
-            
-            chrome_found = False
-            chrome_path = None
-            for path in chrome_paths:
-                if Path(path).exists():
-                    chrome_found = True
-                    chrome_path = path
-                    break
+            chrome_path = _find_chrome()
+            chrome_found = chrome_path is not None
             
             self.results['tests']['chrome_compatibility'] = {
                 'status': 'PASS' if chrome_found else 'FAIL',
@@ -150,27 +174,25 @@ class Phase1VerificationWindows:
         """モジュール構造テスト"""
         print('\n--- モジュール構造テスト ---')
         try:
-            # プロジェクト構造の確認
-            src_dir = project_root / 'src'
-            scrapers_dir = src_dir / 'scrapers' 
+            # プロジェクト構造の確認（各階層を1回のscandirで確認）
+            src_ok = 'src' in _subdirectories(project_root)
+            scrapers_ok = src_ok and 'scrapers' in _subdirectories(project_root / 'src')
             
-            structure_ok = True
+            structure_ok = src_ok and scrapers_ok
             missing_items = []
             
-            if not src_dir.exists():
-                structure_ok = False
+            if not src_ok:
                 missing_items.append('src directory')
                 
-            if not scrapers_dir.exists():
-                structure_ok = False
+            if not scrapers_ok:
                 missing_items.append('scrapers directory')
             
             self.results['tests']['module_structure'] = {
                 'status': 'PASS' if structure_ok else 'PARTIAL',
                 'message': 'プロジェクト構造確認完了',
                 'details': {
-                    'src_directory': src_dir.exists(),
-                    'scrapers_directory': scrapers_dir.exists(),
+                    'src_directory': src_ok,
+                    'scrapers_directory': scrapers_ok,
                     'missing_items': missing_items
                 }
             }
@@ -189,11 +211,9 @@ class Phase1VerificationWindows:
     
     def evaluate_overall_status(self):
         """総合ステータス評価"""
-        passed = sum(1 for test in self.results['tests'].values() 
-                    if test['status'] == 'PASS')
-        partial = sum(1 for test in self.results['tests'].values() 
-                     if test['status'] == 'PARTIAL')
-        total = len(self.results['tests'])
+        counts = Counter(test['status'] for test in self.results['tests'].values())
+        passed, partial = counts['PASS'], counts['PARTIAL']
+        total = sum(counts.values())
         
         if passed == total:
             self.results['overall_status'] = 'EXCELLENT'
@@ -216,8 +236,12 @@ class Phase1VerificationWindows:
         report_path = self.report_dir / 'phase1_verification_windows.json'
         
         try:
-            with open(report_path, 'w', encoding='utf-8') as f:
-                json.dump(self.results, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(self.results, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.results, ensure_ascii=False, indent=2).encode('utf-8')
+            # ファイル書き込みはスレッドで実行（イベントループを塞がない）
+            await asyncio.to_thread(report_path.write_bytes, payload)
             
             print(f'📄 詳細レポート保存: {report_path}')
         except Exception as e:
@@ -5,8 +5,39 @@ Configuration Database Quick Validation Test
 """
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson未導入時は標準jsonで読み込み
+    orjson = None
+
+# 11サイト定義（CLAUDE.mdから）
+EXPECTED_SITES = (
+    ("amazon", "Amazon"),
+    ("bookwalker", "BOOK☆WALKER"),
+    ("ebookjapan", "ebookjapan"),
+    ("rakuten_kobo", "楽天Kobo"),
+    ("booklive", "BookLive!"),
+    ("honto", "honto"),
+    ("kinoppy", "Kinoppy"),
+    ("apple_books", "Apple Books"),
+    ("google_play_books", "Google Play Books"),
+    ("reader_store", "Reader Store"),
+    ("amazon_pod", "Amazon POD (印刷版)")
+)
+
+# 品質検証の必須項目（メッセージの順序を保つためタプル、判定はdictのキー検索）
+REQUIRED_FIELDS = ("name", "base_url", "selectors")
+REQUIRED_SELECTORS = ("search_input", "search_results")
+
+@lru_cache(maxsize=4)
+def _load_config(path: str, mtime: float) -> dict:
+    """設定ファイル読み込み（パスと更新時刻が同じなら再パースしない）"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 def test_config_validation():
     """設定ファイルの包括的検証"""
     print("🔍 IzumiNovels-Workflow 設定データベース検証開始")
@@ -19,27 +50,11 @@ def test_config_validation():
         return False
     
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = _load_config(str(config_path), config_path.stat().st_mtime)
     except Exception as e:
         print(f"❌ 設定ファイル読み込みエラー: {e}")
         return False
     
-    # 11サイト定義（CLAUDE.mdから）
-    expected_sites = [
-        ("amazon", "Amazon"),
-        ("bookwalker", "BOOK☆WALKER"),
-        ("ebookjapan", "ebookjapan"),
-        ("rakuten_kobo", "楽天Kobo"),
-        ("booklive", "BookLive!"),
-        ("honto", "honto"),
-        ("kinoppy", "Kinoppy"),
-        ("apple_books", "Apple Books"),
-        ("google_play_books", "Google Play Books"),
-        ("reader_store", "Reader Store"),
-        ("amazon_pod", "Amazon POD (印刷版)")
-    ]
-    
     sites = config.get("sites", {})
     
     print("📋 11サイト設定状況確認:")
@@ -47,57 +62,50 @@ def test_config_validation():
     
     success_count = 0
     total_selectors = 0
-    
-    for i, (site_id, site_name) in enumerate(expected_sites, 1):
-        if site_id in sites:
-            site_config = sites[site_id]
-            name = site_config.get("name", "不明")
-            selectors = site_config.get("selectors", {})
-            
-            # セレクタカウント
-            selector_count = sum(len(v) if isinstance(v, list) else 1 
-                               for v in selectors.values())
-            total_selectors += selector_count
-            
-            print(f"{i:2d}. ✅ {name:<20} ({site_id}) - {selector_count}個のセレクタ")
-            success_count += 1
-        else:
-            print(f"{i:2d}. ❌ {site_name:<20} ({site_id}) - 設定なし")
-    
-    # 統計情報
-    completion_rate = success_count / len(expected_sites) * 100
-    print("\n" + "=" * 60)
-    print("📊 設定データベース統計:")
-    print(f"   ✅ 設定完了サイト: {success_count}/11 ({completion_rate:.1f}%)")
-    print(f"   🎯 総セレクタ数: {total_selectors}個")
-    
-    # 必須フィールド検証
-    print("\n🔧 設定品質検証:")
     quality_issues = []
+    out = []  # サイト別の行はまとめて1回で出力
     
-    for site_id, site_name in expected_sites:
-        if site_id not in sites:
+    # 1パスで設定状況・セレクタ数・品質問題を集計
+    for i, (site_id, site_name) in enumerate(EXPECTED_SITES, 1):
+        site_config = sites.get(site_id)
+        if site_config is None:
+            out.append(f"{i:2d}. ❌ {site_name:<20} ({site_id}) - 設定なし")
             continue
-            
-        site_config = sites[site_id]
+        
+        name = site_config.get("name", "不明")
+        selectors = site_config.get("selectors", {})
+        
+        # セレクタカウント
+        selector_count = sum(len(v) if isinstance(v, list) else 1 
+                           for v in selectors.values())
+        total_selectors += selector_count
+        
+        out.append(f"{i:2d}. ✅ {name:<20} ({site_id}) - {selector_count}個のセレクタ")
+        success_count += 1
         
         # 必須フィールドチェック
-        required_fields = ["name", "base_url", "selectors"]
-        missing_fields = [field for field in required_fields 
+        missing_fields = [field for field in REQUIRED_FIELDS 
                          if field not in site_config]
-        
         if missing_fields:
             quality_issues.append(f"{site_id}: 欠落フィールド {missing_fields}")
         
         # セレクタ品質チェック
-        selectors = site_config.get("selectors", {})
-        required_selectors = ["search_input", "search_results"]
-        missing_selectors = [sel for sel in required_selectors 
+        missing_selectors = [sel for sel in REQUIRED_SELECTORS 
                            if sel not in selectors]
-        
         if missing_selectors:
             quality_issues.append(f"{site_id}: 欠落セレクタ {missing_selectors}")
     
+    sys.stdout.write('\n'.join(out) + '\n')
+    
+    # 統計情報
+    completion_rate = success_count / len(EXPECTED_SITES) * 100
+    print("\n" + "=" * 60)
+    print("📊 設定データベース統計:")
+    print(f"   ✅ 設定完了サイト: {success_count}/11 ({completion_rate:.1f}%)")
+    print(f"   🎯 総セレクタ数: {total_selectors}個")
+    
+    # 必須フィールド検証
+    print("\n🔧 設定品質検証:")
     if quality_issues:
         print("   ⚠️ 品質問題:")
         for issue in quality_issues:
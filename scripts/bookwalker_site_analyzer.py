@@ -3,124 +3,275 @@
 BOOK☆WALKER サイト構造解析ツール
 実際のHTML構造、API呼び出し、動的コンテンツを徹底調査
 """
+import argparse
 import asyncio
-import requests
+import httpx
 import json
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from itertools import chain, islice
 from urllib.parse import quote, urljoin
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 
+try:
+    import lxml  # noqa: F401  (C実装パーサー)
+    HTML_PARSER = 'lxml'
+except ImportError:  # lxml未導入時は標準パーサーにフォールバック
+    HTML_PARSER = 'html.parser'
+
+try:
+    import hishel
+except ImportError:  # hishel未導入時はキャッシュなしで取得
+    hishel = None
+
+try:
+    import orjson
+except ImportError:  # orjson未導入時は標準jsonで入出力
+    orjson = None
+
 # プロジェクトルートをパスに追加
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# 開発中の再実行用HTTPキャッシュ（--no-cache で無効化）
+HTTP_CACHE_DIR = project_root / '.http_cache'
+HTTP_CACHE_TTL = 3600  # 秒
+
 # ログ設定  
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _bounded_text(node, limit):
+    """要素のテキストを先頭から上限文字数分だけ取得（全文連結を回避）"""
+    parts = []
+    length = 0
+    for text in node.stripped_strings:
+        parts.append(text)
+        length += len(text)
+        if length >= limit:
+            break
+    return ''.join(parts)[:limit]
+
+
 class BookWalkerAnalyzer:
     """BOOK☆WALKER サイト構造解析クラス"""
     
     BASE_URL = "https://bookwalker.jp"
     SEARCH_URL = "https://bookwalker.jp/search/"
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        })
+    # タイトルパターンの最大保存件数
+    TITLE_PATTERN_LIMIT = 50
+    
+    # スクリプト解析用の正規表現（ループ内で再コンパイルしない）
+    _API_RE = re.compile(r'["\']([^"\']*(?:api|search|ajax)[^"\']*)["\']')
+    _HAS_SEARCH_RE = re.compile('search', re.IGNORECASE)
+    
+    # 構造解析で参照するタグのみ木構造を構築（配下の要素も含む）
+    _STRUCTURE_STRAINER = SoupStrainer(['title', 'form', 'script'])
+    
+    # 検索結果のセレクタ候補（優先順）
+    _RESULT_SELECTORS = (
+        # 一般的なパターン
+        '.search-result-item',
+        '.search-item',
+        '.book-item',
+        '.product-item',
+        '.result-item',
         
-        # 結果保存
-        self.analysis_results = {
-            'timestamp': datetime.now().isoformat(),
-            'tests': []
-        }
+        # BOOK☆WALKER特有パターン
+        '.c-card-book-list .m-card-book',
+        '.m-card-book',
+        '.c-card-book',
+        '.book-card',
+        '.product-card',
+        
+        # より具体的なパターン
+        'div[data-book-id]',
+        'div[data-product-id]',
+        'article',
+        '.tile',
+        '.grid-item',
+        
+        # リンクベースのパターン
+        'a[href*="/de"]',  # BOOK☆WALKERの書籍URLパターン
+        'a[href*="/series"]',
+        'a[href*="/book"]'
+    )
+    
+    # この件数以上ヒットしたセレクタは結果一覧とみなし、以降の候補は試さない
+    STRONG_MATCH_COUNT = 10
+    
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'max-age=0'
+    }
+    
+    # HTTP/2（多重化・ヘッダー圧縮）で接続を再利用
+    # ※HTTP/2では接続固有ヘッダー（Connection等）は送信不可
+    TIMEOUT = 10.0
+    
+    def __init__(self, use_cache: bool = True):
+        self.use_cache = use_cache and hishel is not None
+        self.client = self._make_client()
+        
+        # ヒットしたセレクタのヒット回数。次回以降はヒット回数の多い順にこれらから試す
+        self._winning_selectors = Counter()
+        
+        # 結果保存（テスト結果は1件ずつNDJSONへ追記し、メモリに溜めない）
+        self.started_at = datetime.now()
+        self._ndjson_path = Path(f"logs/bookwalker_analysis_{self.started_at:%Y%m%d_%H%M%S}.ndjson")
+        self._ndjson = None
+        self.test_count = 0
+        self.success_count = 0
+    
+    def _make_client(self):
+        """同期クライアント生成（キャッシュ有効時はディスクキャッシュを経由）"""
+        transport = httpx.HTTPTransport(http2=True)
+        if self.use_cache:
+            transport = hishel.CacheTransport(
+                transport=transport,
+                storage=hishel.FileStorage(base_path=HTTP_CACHE_DIR, ttl=HTTP_CACHE_TTL),
+                controller=hishel.Controller(force_cache=True)
+            )
+        return httpx.Client(transport=transport, headers=self.HEADERS, timeout=self.TIMEOUT)
+    
+    def _make_async_client(self):
+        """非同期クライアント生成（キャッシュ有効時はディスクキャッシュを経由）"""
+        transport = httpx.AsyncHTTPTransport(http2=True)
+        if self.use_cache:
+            transport = hishel.AsyncCacheTransport(
+                transport=transport,
+                storage=hishel.AsyncFileStorage(base_path=HTTP_CACHE_DIR, ttl=HTTP_CACHE_TTL),
+                controller=hishel.Controller(force_cache=True)
+            )
+        return httpx.AsyncClient(transport=transport, headers=self.HEADERS, timeout=self.TIMEOUT)
+    
+    @staticmethod
+    def _dumps(record) -> bytes:
+        """1件分のJSONエンコード"""
+        if orjson is not None:
+            return orjson.dumps(record)
+        return json.dumps(record, ensure_ascii=False).encode('utf-8')
+    
+    def _record(self, record):
+        """テスト結果1件をNDJSONへ追記"""
+        if self._ndjson is None:
+            self._ndjson = open(self._ndjson_path, 'wb')
+        self._ndjson.write(self._dumps(record) + b'\n')
+        self.test_count += 1
+        if record.get('success'):
+            self.success_count += 1
+    
+    @staticmethod
+    def _decode(response):
+        """本文をヘッダーの文字コード（なければUTF-8）で直接デコード（文字コード推定を回避）"""
+        return response.content.decode(response.charset_encoding or 'utf-8', 'replace')
+    
+    @staticmethod
+    def _flush(lines):
+        """バッファした出力行を1回の書き込みで出力"""
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+            lines.clear()
     
     def analyze_search_page_structure(self):
         """検索ページの基本構造を解析"""
-        print("=== BOOK☆WALKER 検索ページ構造解析 ===")
+        out = []
+        log = out.append
+        log("=== BOOK☆WALKER 検索ページ構造解析 ===")
         
         # 1. 基本検索ページ
-        print("1. 基本検索ページの取得...")
+        log("1. 基本検索ページの取得...")
         try:
-            response = self.session.get(self.SEARCH_URL, timeout=10)
+            response = self.client.get(self.SEARCH_URL)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            html = self._decode(response)
+            soup = BeautifulSoup(html, HTML_PARSER, parse_only=self._STRUCTURE_STRAINER)
             
             # 基本情報
-            print(f"   ステータス: {response.status_code}")
-            print(f"   タイトル: {soup.title.get_text(strip=True) if soup.title else 'N/A'}")
-            print(f"   HTML長: {len(response.text):,} 文字")
+            log(f"   ステータス: {response.status_code}")
+            log(f"   タイトル: {soup.title.get_text(strip=True) if soup.title else 'N/A'}")
+            log(f"   HTML長: {len(html):,} 文字")
             
             # フォーム要素の調査
-            print("\n2. 検索フォーム解析...")
+            log("\n2. 検索フォーム解析...")
             forms = soup.find_all('form')
             for i, form in enumerate(forms):
-                print(f"   フォーム {i+1}:")
-                print(f"     action: {form.get('action', 'N/A')}")
-                print(f"     method: {form.get('method', 'GET')}")
+                log(f"   フォーム {i+1}:")
+                log(f"     action: {form.get('action', 'N/A')}")
+                log(f"     method: {form.get('method', 'GET')}")
                 
                 inputs = form.find_all(['input', 'select'])
                 for inp in inputs:
-                    print(f"     - {inp.name}: {inp.get('name', 'N/A')} (type: {inp.get('type', 'N/A')})")
+                    log(f"     - {inp.name}: {inp.get('name', 'N/A')} (type: {inp.get('type', 'N/A')})")
             
             # JavaScript分析
-            print("\n3. JavaScript/動的コンテンツ調査...")
+            log("\n3. JavaScript/動的コンテンツ調査...")
             scripts = soup.find_all('script')
             api_patterns = []
             
             for script in scripts:
-                if script.string:
-                    # API エンドポイントの検索
-                    api_matches = re.findall(r'["\']([^"\']*(?:api|search|ajax)[^"\']*)["\']', script.string)
-                    api_patterns.extend(api_matches)
-                    
-                    # 検索関連の関数
-                    if 'search' in script.string.lower():
-                        print(f"     検索関連JS発見: {len(script.string)} 文字")
+                body = script.string
+                if not body:
+                    continue
+                
+                # API エンドポイントの検索
+                api_patterns.extend(self._API_RE.findall(body))
+                
+                # 検索関連の関数
+                if self._HAS_SEARCH_RE.search(body):
+                    log(f"     検索関連JS発見: {len(body)} 文字")
             
+            # 出現順を保ったまま重複除去
+            api_patterns = list(dict.fromkeys(api_patterns))
             if api_patterns:
-                print(f"   発見されたAPI候補: {len(set(api_patterns))}件")
-                for pattern in set(api_patterns)[:5]:  # 上位5つ
-                    print(f"     - {pattern}")
+                log(f"   発見されたAPI候補: {len(api_patterns)}件")
+                for pattern in api_patterns[:5]:  # 上位5つ
+                    log(f"     - {pattern}")
             
-            self.analysis_results['tests'].append({
+            self._record({
                 'test': 'basic_page_structure',
                 'success': True,
                 'data': {
                     'status_code': response.status_code,
                     'forms_count': len(forms),
                     'scripts_count': len(scripts),
-                    'api_patterns': list(set(api_patterns))
+                    'api_patterns': api_patterns
                 }
             })
             
         except Exception as e:
-            print(f"   エラー: {e}")
-            self.analysis_results['tests'].append({
+            log(f"   エラー: {e}")
+            self._record({
                 'test': 'basic_page_structure',
                 'success': False,
                 'error': str(e)
             })
+        finally:
+            self._flush(out)
+    
+    async def _fetch_search(self, client, params):
+        """検索ページ取得（ステータスコードと本文を返す）"""
+        response = await client.get(self.SEARCH_URL, params=params)
+        return response.status_code, self._decode(response)
     
-    def test_search_queries(self):
-        """様々な検索クエリのテスト"""
+    async def test_search_queries(self):
+        """様々な検索クエリのテスト（パラメータパターンは並行取得）"""
         print("\n=== 検索クエリテスト ===")
         
         test_queries = [
@@ -132,92 +283,77 @@ class BookWalkerAnalyzer:
             "パラレイドデイズ"
         ]
         
-        for i, query in enumerate(test_queries, 1):
-            print(f"{i}. クエリテスト: '{query}'")
-            
-            try:
-                # パラメータパターンのテスト
-                param_variations = [
-                    {'word': query},
-                    {'q': query},
-                    {'keyword': query},
-                    {'search': query},
-                    {'word': query, 'order': 'new'},
-                    {'word': query, 'category': 'ebook'}
-                ]
+        async with self._make_async_client() as client:
+            for i, query in enumerate(test_queries, 1):
+                out = [f"{i}. クエリテスト: '{query}'"]  # クエリ単位でまとめて出力
+                log = out.append
                 
-                for j, params in enumerate(param_variations):
-                    response = self.session.get(self.SEARCH_URL, params=params, timeout=10)
+                try:
+                    # パラメータパターンのテスト
+                    param_variations = [
+                        {'word': query},
+                        {'q': query},
+                        {'keyword': query},
+                        {'search': query},
+                        {'word': query, 'order': 'new'},
+                        {'word': query, 'category': 'ebook'}
+                    ]
                     
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # 検索結果の解析
-                        result_analysis = self.analyze_search_results(soup, query)
+                    # 全パターンを並行取得し、先頭から順に判定
+                    outcomes = await asyncio.gather(
+                        *(self._fetch_search(client, params) for params in param_variations),
+                        return_exceptions=True
+                    )
+                    
+                    for j, (params, outcome) in enumerate(zip(param_variations, outcomes)):
+                        if isinstance(outcome, Exception):
+                            log(f"   💥 パラメータ{j+1} エラー: {outcome}")
+                            continue
                         
-                        if result_analysis['found_results']:
-                            print(f"   ✅ パラメータ{j+1} 成功: {params}")
-                            print(f"      結果数: {result_analysis['result_count']}")
-                            print(f"      セレクタ: {result_analysis['successful_selectors']}")
+                        status, text = outcome
+                        if status == 200:
+                            soup = BeautifulSoup(text, HTML_PARSER)
                             
-                            self.analysis_results['tests'].append({
-                                'test': f'search_query_{i}',
-                                'query': query,
-                                'params': params,
-                                'success': True,
-                                'data': result_analysis
-                            })
-                            break
+                            # 検索結果の解析
+                            result_analysis = self.analyze_search_results(soup, query)
+                            
+                            if result_analysis['found_results']:
+                                log(f"   ✅ パラメータ{j+1} 成功: {params}")
+                                log(f"      結果数: {result_analysis['result_count']}")
+                                log(f"      セレクタ: {result_analysis['successful_selectors']}")
+                                
+                                self._record({
+                                    'test': f'search_query_{i}',
+                                    'query': query,
+                                    'params': params,
+                                    'success': True,
+                                    'data': result_analysis
+                                })
+                                break
+                            else:
+                                log(f"   ❌ パラメータ{j+1} 結果なし: {params}")
                         else:
-                            print(f"   ❌ パラメータ{j+1} 結果なし: {params}")
-                    else:
-                        print(f"   ❌ パラメータ{j+1} HTTPエラー: {response.status_code}")
-                
-                # 間隔を空ける
-                if i < len(test_queries):
-                    print("   待機中...")
-                    import time
-                    time.sleep(2)
+                            log(f"   ❌ パラメータ{j+1} HTTPエラー: {status}")
                     
-            except Exception as e:
-                print(f"   💥 エラー: {e}")
-                self.analysis_results['tests'].append({
-                    'test': f'search_query_{i}',
-                    'query': query,
-                    'success': False,
-                    'error': str(e)
-                })
+                    # 間隔を空ける
+                    if i < len(test_queries):
+                        log("   待機中...")
+                        self._flush(out)
+                        await asyncio.sleep(2)
+                        
+                except Exception as e:
+                    log(f"   💥 エラー: {e}")
+                    self._record({
+                        'test': f'search_query_{i}',
+                        'query': query,
+                        'success': False,
+                        'error': str(e)
+                    })
+                finally:
+                    self._flush(out)
     
     def analyze_search_results(self, soup, query):
         """検索結果ページの詳細解析"""
-        result_selectors = [
-            # 一般的なパターン
-            '.search-result-item',
-            '.search-item',
-            '.book-item',
-            '.product-item',
-            '.result-item',
-            
-            # BOOK☆WALKER特有パターン
-            '.c-card-book-list .m-card-book',
-            '.m-card-book',
-            '.c-card-book',
-            '.book-card',
-            '.product-card',
-            
-            # より具体的なパターン
-            'div[data-book-id]',
-            'div[data-product-id]',
-            'article',
-            '.tile',
-            '.grid-item',
-            
-            # リンクベースのパターン
-            'a[href*="/de"]',  # BOOK☆WALKERの書籍URLパターン
-            'a[href*="/series"]',
-            'a[href*="/book"]'
-        ]
-        
         analysis = {
             'found_results': False,
             'result_count': 0,
@@ -226,8 +362,14 @@ class BookWalkerAnalyzer:
             'title_patterns': []
         }
         
-        # 各セレクタをテスト
-        for selector in result_selectors:
+        seen_hrefs = set()
+        
+        # 各セレクタをテスト（前回までにヒットしたセレクタをヒット回数の多い順に優先）
+        selectors = chain(
+            [sel for sel, _ in self._winning_selectors.most_common()],
+            (sel for sel in self._RESULT_SELECTORS if sel not in self._winning_selectors)
+        )
+        for selector in selectors:
             try:
                 elements = soup.select(selector)
                 if elements:
@@ -239,20 +381,34 @@ class BookWalkerAnalyzer:
                     analysis['found_results'] = True
                     analysis['result_count'] = max(analysis['result_count'], len(elements))
                     
-                    # 各要素から詳細情報を抽出
+                    self._winning_selectors[selector] += 1
+                    
+                    # 各要素から詳細情報を抽出（解析済みのリンク先はスキップ）
                     for element in elements[:3]:  # 上位3つを詳細分析
+                        first_link = element if element.name == 'a' else element.find('a', href=True)
+                        href = first_link.get('href') if first_link else None
+                        if href:
+                            if href in seen_hrefs:
+                                continue
+                            seen_hrefs.add(href)
+                        
                         link_info = self.extract_element_info(element)
                         if link_info:
                             analysis['all_links'].append(link_info)
+                    
+                    if len(elements) >= self.STRONG_MATCH_COUNT:
+                        break
                             
             except Exception as e:
                 print(f"     セレクタエラー {selector}: {e}")
         
-        # タイトルパターンの抽出
-        all_text_elements = soup.find_all(text=True)
-        for text in all_text_elements:
-            if query.lower() in text.lower() and len(text.strip()) > 5:
-                analysis['title_patterns'].append(text.strip()[:100])
+        # タイトルパターンの抽出（ページ全文を1回だけ走査し、前後の文脈を保存）
+        query_pattern = re.compile(re.escape(query), re.IGNORECASE)
+        full_text = soup.get_text(' ', strip=True)
+        analysis['title_patterns'] = [
+            full_text[max(0, m.start() - 20):m.start() + 100]
+            for m in islice(query_pattern.finditer(full_text), self.TITLE_PATTERN_LIMIT)
+        ]
         
         return analysis
     
@@ -261,7 +417,7 @@ class BookWalkerAnalyzer:
         info = {
             'tag': element.name,
             'classes': element.get('class', []),
-            'text': element.get_text(strip=True)[:200],
+            'text': _bounded_text(element, 200),
             'links': []
         }
         
@@ -276,7 +432,7 @@ class BookWalkerAnalyzer:
                 
                 info['links'].append({
                     'href': href,
-                    'text': link.get_text(strip=True)[:100]
+                    'text': _bounded_text(link, 100)
                 })
         
         return info if (info['text'] or info['links']) else None
@@ -301,34 +457,42 @@ class BookWalkerAnalyzer:
             'keyword': 'ソードアート・オンライン'
         }
         
-        for endpoint in api_endpoints:
+        def probe(endpoint):
+            """エンドポイント1件のGET（例外は結果として返す）"""
+            try:
+                return self.client.get(f"{self.BASE_URL}{endpoint}", params=test_params)
+            except Exception as e:
+                return e
+        
+        # 全エンドポイントを並行取得（httpx.Clientはスレッド間で共有可能）
+        with ThreadPoolExecutor(max_workers=len(api_endpoints)) as executor:
+            responses = list(executor.map(probe, api_endpoints))
+        
+        for endpoint, response in zip(api_endpoints, responses):
             print(f"API テスト: {self.BASE_URL}{endpoint}")
             
             try:
-                # GET リクエスト
-                response = self.session.get(
-                    f"{self.BASE_URL}{endpoint}",
-                    params=test_params,
-                    timeout=10
-                )
+                if isinstance(response, Exception):
+                    raise response
                 
                 if response.status_code == 200:
                     content_type = response.headers.get('content-type', '')
                     
                     if 'json' in content_type:
                         try:
-                            data = response.json()
+                            data = (orjson.loads(response.content) if orjson is not None
+                                    else json.loads(response.content))
                             print(f"   ✅ JSON API発見!")
                             print(f"      キー: {list(data.keys()) if isinstance(data, dict) else 'Not dict'}")
                             
-                            self.analysis_results['tests'].append({
+                            self._record({
                                 'test': 'api_discovery',
                                 'endpoint': endpoint,
                                 'success': True,
                                 'content_type': content_type,
                                 'data_keys': list(data.keys()) if isinstance(data, dict) else None
                             })
-                        except json.JSONDecodeError:
+                        except ValueError:  # json/orjsonのJSONDecodeErrorはともにValueError派生
                             print(f"   ❌ JSON解析エラー")
                     else:
                         print(f"   ⚠️  非JSON応答: {content_type}")
@@ -342,20 +506,32 @@ class BookWalkerAnalyzer:
                 print(f"   💥 エラー: {e}")
     
     def save_analysis_results(self):
-        """解析結果をファイルに保存"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = f"logs/bookwalker_analysis_{timestamp}.json"
+        """解析結果をファイルに保存（NDJSONを1行ずつ読み、1つのJSONに結合）"""
+        output_file = self._ndjson_path.with_suffix('.json')
+        
+        if self._ndjson is not None:
+            self._ndjson.close()
+            self._ndjson = None
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(self.analysis_results, f, ensure_ascii=False, indent=2)
+        with open(output_file, 'wb') as out:
+            out.write(b'{"timestamp":' + self._dumps(self.started_at.isoformat()) + b',"tests":[')
+            if self._ndjson_path.exists():
+                with open(self._ndjson_path, 'rb') as lines:
+                    for i, line in enumerate(lines):
+                        if i:
+                            out.write(b',')
+                        out.write(line.rstrip(b'\n'))
+            out.write(b']}\n')
+        self._ndjson_path.unlink(missing_ok=True)
         
         print(f"\n📄 解析結果を保存: {output_file}")
-        return output_file
+        return str(output_file)
     
     def run_full_analysis(self):
         """完全解析の実行"""
         print("🔍 BOOK☆WALKER 完全サイト解析開始")
         print(f"開始時刻: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"HTTPキャッシュ: {'有効' if self.use_cache else '無効'}")
         print("=" * 60)
         
         try:
@@ -363,7 +539,7 @@ class BookWalkerAnalyzer:
             self.analyze_search_page_structure()
             
             # 2. 検索クエリテスト
-            self.test_search_queries()
+            asyncio.run(self.test_search_queries())
             
             # 3. API発見テスト
             self.test_direct_api_calls()
@@ -375,22 +551,30 @@ class BookWalkerAnalyzer:
             print("✅ 解析完了")
             
             # サマリー表示
-            successful_tests = [t for t in self.analysis_results['tests'] if t.get('success')]
-            print(f"成功テスト: {len(successful_tests)}/{len(self.analysis_results['tests'])}")
+            print(f"成功テスト: {self.success_count}/{self.test_count}")
             
             return output_file
             
         except Exception as e:
             print(f"💥 解析中にエラー: {e}")
             return None
+        finally:
+            self.client.close()
+            if self._ndjson is not None:
+                self._ndjson.close()
 
 
 def main():
     """メイン処理"""
+    parser = argparse.ArgumentParser(description='BOOK☆WALKER サイト構造解析')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='HTTPキャッシュを使わず常にサイトから取得')
+    args = parser.parse_args()
+    
     # ログディレクトリ作成
     Path('logs').mkdir(exist_ok=True)
     
-    analyzer = BookWalkerAnalyzer()
+    analyzer = BookWalkerAnalyzer(use_cache=not args.no_cache)
     result_file = analyzer.run_full_analysis()
     
     if result_file:
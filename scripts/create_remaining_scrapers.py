@@ -15,11 +15,17 @@ ebookjapan・BookLiveの成功パターンを適用
 import asyncio
 import re
 import logging
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, ClassVar, Mapping
 from urllib.parse import quote
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, Tag
 
-from .requests_scraper import RequestsScraper
+from .requests_scraper import RequestsScraper, HTML_PARSER
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax未導入時は事前判定を省略
+    LexborHTMLParser = None
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +37,58 @@ class HontoScraper(RequestsScraper):
     BASE_URL = "https://honto.jp"
     SEARCH_URL = "https://honto.jp/netstore/search.html"
     
+    # 検索戦略の並行数・開始間隔（秒）と同一サイトへの同時リクエスト数
+    PARALLEL_STRATEGIES = 3
+    STRATEGY_START_INTERVAL = 0.3
+    SITE_CONCURRENCY = 3
+    
+    # 書籍リンクから祖先をたどってコンテナとみなすタグと探索階層数
+    CONTAINER_TAGS = frozenset(('article', 'div', 'li'))
+    CONTAINER_MAX_DEPTH = 3
+    
+    # 書籍カードとみなすクラス名の部分文字列（旧カードセレクタ相当）とカードの探索階層数
+    CARD_CLASS_PARTS = ('book', 'item', 'product', 'card')
+    CARD_MAX_DEPTH = 6
+    
+    # タイトル候補テキストの長さ範囲と、探索を打ち切る十分な長さ
+    TITLE_TEXT_MIN = 5
+    TITLE_TEXT_MAX = 300
+    TITLE_TEXT_ENOUGH = 50
+    
+    # タイトル候補から除外する語
+    _TITLE_BLOCK_RE = re.compile(r'見る|more|詳細|javascript|function', re.IGNORECASE)
+    
+    # 丸数字（①〜⑤）の検出・数字化テーブルと巻数表記バリエーション
+    _CIRCLE_RE = re.compile('[①-⑤]')
+    _CIRCLE_TRANS = str.maketrans('①②③④⑤', '12345')
+    _CIRCLE_VARIANTS = {
+        circle: (str(n), f'第{n}巻', f'({n})', f' {n}', chr(0xFF10 + n))
+        for n, circle in enumerate('①②③④⑤', 1)
+    }
+    
+    # シリーズ名抽出で除去する巻数・装飾表記
+    _SERIES_STRIP_RE = re.compile(
+        r'[①-⑳]|第\\d+巻|\\d+巻|\\(\\d+\\)|[１２３４５６７８９０]+|[上中下]|前編|後編|完結編|【[^】]*】'
+    )
+    
+    # 書籍詳細ページへのリンク
+    BOOK_LINK_SELECTOR = 'a[href*="/ebook/"]'
+    
+    # honto用ヘッダー（リクエストごとに辞書を生成しない）
+    _HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'max-age=0'
+    })
+    
     def __init__(self, timeout: int = 10, max_retries: int = 3):
         super().__init__(timeout, max_retries, delay_between_requests=1.0)
         
@@ -78,41 +136,21 @@ class HontoScraper(RequestsScraper):
     
     def _create_volume_variants_honto(self, title: str) -> List[str]:
         """巻数バリエーション生成"""
-        variants = []
-        
-        # 丸数字マッピング
-        circle_to_variants = {
-            '①': ['1', '第1巻', '(1)', ' 1', '１'],
-            '②': ['2', '第2巻', '(2)', ' 2', '２'],
-            '③': ['3', '第3巻', '(3)', ' 3', '３'],
-            '④': ['4', '第4巻', '(4)', ' 4', '４'],
-            '⑤': ['5', '第5巻', '(5)', ' 5', '５'],
-        }
+        circles = sorted(set(self._CIRCLE_RE.findall(title)))
+        if not circles:
+            return []
         
-        for circle, replacements in circle_to_variants.items():
-            if circle in title:
-                for replacement in replacements:
-                    variants.append(title.replace(circle, replacement))
+        # 全丸数字を1パスで数字化したものを第一候補に、丸数字ごとの表記違いを追加
+        variants = [title.translate(self._CIRCLE_TRANS)]
+        for circle in circles:
+            variants.extend(title.replace(circle, replacement)
+                            for replacement in self._CIRCLE_VARIANTS[circle])
         
-        return variants
+        return list(dict.fromkeys(variants))
     
     def _extract_series_name(self, title: str) -> str:
-        """シリーズ名の抽出"""  
-        patterns = [
-            r'[①-⑳]',
-            r'第\\d+巻',
-            r'\\d+巻',
-            r'\\(\\d+\\)',
-            r'[１２３４５６７８９０]+',
-            r'[上中下]',
-            r'前編|後編|完結編',
-            r'【[^】]*】',
-        ]
-        
-        series_name = title
-        for pattern in patterns:
-            series_name = re.sub(pattern, '', series_name).strip()
-        
+        """シリーズ名の抽出（巻数・装飾表記を1パスで除去）"""
+        series_name = self._SERIES_STRIP_RE.sub('', title).strip()
         return series_name if series_name else title
     
     async def _search_impl(self, book_title: str, n_code: str) -> Optional[str]:
@@ -120,15 +158,27 @@ class HontoScraper(RequestsScraper):
         try:
             search_strategies = self._get_search_strategies(book_title, n_code)
             
-            for i, strategy in enumerate(search_strategies, 1):
-                logger.debug(f"検索戦略 {i}/{len(search_strategies)}: {strategy['description']} - '{strategy['query']}'")
-                
-                url = await self._try_search_strategy(strategy)
-                if url:
-                    return url
-                
-                if i < len(search_strategies):
-                    await asyncio.sleep(0.3)
+            # PARALLEL_STRATEGIES件ずつ並行に試行し、最初にURLが得られた時点で残りを取り消す
+            for start in range(0, len(search_strategies), self.PARALLEL_STRATEGIES):
+                batch = search_strategies[start:start + self.PARALLEL_STRATEGIES]
+                tasks = []
+                try:
+                    for i, strategy in enumerate(batch, start + 1):
+                        logger.debug(f"検索戦略 {i}/{len(search_strategies)}: {strategy['description']} - '{strategy['query']}'")
+                        tasks.append(asyncio.create_task(self._try_search_strategy(strategy)))
+                        
+                        # 開始間隔を空ける
+                        if len(tasks) < len(batch):
+                            await asyncio.sleep(self.STRATEGY_START_INTERVAL)
+                    
+                    for future in asyncio.as_completed(tasks):
+                        url = await future
+                        if url:
+                            return url
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
             
             return None
             
@@ -139,10 +189,17 @@ class HontoScraper(RequestsScraper):
     async def _try_search_strategy(self, strategy: Dict[str, Any]) -> Optional[str]:
         """個別検索戦略の実行"""
         try:
-            soup = await self.make_request(self.SEARCH_URL, params=strategy['params'])
-            if not soup:
+            html = await self.make_request_text(self.SEARCH_URL, params=strategy['params'])
+            if not html:
                 return None
             
+            # Lexborで書籍リンクの有無を先に判定（該当なしページではBeautifulSoupの木を構築しない）
+            if LexborHTMLParser is not None and LexborHTMLParser(html).css_first(self.BOOK_LINK_SELECTOR) is None:
+                logger.debug("書籍リンクが見つかりません（事前判定）")
+                return None
+            
+            soup = BeautifulSoup(html, HTML_PARSER)
+            
             # 高度な検索結果抽出
             best_match = await self._advanced_find_best_match(soup, strategy['query'])
             return best_match
@@ -208,59 +265,53 @@ class HontoScraper(RequestsScraper):
             return None
     
     def _find_book_containers(self, soup: BeautifulSoup) -> List[Tag]:
-        """書籍コンテナ要素を発見"""
-        container_selectors = [
-            # honto固有のパターン
-            '.book-item',
-            '.search-result-item',
-            '.book-card',
-            'article',
-            '.item',
-            
-            # より広範囲な検索
-            'div[class*="book"]',
-            'div[class*="item"]',
-            'div[class*="product"]',
-            'div[class*="card"]',
-            
-            # リンクを含む要素の親
-            '*:has(a[href*="/ebook/"])',
-        ]
-        
-        all_containers = []
-        
-        for selector in container_selectors:
-            try:
-                if ':has(' in selector:
-                    # :has() 疑似クラスは手動実装
-                    link_elements = soup.select('a[href*="/ebook/"]')
-                    for link in link_elements:
-                        parent = link.parent
-                        if parent and parent not in all_containers:
-                            all_containers.append(parent)
-                else:
-                    containers = soup.select(selector)
-                    all_containers.extend(containers)
-            except Exception as e:
-                logger.debug(f"セレクタエラー {selector}: {e}")
-                continue
-        
-        # 重複除去とフィルタリング
-        unique_containers = []
+        """書籍コンテナ要素を発見（書籍リンクから祖先をたどる1パス）"""
+        containers = []
         seen = set()
         
-        for container in all_containers:
-            container_id = id(container)
-            if container_id not in seen:
-                # 書籍関連のリンクを含むコンテナのみ保持
-                links = container.find_all('a', href=True)
-                book_links = [link for link in links if '/ebook/' in link.get('href', '')]
-                
-                if book_links:
-                    unique_containers.append(container)
-                    seen.add(container_id)
+        for link in soup.select(self.BOOK_LINK_SELECTOR):
+            container = self._find_card(link)
+            if container is not None and id(container) not in seen:
+                seen.add(id(container))
+                containers.append(container)
         
-        return unique_containers
+        return containers
+    
+    def _find_card(self, link: Tag) -> Optional[Tag]:
+        """
+        書籍リンクを含むカード要素を探す
+        
+        他の書籍へのリンクを含まない範囲で、カードのクラスを持つ最も外側の祖先を優先する
+        見つからなければ直近の article/div/li（それもなければリンクの親要素）を使う
+        """
+        href = link.get('href')
+        card = None
+        fallback = None
+        node = link.parent
+        for depth in range(self.CARD_MAX_DEPTH):
+            if node is None or node.name == '[document]':
+                break
+            if fallback is None and depth < self.CONTAINER_MAX_DEPTH and node.name in self.CONTAINER_TAGS:
+                fallback = node
+            # 他の書籍へのリンクを含む祖先は一覧全体なのでそれ以上たどらない
+            if any(other.get('href') != href for other in node.select(self.BOOK_LINK_SELECTOR)):
+                break
+            if self._is_card(node):
+                card = node
+            node = node.parent
+        
+        if card is not None:
+            return card
+        return fallback if fallback is not None else link.parent
+    
+    def _is_card(self, node: Tag) -> bool:
+        """カード要素か判定（article、またはカードのクラスを持つ div/li）"""
+        if node.name not in self.CONTAINER_TAGS:
+            return False
+        if node.name == 'article':
+            return True
+        classes = ' '.join(node.get('class', ())).lower()
+        return any(part in classes for part in self.CARD_CLASS_PARTS)
     
     def _extract_book_info_from_container(self, container: Tag) -> Optional[Dict[str, str]]:
         """コンテナから書籍情報を抽出"""
@@ -343,18 +394,16 @@ class HontoScraper(RequestsScraper):
                 if len(title) > 3 and not any(word in title.lower() for word in ['見る', 'more', '詳細']):
                     return title
         
-        # Method 4: コンテナ内の最も長いテキストノード
-        all_texts = []
-        for text_node in container.find_all(string=True):
-            text = text_node.strip()
-            if len(text) > 5 and not any(word in text.lower() for word in ['見る', 'more', '詳細', 'javascript', 'function']):
-                all_texts.append(text)
+        # Method 4: コンテナ内の最も長いテキストノード（TITLE_TEXT_ENOUGH 文字を超えたら打ち切り、以降の長いテキストは見ない）
+        longest_text = ''
+        for text in self._iter_container_texts(container):
+            if len(text) > len(longest_text):
+                longest_text = text
+                if len(longest_text) > self.TITLE_TEXT_ENOUGH:
+                    break
         
-        if all_texts:
-            # 最も長いテキストを選択
-            longest_text = max(all_texts, key=len)
-            if len(longest_text) > 3:
-                return longest_text
+        if longest_text:
+            return longest_text
         
         # Method 5: alt属性から抽出
         img_element = container.select_one('img[alt]')
@@ -365,6 +414,21 @@ class HontoScraper(RequestsScraper):
         
         return None
     
+    def _iter_container_texts(self, container: Tag):
+        """
+        コンテナ内のタイトル候補テキストを文書順に返す（全テキストのリストは作らない）
+        
+        TITLE_TEXT_MIN 文字以下・TITLE_TEXT_MAX 文字以上のテキストは候補にしない
+        Method 4 は TITLE_TEXT_ENOUGH 文字を超えた最初のテキストで打ち切るため、
+        返るのはコンテナ全体の最長テキストではなく、そこまでに見つかった最長のテキストになる
+        （タイトルが TITLE_TEXT_ENOUGH 文字以下の通常のカードでは従来の最長テキストと一致）
+        """
+        for node in container.descendants:
+            if isinstance(node, NavigableString):
+                text = node.strip()
+                if self.TITLE_TEXT_MIN < len(text) < self.TITLE_TEXT_MAX and not self._TITLE_BLOCK_RE.search(text):
+                    yield text
+    
     async def _verify_url(self, url: str, expected_title: str) -> bool:
         """URL検証（簡易版）"""
         try:
@@ -379,21 +443,9 @@ class HontoScraper(RequestsScraper):
             logger.error(f"URL検証エラー: {url} - {str(e)}")
             return False
     
-    def get_site_specific_headers(self) -> Dict[str, str]:
-        """honto用ヘッダー"""
-        return {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        }
+    def get_site_specific_headers(self) -> Mapping[str, str]:
+        """honto用ヘッダー（クラス定数を共有、読み取り専用）"""
+        return self._HEADERS
 '''
     
     with open('src/scraping/honto_scraper.py', 'w', encoding='utf-8') as f:
@@ -409,11 +461,17 @@ ebookjapanの成功パターンを適用
 import asyncio
 import re
 import logging
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, ClassVar, Mapping
 from urllib.parse import quote
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from .requests_scraper import RequestsScraper, HTML_PARSER
 
-from .requests_scraper import RequestsScraper
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax未導入時は事前判定を省略
+    LexborHTMLParser = None
 
 logger = logging.getLogger(__name__)
 
@@ -425,6 +483,52 @@ class KinoppyScraper(RequestsScraper):
     BASE_URL = "https://www.kinokuniya.co.jp"
     SEARCH_URL = "https://www.kinokuniya.co.jp/f/dsg-08-EK"
     
+    # 検索戦略の並行数・開始間隔（秒）と同一サイトへの同時リクエスト数
+    PARALLEL_STRATEGIES = 3
+    STRATEGY_START_INTERVAL = 0.5  # 紀伊國屋は慎重に
+    SITE_CONCURRENCY = 3
+    
+    # 書籍リンクから祖先をたどってコンテナとみなすタグと探索階層数
+    CONTAINER_TAGS = frozenset(('article', 'div', 'li'))
+    CONTAINER_MAX_DEPTH = 3
+    
+    # 書籍カードとみなすクラス名の部分文字列（旧カードセレクタ相当）とカードの探索階層数
+    CARD_CLASS_PARTS = ('book', 'item', 'product', 'detail')
+    CARD_MAX_DEPTH = 6
+    
+    # タイトル候補テキストの長さ範囲と、探索を打ち切る十分な長さ
+    TITLE_TEXT_MIN = 5
+    TITLE_TEXT_MAX = 300
+    TITLE_TEXT_ENOUGH = 50
+    
+    # 丸数字（①〜⑤）の検出・数字化テーブルと巻数表記バリエーション
+    _CIRCLE_RE = re.compile('[①-⑤]')
+    _CIRCLE_TRANS = str.maketrans('①②③④⑤', '12345')
+    _CIRCLE_VARIANTS = {
+        circle: (str(n), f'第{n}巻', f'({n})', f' {n}')
+        for n, circle in enumerate('①②③④⑤', 1)
+    }
+    
+    # シリーズ名抽出で除去する巻数・装飾表記
+    _SERIES_STRIP_RE = re.compile(
+        r'[①-⑳]|第\\d+巻|\\d+巻|\\(\\d+\\)|[１２３４５６７８９０]+|[上中下]|前編|後編|完結編|【[^】]*】'
+    )
+    
+    # 書籍詳細ページへのリンク
+    BOOK_LINK_SELECTOR = 'a[href*="/dsg-"], a[href*="detail"]'
+    
+    # 紀伊國屋用ヘッダー（リクエストごとに辞書を生成しない）
+    _HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
+        'Referer': 'https://www.kinokuniya.co.jp/',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    })
+    
     def __init__(self, timeout: int = 10, max_retries: int = 3):
         super().__init__(timeout, max_retries, delay_between_requests=1.0)
         
@@ -472,41 +576,21 @@ class KinoppyScraper(RequestsScraper):
     
     def _create_volume_variants_kinoppy(self, title: str) -> List[str]:
         """巻数バリエーション生成"""
-        variants = []
+        circles = sorted(set(self._CIRCLE_RE.findall(title)))
+        if not circles:
+            return []
         
-        # 丸数字マッピング
-        circle_to_variants = {
-            '①': ['1', '第1巻', '(1)', ' 1'],
-            '②': ['2', '第2巻', '(2)', ' 2'],
-            '③': ['3', '第3巻', '(3)', ' 3'],
-            '④': ['4', '第4巻', '(4)', ' 4'],
-            '⑤': ['5', '第5巻', '(5)', ' 5'],
-        }
+        # 全丸数字を1パスで数字化したものを第一候補に、丸数字ごとの表記違いを追加
+        variants = [title.translate(self._CIRCLE_TRANS)]
+        for circle in circles:
+            variants.extend(title.replace(circle, replacement)
+                            for replacement in self._CIRCLE_VARIANTS[circle])
         
-        for circle, replacements in circle_to_variants.items():
-            if circle in title:
-                for replacement in replacements:
-                    variants.append(title.replace(circle, replacement))
-        
-        return variants
+        return list(dict.fromkeys(variants))
     
     def _extract_series_name(self, title: str) -> str:
-        """シリーズ名の抽出"""  
-        patterns = [
-            r'[①-⑳]',
-            r'第\\d+巻',
-            r'\\d+巻',
-            r'\\(\\d+\\)',
-            r'[１２３４５６７８９０]+',
-            r'[上中下]',
-            r'前編|後編|完結編',
-            r'【[^】]*】',
-        ]
-        
-        series_name = title
-        for pattern in patterns:
-            series_name = re.sub(pattern, '', series_name).strip()
-        
+        """シリーズ名の抽出（巻数・装飾表記を1パスで除去）"""
+        series_name = self._SERIES_STRIP_RE.sub('', title).strip()
         return series_name if series_name else title
     
     async def _search_impl(self, book_title: str, n_code: str) -> Optional[str]:
@@ -514,15 +598,27 @@ class KinoppyScraper(RequestsScraper):
         try:
             search_strategies = self._get_search_strategies(book_title, n_code)
             
-            for i, strategy in enumerate(search_strategies, 1):
-                logger.debug(f"検索戦略 {i}/{len(search_strategies)}: {strategy['description']} - '{strategy['query']}'")
-                
-                url = await self._try_search_strategy(strategy)
-                if url:
-                    return url
-                
-                if i < len(search_strategies):
-                    await asyncio.sleep(0.5)  # 紀伊國屋は慎重に
+            # PARALLEL_STRATEGIES件ずつ並行に試行し、最初にURLが得られた時点で残りを取り消す
+            for start in range(0, len(search_strategies), self.PARALLEL_STRATEGIES):
+                batch = search_strategies[start:start + self.PARALLEL_STRATEGIES]
+                tasks = []
+                try:
+                    for i, strategy in enumerate(batch, start + 1):
+                        logger.debug(f"検索戦略 {i}/{len(search_strategies)}: {strategy['description']} - '{strategy['query']}'")
+                        tasks.append(asyncio.create_task(self._try_search_strategy(strategy)))
+                        
+                        # 開始間隔を空ける
+                        if len(tasks) < len(batch):
+                            await asyncio.sleep(self.STRATEGY_START_INTERVAL)
+                    
+                    for future in asyncio.as_completed(tasks):
+                        url = await future
+                        if url:
+                            return url
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
             
             return None
             
@@ -533,10 +629,17 @@ class KinoppyScraper(RequestsScraper):
     async def _try_search_strategy(self, strategy: Dict[str, Any]) -> Optional[str]:
         """個別検索戦略の実行"""
         try:
-            soup = await self.make_request(self.SEARCH_URL, params=strategy['params'])
-            if not soup:
+            html = await self.make_request_text(self.SEARCH_URL, params=strategy['params'])
+            if not html:
+                return None
+            
+            # Lexborで書籍リンクの有無を先に判定（該当なしページではBeautifulSoupの木を構築しない）
+            if LexborHTMLParser is not None and LexborHTMLParser(html).css_first(self.BOOK_LINK_SELECTOR) is None:
+                logger.debug("書籍リンクが見つかりません（事前判定）")
                 return None
             
+            soup = BeautifulSoup(html, HTML_PARSER)
+            
             # 高度な検索結果抽出
             best_match = await self._advanced_find_best_match(soup, strategy['query'])
             return best_match
@@ -602,59 +705,53 @@ class KinoppyScraper(RequestsScraper):
             return None
     
     def _find_book_containers(self, soup: BeautifulSoup) -> List[Tag]:
-        """書籍コンテナ要素を発見"""
-        container_selectors = [
-            # 紀伊國屋固有のパターン
-            '.searchDetailBox',
-            '.book-item',
-            '.search-result-item',
-            'article',
-            '.item',
-            
-            # より広範囲な検索
-            'div[class*="book"]',
-            'div[class*="item"]',
-            'div[class*="product"]',
-            'div[class*="detail"]',
-            
-            # リンクを含む要素の親
-            '*:has(a[href*="/dsg-"])',
-        ]
-        
-        all_containers = []
-        
-        for selector in container_selectors:
-            try:
-                if ':has(' in selector:
-                    # :has() 疑似クラスは手動実装
-                    link_elements = soup.select('a[href*="/dsg-"]')
-                    for link in link_elements:
-                        parent = link.parent
-                        if parent and parent not in all_containers:
-                            all_containers.append(parent)
-                else:
-                    containers = soup.select(selector)
-                    all_containers.extend(containers)
-            except Exception as e:
-                logger.debug(f"セレクタエラー {selector}: {e}")
-                continue
-        
-        # 重複除去とフィルタリング
-        unique_containers = []
+        """書籍コンテナ要素を発見（書籍リンクから祖先をたどる1パス）"""
+        containers = []
         seen = set()
         
-        for container in all_containers:
-            container_id = id(container)
-            if container_id not in seen:
-                # 書籍関連のリンクを含むコンテナのみ保持
-                links = container.find_all('a', href=True)
-                book_links = [link for link in links if '/dsg-' in link.get('href', '') or 'detail' in link.get('href', '')]
-                
-                if book_links:
-                    unique_containers.append(container)
-                    seen.add(container_id)
+        for link in soup.select(self.BOOK_LINK_SELECTOR):
+            container = self._find_card(link)
+            if container is not None and id(container) not in seen:
+                seen.add(id(container))
+                containers.append(container)
         
-        return unique_containers
+        return containers
+    
+    def _find_card(self, link: Tag) -> Optional[Tag]:
+        """
+        書籍リンクを含むカード要素を探す
+        
+        他の書籍へのリンクを含まない範囲で、カードのクラスを持つ最も外側の祖先を優先する
+        見つからなければ直近の article/div/li（それもなければリンクの親要素）を使う
+        """
+        href = link.get('href')
+        card = None
+        fallback = None
+        node = link.parent
+        for depth in range(self.CARD_MAX_DEPTH):
+            if node is None or node.name == '[document]':
+                break
+            if fallback is None and depth < self.CONTAINER_MAX_DEPTH and node.name in self.CONTAINER_TAGS:
+                fallback = node
+            # 他の書籍へのリンクを含む祖先は一覧全体なのでそれ以上たどらない
+            if any(other.get('href') != href for other in node.select(self.BOOK_LINK_SELECTOR)):
+                break
+            if self._is_card(node):
+                card = node
+            node = node.parent
+        
+        if card is not None:
+            return card
+        return fallback if fallback is not None else link.parent
+    
+    def _is_card(self, node: Tag) -> bool:
+        """カード要素か判定（article、またはカードのクラスを持つ div/li）"""
+        if node.name not in self.CONTAINER_TAGS:
+            return False
+        if node.name == 'article':
+            return True
+        classes = ' '.join(node.get('class', ())).lower()
+        return any(part in classes for part in self.CARD_CLASS_PARTS)
     
     def _extract_book_info_from_container(self, container: Tag) -> Optional[Dict[str, str]]:
         """コンテナから書籍情報を抽出"""
@@ -729,21 +826,34 @@ class KinoppyScraper(RequestsScraper):
                 if len(title) > 3:
                     return title
         
-        # Method 4: コンテナ内の最も長いテキストノード
-        all_texts = []
-        for text_node in container.find_all(string=True):
-            text = text_node.strip()
-            if len(text) > 5:
-                all_texts.append(text)
+        # Method 4: コンテナ内の最も長いテキストノード（TITLE_TEXT_ENOUGH 文字を超えたら打ち切り、以降の長いテキストは見ない）
+        longest_text = ''
+        for text in self._iter_container_texts(container):
+            if len(text) > len(longest_text):
+                longest_text = text
+                if len(longest_text) > self.TITLE_TEXT_ENOUGH:
+                    break
         
-        if all_texts:
-            # 最も長いテキストを選択
-            longest_text = max(all_texts, key=len)
-            if len(longest_text) > 3:
-                return longest_text
+        if longest_text:
+            return longest_text
         
         return None
     
+    def _iter_container_texts(self, container: Tag):
+        """
+        コンテナ内のタイトル候補テキストを文書順に返す（全テキストのリストは作らない）
+        
+        TITLE_TEXT_MIN 文字以下・TITLE_TEXT_MAX 文字以上のテキストは候補にしない
+        Method 4 は TITLE_TEXT_ENOUGH 文字を超えた最初のテキストで打ち切るため、
+        返るのはコンテナ全体の最長テキストではなく、そこまでに見つかった最長のテキストになる
+        （タイトルが TITLE_TEXT_ENOUGH 文字以下の通常のカードでは従来の最長テキストと一致）
+        """
+        for node in container.descendants:
+            if isinstance(node, NavigableString):
+                text = node.strip()
+                if self.TITLE_TEXT_MIN < len(text) < self.TITLE_TEXT_MAX:
+                    yield text
+    
     async def _verify_url(self, url: str, expected_title: str) -> bool:
         """URL検証（簡易版）"""
         try:
@@ -758,18 +868,9 @@ class KinoppyScraper(RequestsScraper):
             logger.error(f"URL検証エラー: {url} - {str(e)}")
             return False
     
-    def get_site_specific_headers(self) -> Dict[str, str]:
-        """紀伊國屋用ヘッダー"""
-        return {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
-            'Referer': 'https://www.kinokuniya.co.jp/',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+    def get_site_specific_headers(self) -> Mapping[str, str]:
+        """紀伊國屋用ヘッダー（クラス定数を共有、読み取り専用）"""
+        return self._HEADERS
 '''
     
     with open('src/scraping/kinoppy_scraper.py', 'w', encoding='utf-8') as f:
@@ -785,11 +886,17 @@ ebookjapanの成功パターンを適用
 import asyncio
 import re
 import logging
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, ClassVar, Mapping
 from urllib.parse import quote
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from .requests_scraper import RequestsScraper, HTML_PARSER
 
-from .requests_scraper import RequestsScraper
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax未導入時は事前判定を省略
+    LexborHTMLParser = None
 
 logger = logging.getLogger(__name__)
 
@@ -801,6 +908,52 @@ class ReaderStoreScraper(RequestsScraper):
     BASE_URL = "https://store.sony.jp"
     SEARCH_URL = "https://store.sony.jp/search"
     
+    # 検索戦略の並行数・開始間隔（秒）と同一サイトへの同時リクエスト数
+    PARALLEL_STRATEGIES = 3
+    STRATEGY_START_INTERVAL = 0.4  # Sony配慮
+    SITE_CONCURRENCY = 3
+    
+    # 書籍リンクから祖先をたどってコンテナとみなすタグと探索階層数
+    CONTAINER_TAGS = frozenset(('article', 'div', 'li'))
+    CONTAINER_MAX_DEPTH = 3
+    
+    # 書籍カードとみなすクラス名の部分文字列（旧カードセレクタ相当）とカードの探索階層数
+    CARD_CLASS_PARTS = ('book', 'item', 'product', 'card')
+    CARD_MAX_DEPTH = 6
+    
+    # タイトル候補テキストの長さ範囲と、探索を打ち切る十分な長さ
+    TITLE_TEXT_MIN = 5
+    TITLE_TEXT_MAX = 300
+    TITLE_TEXT_ENOUGH = 50
+    
+    # 丸数字（①〜⑤）の検出・数字化テーブルと巻数表記バリエーション
+    _CIRCLE_RE = re.compile('[①-⑤]')
+    _CIRCLE_TRANS = str.maketrans('①②③④⑤', '12345')
+    _CIRCLE_VARIANTS = {
+        circle: (str(n), f'第{n}巻', f'({n})', f' {n}')
+        for n, circle in enumerate('①②③④⑤', 1)
+    }
+    
+    # シリーズ名抽出で除去する巻数・装飾表記
+    _SERIES_STRIP_RE = re.compile(
+        r'[①-⑳]|第\\d+巻|\\d+巻|\\(\\d+\\)|[１２３４５６７８９０]+|[上中下]|前編|後編|完結編|【[^】]*】'
+    )
+    
+    # 書籍詳細ページへのリンク
+    BOOK_LINK_SELECTOR = 'a[href*="/item/"]'
+    
+    # Sony Reader Store用ヘッダー（リクエストごとに辞書を生成しない）
+    _HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
+        'Referer': 'https://store.sony.jp/',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+    })
+    
     def __init__(self, timeout: int = 10, max_retries: int = 3):
         super().__init__(timeout, max_retries, delay_between_requests=1.2)
         
@@ -848,41 +1001,21 @@ class ReaderStoreScraper(RequestsScraper):
     
     def _create_volume_variants_reader_store(self, title: str) -> List[str]:
         """巻数バリエーション生成"""
-        variants = []
-        
-        # 丸数字マッピング
-        circle_to_variants = {
-            '①': ['1', '第1巻', '(1)', ' 1'],
-            '②': ['2', '第2巻', '(2)', ' 2'],
-            '③': ['3', '第3巻', '(3)', ' 3'],
-            '④': ['4', '第4巻', '(4)', ' 4'],
-            '⑤': ['5', '第5巻', '(5)', ' 5'],
-        }
+        circles = sorted(set(self._CIRCLE_RE.findall(title)))
+        if not circles:
+            return []
         
-        for circle, replacements in circle_to_variants.items():
-            if circle in title:
-                for replacement in replacements:
-                    variants.append(title.replace(circle, replacement))
+        # 全丸数字を1パスで数字化したものを第一候補に、丸数字ごとの表記違いを追加
+        variants = [title.translate(self._CIRCLE_TRANS)]
+        for circle in circles:
+            variants.extend(title.replace(circle, replacement)
+                            for replacement in self._CIRCLE_VARIANTS[circle])
         
-        return variants
+        return list(dict.fromkeys(variants))
     
     def _extract_series_name(self, title: str) -> str:
-        """シリーズ名の抽出"""  
-        patterns = [
-            r'[①-⑳]',
-            r'第\\d+巻',
-            r'\\d+巻',
-            r'\\(\\d+\\)',
-            r'[１２３４５６７８９０]+',
-            r'[上中下]',
-            r'前編|後編|完結編',
-            r'【[^】]*】',
-        ]
-        
-        series_name = title
-        for pattern in patterns:
-            series_name = re.sub(pattern, '', series_name).strip()
-        
+        """シリーズ名の抽出（巻数・装飾表記を1パスで除去）"""
+        series_name = self._SERIES_STRIP_RE.sub('', title).strip()
         return series_name if series_name else title
     
     async def _search_impl(self, book_title: str, n_code: str) -> Optional[str]:
@@ -890,15 +1023,27 @@ class ReaderStoreScraper(RequestsScraper):
         try:
             search_strategies = self._get_search_strategies(book_title, n_code)
             
-            for i, strategy in enumerate(search_strategies, 1):
-                logger.debug(f"検索戦略 {i}/{len(search_strategies)}: {strategy['description']} - '{strategy['query']}'")
-                
-                url = await self._try_search_strategy(strategy)
-                if url:
-                    return url
-                
-                if i < len(search_strategies):
-                    await asyncio.sleep(0.4)  # Sony配慮
+            # PARALLEL_STRATEGIES件ずつ並行に試行し、最初にURLが得られた時点で残りを取り消す
+            for start in range(0, len(search_strategies), self.PARALLEL_STRATEGIES):
+                batch = search_strategies[start:start + self.PARALLEL_STRATEGIES]
+                tasks = []
+                try:
+                    for i, strategy in enumerate(batch, start + 1):
+                        logger.debug(f"検索戦略 {i}/{len(search_strategies)}: {strategy['description']} - '{strategy['query']}'")
+                        tasks.append(asyncio.create_task(self._try_search_strategy(strategy)))
+                        
+                        # 開始間隔を空ける
+                        if len(tasks) < len(batch):
+                            await asyncio.sleep(self.STRATEGY_START_INTERVAL)
+                    
+                    for future in asyncio.as_completed(tasks):
+                        url = await future
+                        if url:
+                            return url
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
             
             return None
             
@@ -909,10 +1054,17 @@ class ReaderStoreScraper(RequestsScraper):
     async def _try_search_strategy(self, strategy: Dict[str, Any]) -> Optional[str]:
         """個別検索戦略の実行"""
         try:
-            soup = await self.make_request(self.SEARCH_URL, params=strategy['params'])
-            if not soup:
+            html = await self.make_request_text(self.SEARCH_URL, params=strategy['params'])
+            if not html:
                 return None
             
+            # Lexborで書籍リンクの有無を先に判定（該当なしページではBeautifulSoupの木を構築しない）
+            if LexborHTMLParser is not None and LexborHTMLParser(html).css_first(self.BOOK_LINK_SELECTOR) is None:
+                logger.debug("書籍リンクが見つかりません（事前判定）")
+                return None
+            
+            soup = BeautifulSoup(html, HTML_PARSER)
+            
             # 高度な検索結果抽出
             best_match = await self._advanced_find_best_match(soup, strategy['query'])
             return best_match
@@ -978,59 +1130,53 @@ class ReaderStoreScraper(RequestsScraper):
             return None
     
     def _find_book_containers(self, soup: BeautifulSoup) -> List[Tag]:
-        """書籍コンテナ要素を発見"""
-        container_selectors = [
-            # Sony Reader Store固有のパターン
-            '.product-item',
-            '.book-item',
-            '.search-result-item',
-            'article',
-            '.item',
-            
-            # より広範囲な検索
-            'div[class*="book"]',
-            'div[class*="item"]',
-            'div[class*="product"]',
-            'div[class*="card"]',
-            
-            # リンクを含む要素の親
-            '*:has(a[href*="/item/"])',
-        ]
-        
-        all_containers = []
-        
-        for selector in container_selectors:
-            try:
-                if ':has(' in selector:
-                    # :has() 疑似クラスは手動実装
-                    link_elements = soup.select('a[href*="/item/"]')
-                    for link in link_elements:
-                        parent = link.parent
-                        if parent and parent not in all_containers:
-                            all_containers.append(parent)
-                else:
-                    containers = soup.select(selector)
-                    all_containers.extend(containers)
-            except Exception as e:
-                logger.debug(f"セレクタエラー {selector}: {e}")
-                continue
-        
-        # 重複除去とフィルタリング
-        unique_containers = []
+        """書籍コンテナ要素を発見（書籍リンクから祖先をたどる1パス）"""
+        containers = []
         seen = set()
         
-        for container in all_containers:
-            container_id = id(container)
-            if container_id not in seen:
-                # 書籍関連のリンクを含むコンテナのみ保持
-                links = container.find_all('a', href=True)
-                book_links = [link for link in links if '/item/' in link.get('href', '')]
-                
-                if book_links:
-                    unique_containers.append(container)
-                    seen.add(container_id)
+        for link in soup.select(self.BOOK_LINK_SELECTOR):
+            container = self._find_card(link)
+            if container is not None and id(container) not in seen:
+                seen.add(id(container))
+                containers.append(container)
         
-        return unique_containers
+        return containers
+    
+    def _find_card(self, link: Tag) -> Optional[Tag]:
+        """
+        書籍リンクを含むカード要素を探す
+        
+        他の書籍へのリンクを含まない範囲で、カードのクラスを持つ最も外側の祖先を優先する
+        見つからなければ直近の article/div/li（それもなければリンクの親要素）を使う
+        """
+        href = link.get('href')
+        card = None
+        fallback = None
+        node = link.parent
+        for depth in range(self.CARD_MAX_DEPTH):
+            if node is None or node.name == '[document]':
+                break
+            if fallback is None and depth < self.CONTAINER_MAX_DEPTH and node.name in self.CONTAINER_TAGS:
+                fallback = node
+            # 他の書籍へのリンクを含む祖先は一覧全体なのでそれ以上たどらない
+            if any(other.get('href') != href for other in node.select(self.BOOK_LINK_SELECTOR)):
+                break
+            if self._is_card(node):
+                card = node
+            node = node.parent
+        
+        if card is not None:
+            return card
+        return fallback if fallback is not None else link.parent
+    
+    def _is_card(self, node: Tag) -> bool:
+        """カード要素か判定（article、またはカードのクラスを持つ div/li）"""
+        if node.name not in self.CONTAINER_TAGS:
+            return False
+        if node.name == 'article':
+            return True
+        classes = ' '.join(node.get('class', ())).lower()
+        return any(part in classes for part in self.CARD_CLASS_PARTS)
     
     def _extract_book_info_from_container(self, container: Tag) -> Optional[Dict[str, str]]:
         """コンテナから書籍情報を抽出"""
@@ -1105,21 +1251,34 @@ class ReaderStoreScraper(RequestsScraper):
                 if len(title) > 3:
                     return title
         
-        # Method 4: コンテナ内の最も長いテキストノード
-        all_texts = []
-        for text_node in container.find_all(string=True):
-            text = text_node.strip()
-            if len(text) > 5:
-                all_texts.append(text)
+        # Method 4: コンテナ内の最も長いテキストノード（TITLE_TEXT_ENOUGH 文字を超えたら打ち切り、以降の長いテキストは見ない）
+        longest_text = ''
+        for text in self._iter_container_texts(container):
+            if len(text) > len(longest_text):
+                longest_text = text
+                if len(longest_text) > self.TITLE_TEXT_ENOUGH:
+                    break
         
-        if all_texts:
-            # 最も長いテキストを選択
-            longest_text = max(all_texts, key=len)
-            if len(longest_text) > 3:
-                return longest_text
+        if longest_text:
+            return longest_text
         
         return None
     
+    def _iter_container_texts(self, container: Tag):
+        """
+        コンテナ内のタイトル候補テキストを文書順に返す（全テキストのリストは作らない）
+        
+        TITLE_TEXT_MIN 文字以下・TITLE_TEXT_MAX 文字以上のテキストは候補にしない
+        Method 4 は TITLE_TEXT_ENOUGH 文字を超えた最初のテキストで打ち切るため、
+        返るのはコンテナ全体の最長テキストではなく、そこまでに見つかった最長のテキストになる
+        （タイトルが TITLE_TEXT_ENOUGH 文字以下の通常のカードでは従来の最長テキストと一致）
+        """
+        for node in container.descendants:
+            if isinstance(node, NavigableString):
+                text = node.strip()
+                if self.TITLE_TEXT_MIN < len(text) < self.TITLE_TEXT_MAX:
+                    yield text
+    
     async def _verify_url(self, url: str, expected_title: str) -> bool:
         """URL検証（簡易版）"""
         try:
@@ -1134,18 +1293,9 @@ class ReaderStoreScraper(RequestsScraper):
             logger.error(f"URL検証エラー: {url} - {str(e)}")
             return False
     
-    def get_site_specific_headers(self) -> Dict[str, str]:
-        """Sony Reader Store用ヘッダー"""
-        return {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
-            'Referer': 'https://store.sony.jp/',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+    def get_site_specific_headers(self) -> Mapping[str, str]:
+        """Sony Reader Store用ヘッダー（クラス定数を共有、読み取り専用）"""
+        return self._HEADERS
 '''
     
     with open('src/scraping/reader_store_scraper.py', 'w', encoding='utf-8') as f:
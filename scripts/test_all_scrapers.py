@@ -21,6 +21,7 @@ from src.scraping.apple_books_scraper import AppleBooksLinkGenerator
 from src.scraping.honto_scraper import HontoScraper
 from src.scraping.kinoppy_scraper import KinoppyScraper
 from src.scraping.reader_store_scraper import ReaderStoreScraper
+from src.scraping.requests_scraper import RequestsScraper
 
 # ログ設定
 logging.basicConfig(
@@ -302,9 +303,17 @@ async def main():
     print(f"{'='*60}")
 
 
+async def run():
+    """統合テスト実行（実行ループ終了前に共有HTTPセッションを閉じる）"""
+    try:
+        await main()
+    finally:
+        await RequestsScraper.close_shared_session()
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(run())
     except KeyboardInterrupt:
         print("\\n⚠️ テストが中断されました")
     except Exception as e:
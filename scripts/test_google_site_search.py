@@ -14,6 +14,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.scraping.google_site_search_scraper import KinoppyGoogleScraper, ReaderStoreGoogleScraper
+from src.scraping.requests_scraper import RequestsScraper
 
 # ログ設定
 logging.basicConfig(
@@ -226,6 +227,9 @@ async def main():
     except Exception as e:
         logger.error(f"テストエラー: {e}")
         print(f"💥 予期しないエラー: {e}")
+    finally:
+        # 実行ループ終了前に共有HTTPセッションを閉じる
+        await RequestsScraper.close_shared_session()
 
 
 if __name__ == "__main__":
@@ -15,6 +15,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.scraping.honto_scraper import HontoScraper
+from src.scraping.requests_scraper import RequestsScraper
 
 # ログ設定
 logging.basicConfig(
@@ -229,6 +230,9 @@ async def main():
     except Exception as e:
         logger.error(f"テストエラー: {e}")
         print(f"💥 予期しないエラー: {e}")
+    finally:
+        # 実行ループ終了前に共有HTTPセッションを閉じる
+        await RequestsScraper.close_shared_session()
 
 
 if __name__ == "__main__":
@@ -16,6 +16,7 @@ sys.path.insert(0, str(project_root))
 
 from src.scraping.kinoppy_scraper import KinoppyScraper
 from src.scraping.reader_store_scraper import ReaderStoreScraper
+from src.scraping.requests_scraper import RequestsScraper
 
 # ログ設定
 logging.basicConfig(
@@ -254,6 +255,9 @@ async def main():
     except Exception as e:
         logger.error(f"テストエラー: {e}")
         print(f"💥 予期しないエラー: {e}")
+    finally:
+        # 実行ループ終了前に共有HTTPセッションを閉じる
+        await RequestsScraper.close_shared_session()
 
 
 if __name__ == "__main__":
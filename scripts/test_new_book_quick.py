@@ -17,6 +17,7 @@ sys.path.insert(0, str(project_root))
 from src.scraping.ebookjapan_scraper import EbookjapanScraper
 from src.scraping.honto_scraper import HontoScraper
 from src.scraping.apple_books_scraper import AppleBooksLinkGenerator
+from src.scraping.requests_scraper import RequestsScraper
 
 # ログ設定
 logging.basicConfig(
@@ -179,6 +180,9 @@ async def main():
     except Exception as e:
         logger.error(f"テストエラー: {e}")
         print(f"💥 予期しないエラー: {e}")
+    finally:
+        # 実行ループ終了前に共有HTTPセッションを閉じる
+        await RequestsScraper.close_shared_session()
 
 
 if __name__ == "__main__":
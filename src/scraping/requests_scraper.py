@@ -1,9 +1,9 @@
 """
 Requests + BeautifulSoup ベースのスクレイパー
-軽量・高速なスクレイピング用基底クラス
+軽量・高速なスクレイピング用基底クラス（HTTP通信は共有aiohttpセッション）
 """
 import asyncio
-import requests
+import aiohttp
 import logging
 from typing import Optional, Dict, Any, List
 from bs4 import BeautifulSoup
@@ -15,6 +15,18 @@ from .base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+try:
+    import aiodns  # noqa: F401  (非同期DNS解決)
+    _HAS_AIODNS = True
+except ImportError:  # aiodns未導入時はaiohttp既定のスレッドリゾルバを使用
+    _HAS_AIODNS = False
+
+try:
+    import lxml  # noqa: F401  (C実装パーサー)
+    HTML_PARSER = 'lxml'
+except ImportError:  # lxml未導入時は標準パーサーにフォールバック
+    HTML_PARSER = 'html.parser'
+
 
 class RequestsScraper(BaseScraper):
     """
@@ -23,6 +35,22 @@ class RequestsScraper(BaseScraper):
     軽量で高速、JavaScript不要のサイトに最適
     """
     
+    # 全スクレイパーで共有するHTTPセッション（keep-alive接続をサイト・インスタンス間で再利用）
+    # aiohttpのセッションはイベントループに紐づくため、生成時のループも保持する
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _shared_loop: Optional[asyncio.AbstractEventLoop] = None
+    # 共有セッションの利用数（async with 中のインスタンス＋実行中のリクエスト）
+    # cleanup 時に0なら閉じ、実行中のリクエストがあれば最後のリクエスト終了時に閉じる
+    _session_users = 0
+    _close_pending = False
+    CONNECTION_LIMIT = 100        # 全体の同時接続数
+    CONNECTION_LIMIT_PER_HOST = 4  # ホストごとの同時接続数
+    DNS_CACHE_TTL = 300           # DNSキャッシュ保持時間（秒）
+    
+    # サイトごとの同時リクエスト数（サブクラスで変更可、既定は1本ずつ）
+    SITE_CONCURRENCY = 1
+    _site_semaphores: Dict[str, asyncio.Semaphore] = {}
+    
     def __init__(self, 
                  timeout: int = 10,
                  max_retries: int = 3,
@@ -38,9 +66,11 @@ class RequestsScraper(BaseScraper):
         self.max_retries = max_retries
         self.delay_between_requests = delay_between_requests
         
-        # セッション設定
-        self.session = requests.Session()
-        self.session.headers.update(self.get_site_specific_headers())
+        # サイト固有ヘッダー（共有セッションへはリクエスト単位で付与）
+        self.headers = self.get_site_specific_headers()
+        
+        # 共有セッションの参照を保持しているか（__aenter__ で取得、cleanup で解放）
+        self._holds_session = False
         
         # 統計情報
         self.stats = {
@@ -54,7 +84,10 @@ class RequestsScraper(BaseScraper):
         logger.info(f"{self.SITE_NAME} RequestsScraperを初期化しました")
     
     async def __aenter__(self):
-        """コンテキストマネージャー開始"""
+        """コンテキストマネージャー開始（共有セッションの参照を取得）"""
+        if not self._holds_session:
+            self._acquire_session()
+            self._holds_session = True
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -62,11 +95,82 @@ class RequestsScraper(BaseScraper):
         await self.cleanup()
     
     async def cleanup(self):
-        """リソースのクリーンアップ"""
-        if hasattr(self, 'session'):
-            self.session.close()
+        """リソースのクリーンアップ（最後の利用者が抜けたら共有セッションを終了）"""
+        if self._holds_session:
+            self._holds_session = False
+            await self._release_session(close_when_unused=True)
         logger.info(f"{self.SITE_NAME} RequestsScraperをクリーンアップしました")
     
+    @staticmethod
+    def _acquire_session():
+        """共有セッションの参照を取得（新たな利用者がいれば保留中の終了は取り消す）"""
+        RequestsScraper._session_users += 1
+        RequestsScraper._close_pending = False
+    
+    @classmethod
+    async def _release_session(cls, close_when_unused: bool = False):
+        """共有セッションの参照を解放（終了要求があり利用数が0になったら閉じる）"""
+        RequestsScraper._session_users = max(0, RequestsScraper._session_users - 1)
+        if close_when_unused:
+            RequestsScraper._close_pending = True
+        if RequestsScraper._close_pending and RequestsScraper._session_users == 0:
+            RequestsScraper._close_pending = False
+            await cls.close_shared_session()
+    
+    @classmethod
+    async def get_session(cls) -> aiohttp.ClientSession:
+        """共有HTTPセッションを取得（初回、または実行中のイベントループが変わった場合に生成）"""
+        loop = asyncio.get_running_loop()
+        session = RequestsScraper._shared_session
+        if session is None or session.closed or RequestsScraper._shared_loop is not loop:
+            old_session = session
+            connector = aiohttp.TCPConnector(
+                limit=cls.CONNECTION_LIMIT,
+                limit_per_host=cls.CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=cls.DNS_CACHE_TTL,
+                enable_cleanup_closed=True,
+                resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            # 新しいセッションを先に登録してから旧セッションを閉じる
+            # （await 中に他のコルーチンが古いセッションを見て別のセッションを作らないように）
+            RequestsScraper._shared_session = session
+            RequestsScraper._shared_loop = loop
+            # セマフォもイベントループ単位で作り直す
+            RequestsScraper._site_semaphores.clear()
+            if old_session is not None:
+                # 別ループ（前回の asyncio.run 等）で生成したセッションは差し替え後に閉じる
+                await cls._close_session(old_session)
+        return session
+    
+    @staticmethod
+    async def _close_session(session: aiohttp.ClientSession):
+        """セッションを閉じる（終了済みループに紐づく場合はコネクタを切り離す）"""
+        if session.closed:
+            return
+        try:
+            await session.close()
+        except RuntimeError as e:
+            # 生成元ループが終了済みだとトランスポートを閉じられない（接続はループと共に破棄済み）
+            logger.debug(f"旧ループのセッションを切り離しました: {e}")
+            session.detach()
+    
+    @classmethod
+    async def close_shared_session(cls):
+        """共有HTTPセッションを終了（スクリプトの実行ループ終了時に呼び出す）"""
+        session = RequestsScraper._shared_session
+        RequestsScraper._shared_session = None
+        RequestsScraper._shared_loop = None
+        if session is not None:
+            await cls._close_session(session)
+    
+    def _site_semaphore(self) -> asyncio.Semaphore:
+        """サイト単位の同時リクエスト数制限を取得"""
+        semaphore = self._site_semaphores.get(self.SITE_NAME)
+        if semaphore is None:
+            semaphore = self._site_semaphores[self.SITE_NAME] = asyncio.Semaphore(self.SITE_CONCURRENCY)
+        return semaphore
+    
     async def search_book(self, book_title: str, n_code: str) -> Optional[str]:
         """
         書籍を検索してURLを取得
@@ -128,47 +232,76 @@ class RequestsScraper(BaseScraper):
         """
         pass
     
-    async def make_request(self, url: str, params: Optional[Dict] = None) -> Optional[BeautifulSoup]:
+    async def make_request_text(self, url: str, params: Optional[Dict] = None) -> Optional[str]:
         """
-        HTTPリクエストを実行してBeautifulSoupオブジェクトを返す
+        HTTPリクエストを実行してレスポンス本文を返す
         
         Args:
             url: リクエストURL
             params: URLパラメータ
             
         Returns:
-            BeautifulSoupオブジェクト（失敗時はNone）
+            レスポンス本文（失敗時はNone）
         """
+        # リクエスト中は共有セッションの参照を保持（他インスタンスの cleanup で閉じられないように）
+        self._acquire_session()
         try:
-            start_time = time.time()
+            session = await self.get_session()
             
-            response = self.session.get(
-                url, 
-                params=params,
-                timeout=self.timeout,
-                allow_redirects=True
-            )
-            response.raise_for_status()
+            # 同一サイトへはSITE_CONCURRENCY本まで、他サイトのリクエストとは並行実行
+            async with self._site_semaphore():
+                start_time = time.time()
+                
+                async with session.get(
+                    url,
+                    params=params,
+                    headers=self.headers,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    allow_redirects=True
+                ) as response:
+                    response.raise_for_status()
+                    text = await response.text(errors='replace')
             
             # 統計更新
             self.stats['requests_made'] += 1
             self.stats['total_response_time'] += time.time() - start_time
             
-            # BeautifulSoupでパース
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            logger.debug(f"HTTPリクエスト成功: {url} ({response.status_code})")
-            return soup
+            logger.debug(f"HTTPリクエスト成功: {url} ({response.status})")
+            return text
             
-        except requests.exceptions.Timeout:
+        except asyncio.TimeoutError:
             logger.error(f"リクエストタイムアウト: {url}")
             return None
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientError as e:
             logger.error(f"リクエストエラー: {url} - {e}")
             return None
         except Exception as e:
             logger.error(f"予期しないエラー: {url} - {e}")
             return None
+        finally:
+            await self._release_session()
+    
+    async def make_request(self, url: str, params: Optional[Dict] = None) -> Optional[BeautifulSoup]:
+        """
+        HTTPリクエストを実行してBeautifulSoupオブジェクトを返す
+        
+        Args:
+            url: リクエストURL
+            params: URLパラメータ
+            
+        Returns:
+            BeautifulSoupオブジェクト（失敗時はNone）
+        """
+        html = await self.make_request_text(url, params=params)
+        if html is None:
+            return None
+        
+        try:
+            # BeautifulSoupでパース
+            return BeautifulSoup(html, HTML_PARSER)
+        except Exception as e:
+            logger.error(f"予期しないエラー: {url} - {e}")
+            return None
     
     def get_site_specific_headers(self) -> Dict[str, str]:
         """
@@ -276,5 +409,5 @@ class RequestsScraper(BaseScraper):
             'success_rate': f"{success_rate:.1f}%",
             'avg_response_time': f"{avg_response_time:.2f}s",
             'site_name': self.SITE_NAME,
-            'scraper_type': 'Requests + BeautifulSoup'
+            'scraper_type': 'aiohttp + BeautifulSoup'
         }
\ No newline at end of file
@@ -5,6 +5,7 @@ undetected-chromedriver対応
 import asyncio
 import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import re
@@ -19,6 +20,140 @@ from .utils.title_processing import TitleProcessor
 
 logger = logging.getLogger(__name__)
 
+# 同一クエリを多数のタイトルと比較する際の再計算を避けるためのキャッシュサイズ
+TITLE_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def _normalize_title_cached(title: str) -> str:
+    """TitleProcessor.normalize_title のキャッシュ付きラッパー"""
+    return TitleProcessor.normalize_title(title)
+
+
+# キーワード抽出用の事前コンパイル済みパターン
+_ENGLISH_WORD_RE = re.compile(r'[a-zA-Z0-9]+')
+_NUMBER_RE = re.compile(r'\d+')
+_SPECIFIC_KEYWORD_RE = re.compile(r'課長|提督|魔法使い|冒険者|異世界|転生|RPG|SF|艦隊')
+
+# 重要なキーワード（助詞などは除外）
+IMPORTANT_KEYWORDS = (
+    '異世界', '転生', '魔法', '冒険', '勇者', '魔王', 'RPG', 'SF',
+    '艦隊', '提督', '課長', 'デザイン', 'パターン', '設計', '手法',
+    '入門', 'プログラミング', 'Python', 'ファンタジー', '小説', '物語'
+)
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def _extract_keywords_cached(text: str) -> frozenset:
+    """
+    テキストからキーワードを抽出（キャッシュ付き実装）
+
+    SeleniumBaseScraper._extract_keywords から呼び出される
+    """
+    if not text:
+        return frozenset()
+
+    # 英数字の単語
+    keywords = set(_ENGLISH_WORD_RE.findall(text))
+
+    # 日本語の重要キーワード
+    keywords.update(keyword for keyword in IMPORTANT_KEYWORDS if keyword in text)
+
+    # 数字も重要なキーワードとして扱う
+    keywords.update(_NUMBER_RE.findall(text))
+
+    # より具体的なパターンマッチング
+    keywords.update(_SPECIFIC_KEYWORD_RE.findall(text))
+
+    return frozenset(keywords)
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def _score_normalized_cached(query_norm: str, title_norm: str) -> float:
+    """
+    正規化済みタイトル同士の類似度スコア計算（キャッシュ付き実装）
+
+    SeleniumBaseScraper.calculate_similarity_score / score_normalized から呼び出される
+    """
+    # 完全一致
+    if query_norm == title_norm:
+        return 1.0
+
+    # 部分一致（クエリがタイトルに含まれる）
+    if query_norm in title_norm:
+        return 0.9
+
+    # 逆方向の部分一致（タイトルがクエリに含まれる）
+    if title_norm in query_norm:
+        return 0.85
+
+    # 日本語テキストの場合はキーワード抽出による類似度計算
+    # キャッシュ済みの frozenset をそのまま集合演算に使う（共有の語彙表は持たない）
+    query_keywords = _extract_keywords_cached(query_norm)
+    title_keywords = _extract_keywords_cached(title_norm)
+
+    # キーワードレベルの類似度計算
+    if query_keywords and title_keywords:
+        # 共通キーワード数
+        common_count = len(query_keywords & title_keywords)
+
+        if common_count:
+            # Jaccard係数
+            jaccard = common_count / len(query_keywords | title_keywords)
+
+            # 共通キーワード比率
+            common_ratio = common_count / min(len(query_keywords), len(title_keywords))
+
+            # 高い類似度の場合
+            if jaccard >= 0.3 or common_ratio >= 0.5:
+                return max(0.6, min(0.9, jaccard * 1.5 + common_ratio * 0.5))
+
+            # 中程度の類似度の場合
+            elif jaccard >= 0.15 or common_ratio >= 0.3:
+                return max(0.4, min(0.7, jaccard * 1.8 + common_ratio * 0.6))
+
+            # 低い類似度でも共通点がある場合
+            else:
+                return max(0.25, min(0.5, jaccard * 2.0 + common_ratio * 0.8))
+
+    # 単語レベルでの類似度計算（英語等の場合）
+    query_words = set(query_norm.split())
+    title_words = set(title_norm.split())
+
+    if query_words and title_words and len(query_words) > 1 and len(title_words) > 1:
+        # Jaccard係数（共通単語/全単語）
+        common_words = query_words.intersection(title_words)
+        total_words = query_words.union(title_words)
+        jaccard = len(common_words) / len(total_words) if total_words else 0
+
+        # 共通単語の重みを考慮した類似度
+        common_ratio = len(common_words) / min(len(query_words), len(title_words)) if min(len(query_words), len(title_words)) > 0 else 0
+
+        # 単語レベルの類似度計算（改良版）
+        if jaccard > 0.15:  # 閾値を下げる
+            word_similarity = max(jaccard * 1.2, common_ratio * 0.8)
+            return max(0.3, min(0.8, word_similarity))  # 0.3-0.8の範囲で返す
+        elif common_words:  # 何らかの共通単語がある場合
+            return max(0.25, jaccard * 1.5)  # 少しでも共通点があれば最低0.25
+
+    # 編集距離による類似度計算（改良版）
+    max_len = max(len(query_norm), len(title_norm))
+    if max_len == 0:
+        return 0.0
+
+    distance = editdistance.eval(query_norm, title_norm)
+
+    # 長い文字列の場合は編集距離の影響を軽減
+    if max_len > 20:
+        # 長い文字列では相対的な類似度を重視
+        similarity = 1 - (distance / max_len)
+        # 最低スコアを0.15に設定（完全に無関係でも少しは残る）
+        return max(0.15, similarity)
+    else:
+        # 短い文字列では編集距離をそのまま利用
+        similarity = 1 - (distance / max_len)
+        return max(0.0, similarity)
+
 
 class ScrapingError(Exception):
     """スクレイピングエラーの基底クラス"""
@@ -192,98 +327,25 @@ class SeleniumBaseScraper(ABC):
         タイトルの正規化 - 統合タイトル処理ユーティリティに委譲
         
         全角・半角統一、記号除去、スペース正規化など
+        結果はモジュールレベルのLRUキャッシュで再利用される
         """
-        return TitleProcessor.normalize_title(title)
+        return _normalize_title_cached(title)
     
-    def _extract_keywords(self, text: str) -> set:
+    def _extract_keywords(self, text: str) -> frozenset:
         """
         テキストからキーワードを抽出
         
         日本語テキストから意味のあるキーワードを抽出する
+        結果はキャッシュ共有のため不変の frozenset で返す
         """
-        if not text:
-            return set()
-        
-        # 基本的なキーワード抽出（文字ベース）
-        keywords = set()
-        
-        # 英数字の単語
-        import re
-        english_words = re.findall(r'[a-zA-Z0-9]+', text)
-        keywords.update(english_words)
-        
-        # 日本語のキーワード抽出（簡易版）
-        # 一般的な日本語のパターンを抽出
-        japanese_patterns = [
-            r'異世界',
-            r'転生',
-            r'魔法',
-            r'冒険',
-            r'勇者',
-            r'魔王',
-            r'RPG',
-            r'SF',
-            r'艦隊',
-            r'提督',
-            r'課長',
-            r'デザイン',
-            r'パターン',
-            r'設計',
-            r'手法',
-            r'入門',
-            r'プログラミング',
-            r'Python',
-            r'ファンタジー',
-            r'小説',
-            r'物語',
-            r'件',
-            r'者',
-            r'使い',
-            r'目覚め',
-            r'なって',
-            r'って',
-            r'た',
-            r'です',
-            r'の',
-            r'と',
-            r'が',
-            r'に',
-            r'を',
-            r'は',
-            r'で',
-            r'から',
-            r'まで'
-        ]
-        
-        # 重要なキーワードのみを抽出（助詞などは除外）
-        important_keywords = [
-            '異世界', '転生', '魔法', '冒険', '勇者', '魔王', 'RPG', 'SF', 
-            '艦隊', '提督', '課長', 'デザイン', 'パターン', '設計', '手法', 
-            '入門', 'プログラミング', 'Python', 'ファンタジー', '小説', '物語'
-        ]
-        
-        for keyword in important_keywords:
-            if keyword in text:
-                keywords.add(keyword)
-        
-        # 数字も重要なキーワードとして扱う
-        numbers = re.findall(r'\d+', text)
-        keywords.update(numbers)
-        
-        # 長い日本語文字列から意味のある部分を抽出（簡易版）
-        # 3文字以上の連続した日本語文字
-        japanese_segments = re.findall(r'[ぁ-んァ-ヶ一-龯]{3,10}', text)
-        
-        # より具体的なパターンマッチング
-        specific_patterns = re.findall(r'課長|提督|魔法使い|冒険者|異世界|転生|RPG|SF|艦隊', text)
-        keywords.update(specific_patterns)
-        
-        return keywords
+        return _extract_keywords_cached(text)
     
     def calculate_similarity_score(self, query: str, title: str) -> float:
         """
         類似度スコア計算（改良版）
         
+        正規化とスコア計算の各段階はモジュールレベルのLRUキャッシュで再利用される
+        
         Args:
             query: 検索クエリ
             title: 比較対象タイトル
@@ -291,88 +353,23 @@ class SeleniumBaseScraper(ABC):
         Returns:
             類似度スコア（0-1）
         """
-        # 正規化
-        query_norm = self.normalize_title(query)
-        title_norm = self.normalize_title(title)
-        
-        # 完全一致
-        if query_norm == title_norm:
-            return 1.0
-        
-        # 部分一致（クエリがタイトルに含まれる）
-        if query_norm in title_norm:
-            return 0.9
-        
-        # 逆方向の部分一致（タイトルがクエリに含まれる）
-        if title_norm in query_norm:
-            return 0.85
-        
-        # 日本語テキストの場合はキーワード抽出による類似度計算
-        query_keywords = self._extract_keywords(query_norm)
-        title_keywords = self._extract_keywords(title_norm)
-        
-        # キーワードレベルの類似度計算
-        if query_keywords and title_keywords:
-            # 共通キーワード
-            common_keywords = query_keywords.intersection(title_keywords)
-            total_keywords = query_keywords.union(title_keywords)
-            
-            if common_keywords:
-                # Jaccard係数
-                jaccard = len(common_keywords) / len(total_keywords)
-                
-                # 共通キーワード比率
-                common_ratio = len(common_keywords) / min(len(query_keywords), len(title_keywords))
-                
-                # 高い類似度の場合
-                if jaccard >= 0.3 or common_ratio >= 0.5:
-                    return max(0.6, min(0.9, jaccard * 1.5 + common_ratio * 0.5))
-                
-                # 中程度の類似度の場合
-                elif jaccard >= 0.15 or common_ratio >= 0.3:
-                    return max(0.4, min(0.7, jaccard * 1.8 + common_ratio * 0.6))
-                
-                # 低い類似度でも共通点がある場合
-                else:
-                    return max(0.25, min(0.5, jaccard * 2.0 + common_ratio * 0.8))
+        return _score_normalized_cached(_normalize_title_cached(query), _normalize_title_cached(title))
+    
+    def score_normalized(self, query_norm: str, title_norm: str) -> float:
+        """
+        正規化済みタイトル同士の類似度スコア計算
         
-        # 単語レベルでの類似度計算（英語等の場合）
-        query_words = set(query_norm.split())
-        title_words = set(title_norm.split())
+        1クエリを多数のタイトルと比較する場合、クエリの normalize_title を
+        1回だけ行い本メソッドに渡すことで正規化処理を省略できる
         
-        if query_words and title_words and len(query_words) > 1 and len(title_words) > 1:
-            # Jaccard係数（共通単語/全単語）
-            common_words = query_words.intersection(title_words)
-            total_words = query_words.union(title_words)
-            jaccard = len(common_words) / len(total_words) if total_words else 0
-            
-            # 共通単語の重みを考慮した類似度
-            common_ratio = len(common_words) / min(len(query_words), len(title_words)) if min(len(query_words), len(title_words)) > 0 else 0
+        Args:
+            query_norm: normalize_title 済みの検索クエリ
+            title_norm: normalize_title 済みの比較対象タイトル
             
-            # 単語レベルの類似度計算（改良版）
-            if jaccard > 0.15:  # 閾値を下げる
-                word_similarity = max(jaccard * 1.2, common_ratio * 0.8)
-                return max(0.3, min(0.8, word_similarity))  # 0.3-0.8の範囲で返す
-            elif common_words:  # 何らかの共通単語がある場合
-                return max(0.25, jaccard * 1.5)  # 少しでも共通点があれば最低0.25
-        
-        # 編集距離による類似度計算（改良版）
-        max_len = max(len(query_norm), len(title_norm))
-        if max_len == 0:
-            return 0.0
-        
-        distance = editdistance.eval(query_norm, title_norm)
-        
-        # 長い文字列の場合は編集距離の影響を軽減
-        if max_len > 20:
-            # 長い文字列では相対的な類似度を重視
-            similarity = 1 - (distance / max_len)
-            # 最低スコアを0.15に設定（完全に無関係でも少しは残る）
-            return max(0.15, similarity)
-        else:
-            # 短い文字列では編集距離をそのまま利用
-            similarity = 1 - (distance / max_len)
-            return max(0.0, similarity)
+        Returns:
+            類似度スコア（0-1）
+        """
+        return _score_normalized_cached(query_norm, title_norm)
     
     def is_title_match(self, expected: str, actual: str, threshold: float = 0.85) -> bool:
         """
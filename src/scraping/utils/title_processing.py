@@ -14,6 +14,10 @@ from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# 正規化で除去する括弧類（str.translate 用）と空白圧縮パターン
+_BRACKET_TABLE = str.maketrans('', '', '【】[]（）()「」『』《》〈〉')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class TitleProcessor:
     """
@@ -44,10 +48,10 @@ class TitleProcessor:
         title = unicodedata.normalize('NFKC', title)
         
         # 記号の除去
-        title = re.sub(r'[【】\[\]（）\(\)「」『』《》〈〉]', '', title)
+        title = title.translate(_BRACKET_TABLE)
         
         # 連続するスペースを単一スペースに
-        title = re.sub(r'\s+', ' ', title)
+        title = _WHITESPACE_RE.sub(' ', title)
         
         # 前後の空白を除去
         title = title.strip()
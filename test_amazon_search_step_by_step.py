@@ -86,9 +86,7 @@ async def test_amazon_search_step_by_step():
             
             await found_search.click()
             await asyncio.sleep(0.5)
-            await found_search.fill("")
-            await asyncio.sleep(0.5)
-            await found_search.type(query, delay=100)
+            await found_search.fill(query)
             await asyncio.sleep(1)
             
             # 入力確認
@@ -0,0 +1,214 @@
+"""
+Test suite for scraper templates in scripts/create_remaining_scrapers.py
+
+Generates the honto / Kinoppy / Reader Store scrapers into a temporary
+package next to copies of their base modules and checks book container detection and
+title extraction against fixture HTML.
+"""
+import unittest
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+import create_remaining_scrapers
+
+# Generated modules are imported from this package name to avoid clashing with src/scraping
+TEMPLATE_PACKAGE = "scraping_templates"
+
+# Search result list: each card wraps the book link in a thin div
+HONTO_RESULTS_HTML = """
+<div class="search-results">
+  <div class="book-item">
+    <div class="thumb"><a href="/ebook/pd_001.html"><img src="1.jpg" alt="表紙"></a></div>
+    <div class="info">
+      <h3 class="title"><a href="/ebook/pd_001.html">転生したら魔法使いになった件 1</a></h3>
+      <p class="author">山田太郎</p>
+      <p class="price">660円</p>
+    </div>
+  </div>
+  <div class="book-item">
+    <div class="thumb"><a href="/ebook/pd_002.html"><img src="2.jpg" alt="表紙"></a></div>
+    <div class="info">
+      <h3 class="title"><a href="/ebook/pd_002.html">転生したら魔法使いになった件 2</a></h3>
+      <p class="author">山田太郎</p>
+      <p class="price">660円</p>
+    </div>
+  </div>
+</div>
+"""
+
+# Cards without any card class: fall back to the nearest div
+PLAIN_RESULTS_HTML = """
+<div class="results">
+  <div><a href="/ebook/pd_010.html">ソードアート・オンライン 1</a><span>川原礫</span></div>
+  <div><a href="/ebook/pd_011.html">ソードアート・オンライン 2</a><span>川原礫</span></div>
+</div>
+"""
+
+# Kinoppy card (searchDetailBox) with the link nested in a wrapper div
+KINOPPY_RESULTS_HTML = """
+<ul>
+  <li><div class="searchDetailBox">
+    <div class="image"><a href="/f/dsg-08-EK-0000001"><img src="1.jpg"></a></div>
+    <div class="text"><a href="/f/dsg-08-EK-0000001">課長が目覚めたら異世界SF艦隊の提督になってた件です 1</a>
+      <span class="author">著者A</span></div>
+  </div></li>
+  <li><div class="searchDetailBox">
+    <div class="image"><a href="/f/dsg-08-EK-0000002"><img src="2.jpg"></a></div>
+    <div class="text"><a href="/f/dsg-08-EK-0000002">課長が目覚めたら異世界SF艦隊の提督になってた件です 2</a>
+      <span class="author">著者A</span></div>
+  </div></li>
+</ul>
+"""
+
+# Card without a title element: the title comes from the longest text (Method 4)
+TEXT_ONLY_CARD_HTML = """
+<li class="book-item">
+  <a href="/ebook/pd_100.html"><img src="100.jpg"></a>
+  <p>転生したら魔法使いになった件 3</p>
+  <p>山田太郎 著</p>
+  <p>価格 660円（税込）</p>
+  <a href="/ebook/pd_100.html">詳細を見る</a>
+</li>
+"""
+
+
+def _baseline_longest_text(container) -> str:
+    """Method 4 as it was before the generator rewrite (longest text in the container)."""
+    texts = [
+        text_node.strip() for text_node in container.find_all(string=True)
+        if len(text_node.strip()) > 5
+        and not any(word in text_node.strip().lower()
+                    for word in ['見る', 'more', '詳細', 'javascript', 'function'])
+    ]
+    return max(texts, key=len) if texts else ''
+
+
+# Modules the generated scrapers depend on (copied into the temporary package)
+TEMPLATE_DEPENDENCIES = (
+    "requests_scraper.py",
+    "base_scraper.py",
+    "utils/title_processing.py",
+)
+
+
+def _generate_templates(target: Path):
+    """Copy the scraper base modules to target and write the generated scrapers next to them."""
+    package_dir = target / "src" / "scraping"
+    (package_dir / "utils").mkdir(parents=True)
+    (package_dir / "__init__.py").touch()
+    (package_dir / "utils" / "__init__.py").touch()
+    for name in TEMPLATE_DEPENDENCIES:
+        shutil.copy(PROJECT_ROOT / "src" / "scraping" / name, package_dir / name)
+
+    cwd = os.getcwd()
+    os.chdir(target)
+    try:
+        create_remaining_scrapers.create_honto_scraper()
+        create_remaining_scrapers.create_kinoppy_scraper()
+        create_remaining_scrapers.create_reader_store_scraper()
+    finally:
+        os.chdir(cwd)
+    package_dir.rename(target / TEMPLATE_PACKAGE)
+
+
+class TestScraperTemplates(unittest.TestCase):
+    """Test book container detection and title extraction in the generated scrapers."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Generate the scrapers into a temporary package."""
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        _generate_templates(Path(cls._tmpdir.name))
+        sys.path.insert(0, cls._tmpdir.name)
+        cls.honto = importlib.import_module(f"{TEMPLATE_PACKAGE}.honto_scraper").HontoScraper()
+        cls.kinoppy = importlib.import_module(f"{TEMPLATE_PACKAGE}.kinoppy_scraper").KinoppyScraper()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary package."""
+        sys.path.remove(cls._tmpdir.name)
+        for name in [name for name in sys.modules if name.startswith(TEMPLATE_PACKAGE)]:
+            del sys.modules[name]
+        cls._tmpdir.cleanup()
+
+    def test_containers_are_whole_cards(self):
+        """Test each book link maps to its whole card, not the thin link wrapper."""
+        soup = BeautifulSoup(HONTO_RESULTS_HTML, "html.parser")
+
+        containers = self.honto._find_book_containers(soup)
+
+        self.assertEqual(len(containers), 2)
+        for container in containers:
+            self.assertIn("book-item", container.get("class"))
+
+    def test_author_extracted_from_card(self):
+        """Test author and title are found when the link sits in a thin wrapper div."""
+        soup = BeautifulSoup(HONTO_RESULTS_HTML, "html.parser")
+
+        infos = [
+            self.honto._extract_book_info_from_container(container)
+            for container in self.honto._find_book_containers(soup)
+        ]
+
+        self.assertEqual(
+            [(info["title"], info["author"]) for info in infos],
+            [("転生したら魔法使いになった件 1", "山田太郎"),
+             ("転生したら魔法使いになった件 2", "山田太郎")]
+        )
+
+    def test_nearest_div_fallback_without_card_class(self):
+        """Test cards without a card class fall back to the nearest div."""
+        soup = BeautifulSoup(PLAIN_RESULTS_HTML, "html.parser")
+
+        containers = self.honto._find_book_containers(soup)
+
+        self.assertEqual(len(containers), 2)
+        for container in containers:
+            self.assertEqual(container.name, "div")
+            self.assertEqual(len(container.select("a")), 1)
+
+    def test_card_does_not_span_other_books(self):
+        """Test the list wrapper is never chosen as a card."""
+        soup = BeautifulSoup(KINOPPY_RESULTS_HTML, "html.parser")
+
+        containers = self.kinoppy._find_book_containers(soup)
+
+        self.assertEqual(len(containers), 2)
+        for container in containers:
+            self.assertIn("searchDetailBox", container.get("class"))
+            self.assertIsNotNone(container.select_one(".author"))
+
+    def test_title_generator_matches_longest_text(self):
+        """Test a typical card still yields the longest text as its title."""
+        container = BeautifulSoup(TEXT_ONLY_CARD_HTML, "html.parser").li
+
+        title = self.honto._extract_title_from_container(container, container.a)
+
+        self.assertEqual(title, "転生したら魔法使いになった件 3")
+        self.assertEqual(title, _baseline_longest_text(container))
+        self.assertEqual(max(self.honto._iter_container_texts(container), key=len), title)
+
+    def test_title_generator_stops_at_first_long_enough_text(self):
+        """Test the documented early break: first text over TITLE_TEXT_ENOUGH wins."""
+        first = "あ" * (self.honto.TITLE_TEXT_ENOUGH + 1)
+        longer = "い" * (self.honto.TITLE_TEXT_ENOUGH + 10)
+        too_long = "う" * self.honto.TITLE_TEXT_MAX
+        container = BeautifulSoup(
+            f"<div><p>{first}</p><p>{longer}</p><p>{too_long}</p></div>", "html.parser"
+        ).div
+
+        self.assertEqual(list(self.honto._iter_container_texts(container)), [first, longer])
+        self.assertEqual(self.honto._extract_title_from_container(container), first)
+
+
+if __name__ == '__main__':
+    unittest.main()
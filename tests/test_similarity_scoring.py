@@ -0,0 +1,95 @@
+"""
+Test suite for SeleniumBaseScraper similarity scoring
+
+Pins calculate_similarity_score outputs to the values produced by the
+original (pre-memoization) implementation, so that caching and keyword
+set rewrites do not change scores.
+"""
+import unittest
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from scraping import selenium_base_scraper
+from scraping.selenium_base_scraper import SeleniumBaseScraper
+
+
+class _ScoringScraper(SeleniumBaseScraper):
+    """Minimal concrete scraper for scoring tests."""
+
+    async def _search_impl(self, book_title: str, n_code: str):
+        return None
+
+    async def _verify_url(self, url: str, expected_title: str):
+        return True
+
+
+# (query, title, score) - scores recorded from the baseline implementation
+PINNED_SCORES = [
+    # exact match
+    ("ソードアート・オンライン1", "ソードアート・オンライン1", 1.0),
+    # query contained in title
+    ("ソードアート・オンライン", "ソードアート・オンライン 1 アインクラッド", 0.9),
+    # title contained in query
+    ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "課長が目覚めたら異世界SF艦隊の提督", 0.85),
+    # keyword similarity (middle band)
+    ("課長が目覚めたら異世界SF艦隊の提督になってた件です①", "異世界転生RPG物語", 0.4222222222222222),
+    # keyword similarity (high band)
+    ("魔法使いの冒険", "冒険者と魔法使い", 0.9),
+    ("デザインパターン", "パターン設計手法", 0.625),
+    ("Python プログラミング 入門 2", "Python 設計 手法 3", 0.4857142857142857),
+    ("the quick brown fox", "the lazy brown dog", 0.75),
+    # edit distance (short strings)
+    ("吾輩は猫である", "我輩は犬である", 0.7142857142857143),
+    ("ぼくらの七日間戦争", "銀河英雄伝説", 0.0),
+    # edit distance (long strings, floor 0.15)
+    ("吾輩は猫である名前はまだ無いどこで生れたかとんと見当がつかぬ",
+     "何でも薄暗いじめじめした所でニャーニャー泣いていた事だけは記憶している", 0.15),
+]
+
+
+class TestSimilarityScoring(unittest.TestCase):
+    """Test similarity scores stay identical to the baseline implementation."""
+
+    def setUp(self):
+        """Set up scraper and clear module-level caches."""
+        self.scraper = _ScoringScraper()
+        selenium_base_scraper._score_normalized_cached.cache_clear()
+        selenium_base_scraper._extract_keywords_cached.cache_clear()
+
+    def test_pinned_scores(self):
+        """Test calculate_similarity_score against pinned baseline values."""
+        for query, title, expected in PINNED_SCORES:
+            with self.subTest(query=query, title=title):
+                score = self.scraper.calculate_similarity_score(query, title)
+                self.assertAlmostEqual(score, expected, places=9)
+
+    def test_score_normalized_matches_calculate(self):
+        """Test score_normalized gives the same result as calculate_similarity_score."""
+        for query, title, expected in PINNED_SCORES:
+            with self.subTest(query=query, title=title):
+                score = self.scraper.score_normalized(
+                    self.scraper.normalize_title(query),
+                    self.scraper.normalize_title(title)
+                )
+                self.assertAlmostEqual(score, expected, places=9)
+
+    def test_scores_stable_across_threads(self):
+        """Test scoring from worker threads (asyncio.to_thread) gives pinned values."""
+        pairs = [(query, title) for query, title, _ in PINNED_SCORES] * 20
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            scores = list(executor.map(
+                lambda pair: self.scraper.calculate_similarity_score(*pair), pairs
+            ))
+
+        expected = [score for _, _, score in PINNED_SCORES] * 20
+        for score, pinned in zip(scores, expected):
+            self.assertAlmostEqual(score, pinned, places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()